@@ -1,11 +1,17 @@
 """Analytics marts exports and query helpers."""
 
+from .locations import COORDINATE_SCALE, LATITUDE, LOCATIONS_SCHEMA, LONGITUDE, locations_frame
 from .marts import FACT_TABLE_SOURCE_MAP, export_analytics_marts
 from .retrieval import HybridRetrievalQuery, hybrid_retrieve
 
 __all__ = [
+    "COORDINATE_SCALE",
     "FACT_TABLE_SOURCE_MAP",
     "HybridRetrievalQuery",
+    "LATITUDE",
+    "LOCATIONS_SCHEMA",
+    "LONGITUDE",
     "export_analytics_marts",
     "hybrid_retrieve",
+    "locations_frame",
 ]
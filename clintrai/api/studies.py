@@ -1,6 +1,6 @@
 """Functions for study-related API endpoints."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from clintrai.api.protocols import HTTPClientProtocol
 from clintrai.models.api_models import PagedStudies, Study
 
@@ -37,6 +37,10 @@ StudyMetadata = list[dict]  # Metadata returns a list of dictionaries
 SearchAreasResponse = list[SearchAreaDocument]  # Search areas returns list of documents  
 EnumsResponse = list[EnumDefinition]  # Enums returns list of enum definitions
 
+# Validate response bodies straight from bytes, skipping the intermediate dicts
+_SEARCH_AREAS_ADAPTER = TypeAdapter(SearchAreasResponse)
+_ENUMS_ADAPTER = TypeAdapter(EnumsResponse)
+
 
 async def list_studies(
     client: HTTPClientProtocol,
@@ -95,7 +99,7 @@ async def list_studies(
     })
     
     response = await client.get("studies", params=params)
-    return PagedStudies.model_validate(response.json())
+    return PagedStudies.model_validate_json(response.content)
 
 
 async def fetch_study(
@@ -121,7 +125,7 @@ async def fetch_study(
         params["fields"] = ",".join(fields)
         
     response = await client.get(f"studies/{nct_id}", params=params)
-    return Study.model_validate(response.json())
+    return Study.model_validate_json(response.content)
 
 
 async def get_study_metadata(client: HTTPClientProtocol) -> StudyMetadata:
@@ -149,8 +153,7 @@ async def search_areas(
         SearchAreasResponse containing search areas
     """
     response = await client.get("studies/search-areas")
-    json_response = response.json()
-    return [SearchAreaDocument.model_validate(doc) for doc in json_response]
+    return _SEARCH_AREAS_ADAPTER.validate_json(response.content)
 
 
 async def get_enums(client: HTTPClientProtocol) -> EnumsResponse:
@@ -163,5 +166,4 @@ async def get_enums(client: HTTPClientProtocol) -> EnumsResponse:
         EnumsResponse containing enumeration data
     """
     response = await client.get("studies/enums")
-    json_response = response.json()
-    return [EnumDefinition.model_validate(enum_def) for enum_def in json_response]
\ No newline at end of file
+    return _ENUMS_ADAPTER.validate_json(response.content)
\ No newline at end of file
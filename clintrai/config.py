@@ -67,6 +67,18 @@ class ModelSettings(BaseSettings):
         le=512,
     )
     
+    embedding_max_seq_length: int | None = Field(
+        default=128,
+        description="Token cap per text for embedding (None keeps the model default)",
+        ge=1,
+    )
+    
+    embedding_multi_gpu_min_texts: int = Field(
+        default=50000,
+        description="Minimum number of texts before encoding is spread across all GPUs",
+        ge=1,
+    )
+    
     # spaCy model configuration
     spacy_model: str = Field(
         default="en_core_web_sm",
@@ -305,6 +317,12 @@ class MetaflowSettings(BaseSettings):
         ge=1024,
     )
     
+    embedding_step_gpus: int = Field(
+        default=1,
+        description="GPUs requested for the embedding step when GPU is enabled (2+ allows multi-GPU encoding)",
+        ge=1,
+    )
+    
     # Retry configuration
     max_retry_attempts: int = Field(
         default=2,
@@ -33,6 +33,7 @@ from clintrai.metaflow.nlp_processing import (
     get_stopwords,
     load_spacy_model,
     process_shard,
+    summarize_nlp_features,
 )
 from clintrai.models.types import DeduplicationStrategy
 
@@ -218,7 +219,8 @@ class ClinicalTrialsFlow(FlowSpec):
             shard["path"],
             text_columns,
             nlp_model,
-            stop_words
+            stop_words,
+            batch_size=settings.models.spacy_batch_size,
         )
         
         # Conditionally save processed shard for debugging
@@ -242,6 +244,9 @@ class ClinicalTrialsFlow(FlowSpec):
                 "output_path": None,  # No file saved
             }
         
+        # Partial sums let the join step aggregate without rescanning
+        self.nlp_stats["partials"] = summarize_nlp_features(self.nlp_df)
+        
         logger.info(f"Shard {shard['shard_id']} NLP processing complete")
         self.next(self.combine_nlp_results)
     
@@ -254,6 +259,7 @@ class ClinicalTrialsFlow(FlowSpec):
         """Combine NLP results from all shards."""
         # Collect all processed shards and check for errors
         nlp_dfs = []
+        shard_summaries = []
         failed_shards = []
         
         for input_data in inputs:
@@ -266,6 +272,7 @@ class ClinicalTrialsFlow(FlowSpec):
                 logger.warning(f"Shard processing failed: {input_data.nlp_error}")
             elif hasattr(input_data, "nlp_df"):
                 nlp_dfs.append(input_data.nlp_df)
+                shard_summaries.append(input_data.nlp_stats["partials"])
         
         # Report failed shards
         if failed_shards:
@@ -276,7 +283,8 @@ class ClinicalTrialsFlow(FlowSpec):
         
         # Combine results
         self.combined_nlp_df, self.nlp_aggregate_stats = combine_nlp_results(
-            nlp_dfs
+            nlp_dfs,
+            shard_summaries=shard_summaries,
         )
         
         # Add failure information to stats
@@ -295,7 +303,7 @@ class ClinicalTrialsFlow(FlowSpec):
     @resources(
         cpu=settings.metaflow.default_cpu * 4,
         memory=settings.metaflow.embedding_step_memory,
-        gpu=1 if settings.processing.enable_gpu else 0
+        gpu=settings.metaflow.embedding_step_gpus if settings.processing.enable_gpu else 0
     )
     @step
     def generate_embeddings(self):
@@ -309,17 +317,25 @@ class ClinicalTrialsFlow(FlowSpec):
             else settings.models.embedding_batch_size // 2
         )
         
-        self.embeddings_df, self.embedding_stats = generate_embeddings(
+        # Stream vectors straight to disk; only one batch is held in memory
+        output_path = self.output_dir_obj / "embeddings.parquet"
+        embeddings, self.embedding_stats = generate_embeddings(
             self.harmonized_df,  # Use artifact from harmonize_data step
             model_name=settings.models.embedding_model,
             text_columns=["title", "brief_summary"],
             batch_size=batch_size,
-            device=device
+            device=device,
+            max_seq_length=settings.models.embedding_max_seq_length,
+            output_path=output_path,
+            multi_gpu_min_texts=settings.models.embedding_multi_gpu_min_texts,
         )
         
-        # Optional: Save embeddings for inspection
-        output_path = self.output_dir_obj / "embeddings.parquet"
-        self.embeddings_df.write_parquet(output_path)
+        if not isinstance(embeddings, pl.LazyFrame):
+            # Generation failed before streaming; keep the file in place
+            embeddings.write_parquet(output_path)
+        # Persist the path rather than the vectors, so they are never
+        # loaded back into memory here; consumers scan the file
+        self.embeddings_path = str(output_path)
         self.embedding_stats["output_path"] = str(output_path)
         
         self.next(self.validate_quality)
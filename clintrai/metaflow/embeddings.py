@@ -1,19 +1,38 @@
 # clintrai/metaflow/embeddings.py
 """Embedding generation functions for clinical trials pipeline."""
 
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import torch
 from loguru import logger
 from sentence_transformers import SentenceTransformer
 import polars as pl
 
 
-def load_embedding_model(model_name, device=None):
+# Schema of an embeddings file written before any vector (and so the
+# dimension) is known
+EMPTY_EMBEDDINGS_SCHEMA = pa.schema([
+    pa.field("nct_id", pa.string()),
+    pa.field("embedding", pa.list_(pa.float32())),
+])
+
+# Batches handed to each GPU per written chunk on the multi-GPU path, so
+# the per-chunk cost of dispatching to the worker pool is amortized
+MULTI_GPU_BATCHES_PER_WRITE = 16
+
+
+def load_embedding_model(model_name, device=None, max_seq_length=None):
     """
     Load sentence transformer model.
     
     Args:
         model_name: Name of the model to load
         device: Device to use (cuda/cpu), auto-detect if None
+        max_seq_length: Optional cap on tokens per text; keeps the per-batch
+            token count (the dominant encode cost) fixed
         
     Returns:
         tuple: (model, device_used)
@@ -24,9 +43,26 @@ def load_embedding_model(model_name, device=None):
     logger.info(f"Loading embedding model {model_name} on {device}")
     model = SentenceTransformer(model_name, device=device)
     
+    if max_seq_length is not None:
+        model.max_seq_length = max_seq_length
+    
     return model, device
 
 
+def configure_torch_for_inference(device):
+    """
+    Enable backend settings that speed up inference-only workloads.
+    
+    Args:
+        device: Device the model runs on (cuda/cpu)
+    """
+    if device.startswith("cuda"):
+        # Inputs are padded to a bounded sequence length, so cuDNN can
+        # cache the fastest kernel per shape
+        torch.backends.cudnn.benchmark = True
+    torch.set_float32_matmul_precision("high")
+
+
 def prepare_texts_for_embedding(dataframe, text_columns, max_length=500):
     """
     Prepare texts from dataframe for embedding generation using vectorized operations.
@@ -39,20 +75,17 @@ def prepare_texts_for_embedding(dataframe, text_columns, max_length=500):
     Returns:
         tuple: (texts_list, nct_ids_list)
     """
-    # Vectorized text preparation
-    text_exprs = []
-    for col in text_columns:
-        if col == "brief_summary":
-            # Limit summary length
-            text_exprs.append(
-                pl.col(col).fill_null("").str.slice(0, max_length)
-            )
-        else:
-            text_exprs.append(pl.col(col).fill_null(""))
+    # Vectorized text preparation (limit summary length)
+    text_exprs = [
+        pl.col(col).str.slice(0, max_length) if col == "brief_summary" else pl.col(col)
+        for col in text_columns
+    ]
     
-    # Combine text columns and filter non-empty texts
+    # Combine text columns, skipping nulls, and drop blank or
+    # whitespace-only texts
     df_with_text = dataframe.with_columns(
-        pl.concat_str(text_exprs, separator=" ").alias("combined_text")
+        pl.concat_str(text_exprs, separator=" ", ignore_nulls=True)
+        .alias("combined_text")
     ).filter(
         pl.col("combined_text").str.strip_chars().str.len_chars() > 0
     )
@@ -64,6 +97,56 @@ def prepare_texts_for_embedding(dataframe, text_columns, max_length=500):
     return texts, nct_ids
 
 
+def start_encode_pool(model, device, num_texts, min_texts_per_pool=50000):
+    """
+    Start one encode worker per GPU when the corpus is large enough.
+    
+    Spawning workers and copying the model to each device has a fixed
+    cost, so small workloads stay on a single device.
+    
+    Args:
+        model: Loaded SentenceTransformer model
+        device: Device the model runs on (cuda/cpu)
+        num_texts: Number of texts that will be encoded
+        min_texts_per_pool: Minimum corpus size before fanning out
+        
+    Returns:
+        dict | None: SentenceTransformer process pool, or None for single-device
+    """
+    gpu_count = torch.cuda.device_count() if device.startswith("cuda") else 0
+    if gpu_count < 2 or num_texts < min_texts_per_pool:
+        return None
+    
+    logger.info(f"Encoding {num_texts} texts across {gpu_count} GPUs")
+    return model.start_multi_process_pool()
+
+
+def encode_texts(model, texts, batch_size, pool=None, show_progress_bar=False):
+    """
+    Encode texts on a single device or across a multi-process pool.
+    
+    Args:
+        model: Loaded SentenceTransformer model
+        texts: List of texts to embed
+        batch_size: Batch size per device
+        pool: Optional pool from ``start_encode_pool``
+        show_progress_bar: Show the SentenceTransformer progress bar
+        
+    Returns:
+        np.ndarray: Float32 embedding matrix
+    """
+    if pool is not None:
+        vectors = model.encode_multi_process(texts, pool, batch_size=batch_size)
+    else:
+        vectors = model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=show_progress_bar,
+            convert_to_numpy=True,
+        )
+    return np.asarray(vectors, dtype=np.float32)
+
+
 def create_embeddings_dataframe(nct_ids, embeddings):
     """
     Create a Polars DataFrame with embeddings.
@@ -81,12 +164,112 @@ def create_embeddings_dataframe(nct_ids, embeddings):
     })
 
 
+def stream_embeddings_to_parquet(
+    model,
+    texts,
+    nct_ids,
+    output_path,
+    batch_size=32,
+    compression="snappy",
+    pool=None,
+    rows_per_write=None,
+):
+    """
+    Encode texts batch by batch and append each batch to a Parquet file.
+    
+    Only one chunk of vectors is resident at a time, so peak memory is
+    ``rows_per_write * dimension * 4`` bytes instead of the whole corpus.
+    Batches go to a sibling ``.tmp`` file that replaces ``output_path`` only
+    once every batch is written, so a failed run never leaves a truncated
+    file behind. An empty ``texts`` list still produces a (zero-row) file.
+    
+    Args:
+        model: Loaded SentenceTransformer model
+        texts: List of texts to embed
+        nct_ids: List of NCT identifiers aligned with ``texts``
+        output_path: Destination Parquet file
+        batch_size: Number of texts encoded and written per batch
+        compression: Parquet compression codec
+        pool: Optional multi-GPU pool from ``start_encode_pool``
+        rows_per_write: Texts encoded per written chunk (default: batch_size)
+        
+    Returns:
+        int: Embedding dimension (0 if nothing was written)
+    """
+    if rows_per_write is None:
+        rows_per_write = batch_size
+    
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    
+    total = len(texts)
+    log_every = max(rows_per_write, total // 10)
+    next_log = log_every
+    
+    writer = None
+    dimension = 0
+    try:
+        with torch.inference_mode():
+            for start in range(0, total, rows_per_write):
+                end = min(start + rows_per_write, total)
+                vectors = encode_texts(
+                    model, texts[start:end], batch_size, pool=pool
+                )
+                
+                if writer is None:
+                    dimension = vectors.shape[1]
+                    schema = pa.schema([
+                        pa.field("nct_id", pa.string()),
+                        pa.field("embedding", pa.list_(pa.float32(), dimension)),
+                    ])
+                    writer = pq.ParquetWriter(
+                        tmp_path, schema, compression=compression
+                    )
+                
+                batch = pa.record_batch(
+                    [
+                        pa.array(nct_ids[start:end], type=pa.string()),
+                        pa.FixedSizeListArray.from_arrays(
+                            pa.array(vectors.reshape(-1)), dimension
+                        ),
+                    ],
+                    schema=schema,
+                )
+                writer.write_batch(batch)
+                
+                if end >= next_log or end == total:
+                    logger.info(f"Embedded {end:,}/{total:,} texts")
+                    next_log = end + log_every
+        
+        if writer is None:
+            pq.write_table(
+                EMPTY_EMBEDDINGS_SCHEMA.empty_table(),
+                tmp_path,
+                compression=compression,
+            )
+        else:
+            writer.close()
+            writer = None
+        tmp_path.replace(output_path)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    
+    return dimension
+
+
 def generate_embeddings(
     dataframe, 
     model_name="sentence-transformers/all-MiniLM-L6-v2",
     text_columns=None,
     batch_size=32,
-    device=None
+    device=None,
+    max_seq_length=None,
+    output_path=None,
+    multi_gpu_min_texts=50000,
 ):
     """
     Generate embeddings for clinical trial texts using vectorized operations.
@@ -97,32 +280,86 @@ def generate_embeddings(
         text_columns: Columns to use for embedding (default: title, brief_summary)
         batch_size: Batch size for processing
         device: Device to use (cuda/cpu)
+        max_seq_length: Optional cap on tokens per text (model default if None)
+        output_path: If given, embeddings are streamed batch by batch into
+            this Parquet file and a LazyFrame scanning it is returned
+        multi_gpu_min_texts: Corpus size above which encoding is spread
+            across all visible GPUs
         
     Returns:
-        tuple: (embeddings_dataframe, statistics_dict)
+        tuple: (embeddings_dataframe, statistics_dict); the frame is a
+        ``pl.LazyFrame`` when ``output_path`` is set
     """
     if text_columns is None:
         text_columns = ["title", "brief_summary"]
     
     try:
         # Load model
-        model, device_used = load_embedding_model(model_name, device)
+        model, device_used = load_embedding_model(
+            model_name, device, max_seq_length=max_seq_length
+        )
+        configure_torch_for_inference(device_used)
         
         # Prepare texts using vectorized operations
         texts, nct_ids = prepare_texts_for_embedding(dataframe, text_columns)
         
         if not texts:
             logger.warning("No texts to embed")
+            if output_path is not None:
+                # Downstream readers expect the file to exist
+                stream_embeddings_to_parquet(model, [], [], output_path)
+                return pl.scan_parquet(output_path), {
+                    "error": "No texts to embed",
+                    "total_embeddings": 0,
+                    "output_path": str(output_path),
+                }
             return create_empty_embeddings_dataframe(), {"error": "No texts to embed"}
         
-        # Generate embeddings - let SentenceTransformer handle batching
         logger.info(f"Generating embeddings for {len(texts)} texts")
-        embeddings = model.encode(
-            texts,
-            batch_size=batch_size,
-            show_progress_bar=True,
-            convert_to_tensor=False
-        ).tolist()
+        
+        pool = start_encode_pool(
+            model, device_used, len(texts), min_texts_per_pool=multi_gpu_min_texts
+        )
+        try:
+            if output_path is not None:
+                rows_per_write = batch_size
+                if pool is not None:
+                    rows_per_write *= (
+                        torch.cuda.device_count() * MULTI_GPU_BATCHES_PER_WRITE
+                    )
+                dimension = stream_embeddings_to_parquet(
+                    model,
+                    texts,
+                    nct_ids,
+                    output_path,
+                    batch_size=batch_size,
+                    pool=pool,
+                    rows_per_write=rows_per_write,
+                )
+            else:
+                # Let SentenceTransformer handle batching
+                with torch.inference_mode():
+                    embeddings = encode_texts(
+                        model, texts, batch_size, pool=pool, show_progress_bar=True
+                    ).tolist()
+        finally:
+            if pool is not None:
+                model.stop_multi_process_pool(pool)
+        
+        if output_path is not None:
+            stats = {
+                "total_embeddings": len(nct_ids),
+                "embedding_dimension": dimension,
+                "model_name": model_name,
+                "device": device_used,
+                "max_seq_length": model.max_seq_length,
+                "output_path": str(output_path),
+            }
+            logger.info(
+                f"Streamed {stats['total_embeddings']} embeddings "
+                f"with dimension {dimension} to {output_path}"
+            )
+            return pl.scan_parquet(output_path), stats
         
         # Create dataframe
         embeddings_df = create_embeddings_dataframe(nct_ids, embeddings)
@@ -133,6 +370,7 @@ def generate_embeddings(
             "embedding_dimension": len(embeddings[0]) if embeddings else 0,
             "model_name": model_name,
             "device": device_used,
+            "max_seq_length": model.max_seq_length,
         }
         
         logger.info(
@@ -159,25 +159,22 @@ def harmonize_data(
     strategy_config = get_strategy_config(strategy)
     
     # Merge dataframes
-    merged_df = csv_df.join(
-        json_df,
-        left_on=HarmonizedFieldName.NCT_ID.value,
-        right_on=JSONSourceField.JSON_NCT_ID.value,
-        how="outer_coalesce",
-    )
+    merged_df = _merge_partitions(csv_df, json_df)
     
     if len(merged_df) == 0:
         logger.warning("No data after merge, creating empty dataset")
         harmonized_df = pl.DataFrame(schema=OUTPUT_SCHEMA)
     else:
-        # Apply coalescing strategy
-        final_df = merged_df.pipe(strategy_config["coalesce_func"])
-        final_df = final_df.with_columns(
-            strategy_config["source_logic"].alias("data_source")
+        # Apply coalescing strategy and enforce schema as one lazy query, so
+        # the final select prunes unused columns and repeated expressions
+        # are computed once
+        harmonized_df = (
+            merged_df.lazy()
+            .pipe(strategy_config["coalesce_func"])
+            .with_columns(strategy_config["source_logic"].alias("data_source"))
+            .pipe(finalize_and_enforce_schema)
+            .collect()
         )
-        
-        # Enforce schema
-        harmonized_df = finalize_and_enforce_schema(final_df)
     
     stats = {
         "input_csv_records": len(csv_df),
@@ -190,6 +187,32 @@ def harmonize_data(
     return harmonized_df, stats
 
 
+def _merge_partitions(csv_df: pl.DataFrame, json_df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Combine CSV and JSON records into one row per NCT ID.
+    
+    A single full join with a coalesced key: overlapping IDs get columns
+    from both sources, single-source rows keep theirs and null-fill the
+    other side's. Keys come from the frames themselves rather than the
+    overlap analysis, so IDs whose JSON failed to load still keep their
+    CSV row.
+    
+    Args:
+        csv_df: Prepared CSV DataFrame keyed by nct_id
+        json_df: Prepared JSON DataFrame keyed by json_nct_id
+        
+    Returns:
+        DataFrame with one row per NCT ID and columns from both sources
+    """
+    return csv_df.join(
+        json_df,
+        left_on=HarmonizedFieldName.NCT_ID.value,
+        right_on=JSONSourceField.JSON_NCT_ID.value,
+        how="full",
+        coalesce=True,
+    )
+
+
 def create_shards(
     dataframe: pl.DataFrame, 
     shard_count: int, 
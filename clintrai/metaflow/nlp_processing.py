@@ -11,6 +11,30 @@ from loguru import logger
 from nltk.corpus import stopwords
 
 
+# Arrow-native feature schema so results concatenate and write to Parquet
+# without falling back to boxed Python objects
+NLP_FEATURES_DTYPE = pl.Struct([
+    pl.Field("token_count", pl.Int64),
+    pl.Field("unique_tokens", pl.Int64),
+    pl.Field("lexical_diversity", pl.Float64),
+    pl.Field("entity_count", pl.Int64),
+    pl.Field(
+        "top_words",
+        pl.List(pl.Struct([
+            pl.Field("word", pl.Utf8),
+            pl.Field("count", pl.UInt32),
+        ])),
+    ),
+    pl.Field(
+        "named_entities",
+        pl.List(pl.Struct([
+            pl.Field("text", pl.Utf8),
+            pl.Field("label", pl.Utf8),
+        ])),
+    ),
+])
+
+
 def load_spacy_model(model_name="en_core_web_sm", allow_download=False):
     """
     Load spaCy model with optional download fallback.
@@ -83,7 +107,19 @@ def extract_nlp_features(text, nlp_model, stop_words, max_text_length=1000000):
     """
     # Process with spaCy (limit text length)
     doc = nlp_model(text[:max_text_length])
+    return extract_doc_features(doc)
+
+
+def extract_doc_features(doc):
+    """
+    Extract NLP features from an already-parsed spaCy document.
     
+    Args:
+        doc: spaCy Doc
+        
+    Returns:
+        dict: Extracted NLP features
+    """
     # Extract tokens
     tokens = [
         token.text.lower() 
@@ -103,77 +139,154 @@ def extract_nlp_features(text, nlp_model, stop_words, max_text_length=1000000):
         "unique_tokens": len(set(tokens)),
         "lexical_diversity": lexical_diversity,
         "entity_count": len(entities),
-        "top_words": dict(word_freq.most_common(10)),
-        "named_entities": entities[:20],  # Limit to top 20
+        "top_words": [
+            {"word": word, "count": count}
+            for word, count in word_freq.most_common(10)
+        ],
+        "named_entities": [
+            {"text": text, "label": label}
+            for text, label in entities[:20]  # Limit to top 20
+        ],
     }
 
 
-def process_shard(shard_path, text_columns, nlp_model, stop_words):
+def empty_nlp_features():
     """
-    Process NLP for a single data shard using vectorized operations.
+    Build the feature record used for rows without any text.
+    
+    Returns:
+        dict: Zeroed NLP features
+    """
+    return {
+        "token_count": 0,
+        "unique_tokens": 0,
+        "lexical_diversity": 0.0,
+        "entity_count": 0,
+        "top_words": [],
+        "named_entities": [],
+    }
+
+
+def process_shard(
+    shard_path,
+    text_columns,
+    nlp_model,
+    stop_words,
+    batch_size=1000,
+    slice_rows=4096,
+    max_text_length=1000000,
+):
+    """
+    Process NLP for a single data shard in bounded-memory slices.
+    
+    The shard is scanned lazily and only ``nct_id`` and the combined text
+    are materialized, for the whole shard at once. Rows are then fed to
+    ``nlp_model.pipe`` one slice at a time, so only a slice's worth of spaCy
+    ``Doc`` objects and Python feature dicts is alive at any point; the
+    Arrow-typed feature frames of finished slices are kept for the result.
     
     Args:
         shard_path: Path to the shard file
         text_columns: List of text column names to process
         nlp_model: Loaded spaCy model
         stop_words: Set of stopwords
+        batch_size: Batch size passed to ``nlp_model.pipe``
+        slice_rows: Number of rows handed to spaCy per slice
+        max_text_length: Maximum text length to process
         
     Returns:
         pl.DataFrame: DataFrame with NLP features
     """
     logger.info(f"Processing shard: {shard_path}")
     
-    # Load shard data
-    df = pl.read_parquet(shard_path)
-    
-    # Combine text columns into a single column
-    text_exprs = [pl.col(c).fill_null("").cast(pl.Utf8) for c in text_columns]
-    df = df.with_columns(
-        pl.concat_str(text_exprs, separator=" ").alias("combined_text")
+    # Combine text columns into a single column while scanning
+    text_exprs = [pl.col(c).cast(pl.Utf8).fill_null("") for c in text_columns]
+    df = (
+        pl.scan_parquet(shard_path)
+        .select(
+            pl.col("nct_id"),
+            pl.concat_str(text_exprs, separator=" ").alias("combined_text"),
+        )
+        .collect(engine="streaming")
     )
     
-    # Process each text using map_elements for complex NLP operations
-    def process_text(text):
-        """Process a single text entry."""
-        if text and text.strip():
-            return extract_nlp_features(text, nlp_model, stop_words)
-        else:
-            # Return empty features without nct_id (will be added later)
-            return {
-                "token_count": 0,
-                "unique_tokens": 0,
-                "lexical_diversity": 0,
-                "entity_count": 0,
-                "top_words": {},
-                "named_entities": [],
-            }
-    
-    # Apply NLP processing to combined text
-    features_df = df.select(
-        pl.col("nct_id"),
-        pl.col("combined_text").map_elements(
-            process_text,
-            return_dtype=pl.Struct([
-                pl.Field("token_count", pl.Int64),
-                pl.Field("unique_tokens", pl.Int64),
-                pl.Field("lexical_diversity", pl.Float64),
-                pl.Field("entity_count", pl.Int64),
-                pl.Field("top_words", pl.Object),
-                pl.Field("named_entities", pl.Object),
-            ])
-        ).alias("features")
-    ).unnest("features")
+    feature_frames = []
+    for df_slice in df.iter_slices(n_rows=slice_rows):
+        texts = df_slice["combined_text"].to_list()
+        non_empty = [i for i, text in enumerate(texts) if text.strip()]
+        
+        features = [empty_nlp_features() for _ in texts]
+        docs = nlp_model.pipe(
+            (texts[i][:max_text_length] for i in non_empty),
+            batch_size=batch_size,
+        )
+        for i, doc in zip(non_empty, docs, strict=True):
+            features[i] = extract_doc_features(doc)
+        
+        feature_frames.append(
+            pl.DataFrame(
+                {
+                    "nct_id": df_slice["nct_id"],
+                    "features": pl.Series(features, dtype=NLP_FEATURES_DTYPE),
+                }
+            ).unnest("features")
+        )
+    
+    if not feature_frames:
+        return create_empty_nlp_dataframe()
     
-    return features_df
+    return pl.concat(feature_frames)
 
 
+def create_empty_nlp_dataframe():
+    """
+    Create an empty NLP features DataFrame.
+    
+    Returns:
+        pl.DataFrame: Empty DataFrame with expected schema
+    """
+    return pl.DataFrame(
+        schema={"nct_id": pl.Utf8, "features": NLP_FEATURES_DTYPE}
+    ).unnest("features")
+
 
-def combine_nlp_results(nlp_dataframes):
+def summarize_nlp_features(nlp_df):
+    """
+    Compute additive partial statistics for one shard of NLP features.
+    
+    Partials from several shards can be summed and divided once, so the
+    combined frame never needs a second aggregation pass.
+    
+    Args:
+        nlp_df: Polars DataFrame with NLP features for one shard
+        
+    Returns:
+        dict: Row count and column sums
+    """
+    if len(nlp_df) == 0:
+        return {
+            "n": 0,
+            "sum_tokens": 0,
+            "sum_lexical_diversity": 0.0,
+            "sum_entities": 0,
+        }
+    
+    sums = nlp_df.select(
+        pl.col("token_count").sum().alias("sum_tokens"),
+        pl.col("lexical_diversity").sum().alias("sum_lexical_diversity"),
+        pl.col("entity_count").sum().alias("sum_entities"),
+    ).row(0, named=True)
+    return {"n": len(nlp_df), **sums}
+
+
+def combine_nlp_results(nlp_dataframes, shard_summaries=None):
     """
     Combine NLP results from multiple shards.
     
     Args:
         nlp_dataframes: List of Polars DataFrames with NLP features
+        shard_summaries: Optional per-shard partials from
+            ``summarize_nlp_features``; computed here if not supplied
         
     Returns:
         tuple: (combined_dataframe, aggregate_statistics)
@@ -181,34 +294,31 @@ def combine_nlp_results(nlp_dataframes):
     logger.info(f"Combining {len(nlp_dataframes)} NLP result shards")
     
     if nlp_dataframes:
-        combined_df = pl.concat(nlp_dataframes)
+        # Keep shard chunks as-is; a rechunk would copy every column
+        combined_df = pl.concat(
+            nlp_dataframes, how="vertical_relaxed", rechunk=False
+        )
     else:
-        # Create empty dataframe with expected schema
-        combined_df = pl.DataFrame({
-            "nct_id": [],
-            "token_count": [],
-            "unique_tokens": [],
-            "lexical_diversity": [],
-            "entity_count": [],
-        })
-    
-    # Calculate aggregate statistics
+        combined_df = create_empty_nlp_dataframe()
+    
+    if shard_summaries is None:
+        shard_summaries = [summarize_nlp_features(df) for df in nlp_dataframes]
+    
+    # Weighted combination of shard partials
+    total = sum(summary["n"] for summary in shard_summaries)
+    sum_tokens = sum(summary["sum_tokens"] for summary in shard_summaries)
+    sum_diversity = sum(
+        summary["sum_lexical_diversity"] for summary in shard_summaries
+    )
+    sum_entities = sum(summary["sum_entities"] for summary in shard_summaries)
+    
     stats = {
-        "total_processed": len(combined_df),
-        "avg_token_count": (
-            combined_df["token_count"].mean() 
-            if len(combined_df) > 0 else 0
-        ),
-        "avg_lexical_diversity": (
-            combined_df["lexical_diversity"].mean() 
-            if len(combined_df) > 0 else 0
-        ),
-        "total_unique_entities": (
-            combined_df["entity_count"].sum() 
-            if len(combined_df) > 0 else 0
-        ),
+        "total_processed": total,
+        "avg_token_count": sum_tokens / total if total > 0 else 0,
+        "avg_lexical_diversity": sum_diversity / total if total > 0 else 0,
+        "total_unique_entities": sum_entities,
     }
     
     logger.info(f"Combined {stats['total_processed']:,} NLP-processed records")
     
-    return combined_df, stats
\ No newline at end of file
+    return combined_df, stats
@@ -1,15 +1,18 @@
 """Data models for clinical trial information"""
 
-from clintrai.models.trial import (
-    ClinicalTrial,
-    StudyInfo,
-    Intervention,
-    Outcome,
-    Sponsor,
-    Location,
-    Contact,
-    Eligibility,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from clintrai.models.trial import (
+        ClinicalTrial,
+        StudyInfo,
+        Intervention,
+        Outcome,
+        Sponsor,
+        Location,
+        Contact,
+        Eligibility,
+    )
 
 __all__ = [
     "ClinicalTrial",
@@ -20,4 +23,14 @@ __all__ = [
     "Location",
     "Contact",
     "Eligibility",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    # Load trial.py on first use so importing a sibling such as json_models
+    # does not pull in the trial, CSV and URL/UUID model graph
+    if name in __all__:
+        from clintrai.models import trial
+
+        return getattr(trial, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import re
-from datetime import date, datetime
+import sys
+from collections.abc import Iterable, Mapping
+from datetime import date
+from functools import cached_property, lru_cache
 from typing import Any, Annotated
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator, BeforeValidator, computed_field
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PrivateAttr, TypeAdapter, field_validator, model_validator, AfterValidator, BeforeValidator, computed_field
 from pydantic.alias_generators import to_snake
 
 from clintrai.models.types import (
@@ -15,40 +18,129 @@ from clintrai.models.types import (
 )
 
 
+# Date layouts seen in ClinicalTrials.gov exports, matched in one pass:
+# %Y-%m-%d, %Y-%m (two-digit month), %Y/%m/%d, %m/%d/%Y, %B %d, %Y and
+# %d-%b-%Y. Like strptime, a space in a layout matches any run of whitespace.
+_DATE_RE = re.compile(
+    r"(?P<iso_y>\d{4})-(?:(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2})|(?P<ym_m>\d{2}))"
+    r"|(?P<ymd_y>\d{4})/(?P<ymd_m>\d{1,2})/(?P<ymd_d>\d{1,2})"
+    r"|(?P<us_m>\d{1,2})/(?P<us_d>\d{1,2})/(?P<us_y>\d{4})"
+    r"|(?P<long_m>[A-Za-z]+)\s+(?P<long_d>\d{1,2}),\s+(?P<long_y>\d{4})"
+    r"|(?P<dmy_d>\d{1,2})-(?P<dmy_m>[A-Za-z]{3})-(?P<dmy_y>\d{4})",
+    re.ASCII,
+)
+
+_MONTH_NAMES = {
+    "january": 1, "february": 2, "march": 3, "april": 4, "may": 5, "june": 6,
+    "july": 7, "august": 8, "september": 9, "october": 10, "november": 11,
+    "december": 12,
+}
+_MONTH_ABBRS = {name[:3]: number for name, number in _MONTH_NAMES.items()}
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> date | None:
+    """Parse a raw date string by regex dispatch, without strptime."""
+    value = value.strip()
+
+    # Fast path for the dominant ISO layout via the C-level parser; the
+    # shape check keeps out other ISO forms it accepts (e.g. 2022-W01-1)
+    if (
+        len(value) == 10
+        and value[4] == value[7] == "-"
+        and value.isascii()
+        and value[5:7].isdigit()
+    ):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+
+    match = _DATE_RE.fullmatch(value)
+    if match is None:
+        return None
+
+    if match["iso_y"] is not None:
+        # Add day if only year-month is provided
+        year, month, day = match["iso_y"], match["iso_m"] or match["ym_m"], match["iso_d"] or 1
+    elif match["ymd_y"] is not None:
+        year, month, day = match["ymd_y"], match["ymd_m"], match["ymd_d"]
+    elif match["us_y"] is not None:
+        year, month, day = match["us_y"], match["us_m"], match["us_d"]
+    elif match["long_y"] is not None:
+        year, day = match["long_y"], match["long_d"]
+        month = _MONTH_NAMES.get(match["long_m"].lower())
+    else:
+        year, day = match["dmy_y"], match["dmy_d"]
+        month = _MONTH_ABBRS.get(match["dmy_m"].lower())
+
+    if month is None:
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        # Out-of-range components, e.g. February 30
+        return None
+
+
+# Matches never contain whitespace, so no strip is needed
+_URL_RE = re.compile(r'https?://[^\s,]+')
+
+
+@lru_cache(maxsize=16384)
+def _split_pipe(value: str) -> tuple[str, ...]:
+    """Split a pipe-separated field, dropping blank entries and interning the rest."""
+    return tuple(sys.intern(item) for part in value.split('|') if (item := part.strip()))
+
+
+def _split_pipe_list(value: str | None) -> list[str]:
+    """Split a pipe-separated field into a fresh list."""
+    if not value:
+        return []
+    # Condition/intervention strings repeat across thousands of trials
+    return list(_split_pipe(value))
+
+
+def _require_http_scheme(v: str) -> str:
+    """Cheap URL check for trusted, generated links (no full URL parse)."""
+    if not v.startswith(('http://', 'https://')):
+        raise ValueError('URL must start with http:// or https://')
+    return v
+
+
+# Plain string URL; use HttpUrl where inputs are untrusted
+HttpUrlStr = Annotated[str, AfterValidator(_require_http_scheme)]
+
+
 def parse_flexible_date(v: Any) -> date | None:
     """Try parsing a date with multiple common formats."""
-    if not isinstance(v, str) or not v.strip():
+    if not isinstance(v, str):
         return None
-    
-    # Add day if only year-month is provided
-    if len(v.strip()) == 7 and v.count('-') == 1:
-        v = f"{v.strip()}-01"
 
-    # Try multiple date formats
-    for fmt in ("%Y-%m-%d", "%B %d, %Y", "%m/%d/%Y", "%d-%b-%Y", "%Y/%m/%d"):
-        try:
-            return datetime.strptime(v.strip(), fmt).date()
-        except ValueError:
-            continue
-    
-    # If all formats fail, return None
-    return None
+    # Dates repeat heavily across records (e.g. first_posted), so cache them
+    # on the raw value; a hit then skips stripping as well as parsing
+    return _parse_date_string(v)
+
+
+# Optional date accepting any layout parse_flexible_date understands
+FlexibleDate = Annotated[date | None, BeforeValidator(parse_flexible_date)]
 
 
 class ClinicalTrialCSVRecord(BaseModel):
     """Pydantic model for clinical trial CSV data with snake_case conversion."""
     
+    # Every field carries its CSV header as an explicit alias, so no alias
+    # generator is needed. Strings are stripped by
+    # convert_empty_strings_to_none, not per field.
     model_config = ConfigDict(
-        alias_generator=to_snake,
         populate_by_name=True,
-        str_strip_whitespace=True,
-        validate_assignment=True
+        extra='ignore',
     )
     
     # Core identification - NCT Number is required, others may be missing
     nct_number: str = Field(..., alias=CSVFieldName.NCT_NUMBER, description="ClinicalTrials.gov NCT identifier")
     study_title: str | None = Field(None, alias=CSVFieldName.STUDY_TITLE, description="Primary study title")
-    study_url: HttpUrl | None = Field(None, alias=CSVFieldName.STUDY_URL, description="ClinicalTrials.gov study URL")
+    study_url: HttpUrlStr | None = Field(None, alias=CSVFieldName.STUDY_URL, description="ClinicalTrials.gov study URL")
     acronym: str | None = Field(None, alias=CSVFieldName.ACRONYM, description="Study acronym")
     
     # Status and classification - these fields are typically present but may be empty
@@ -79,12 +171,12 @@ class ClinicalTrialCSVRecord(BaseModel):
     enrollment: int | None = Field(None, alias=CSVFieldName.ENROLLMENT, description="Target/actual enrollment number")
     
     # Dates - these are often missing or incomplete
-    start_date: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, alias=CSVFieldName.START_DATE, description="Study start date")
-    primary_completion_date: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, alias=CSVFieldName.PRIMARY_COMPLETION_DATE, description="Primary completion date")
-    completion_date: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, alias=CSVFieldName.COMPLETION_DATE, description="Study completion date")
-    first_posted: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, alias=CSVFieldName.FIRST_POSTED, description="First posted date")
-    results_first_posted: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, alias=CSVFieldName.RESULTS_FIRST_POSTED, description="Results first posted date")
-    last_update_posted: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, alias=CSVFieldName.LAST_UPDATE_POSTED, description="Last update posted date")
+    start_date: FlexibleDate = Field(None, alias=CSVFieldName.START_DATE, description="Study start date")
+    primary_completion_date: FlexibleDate = Field(None, alias=CSVFieldName.PRIMARY_COMPLETION_DATE, description="Primary completion date")
+    completion_date: FlexibleDate = Field(None, alias=CSVFieldName.COMPLETION_DATE, description="Study completion date")
+    first_posted: FlexibleDate = Field(None, alias=CSVFieldName.FIRST_POSTED, description="First posted date")
+    results_first_posted: FlexibleDate = Field(None, alias=CSVFieldName.RESULTS_FIRST_POSTED, description="Results first posted date")
+    last_update_posted: FlexibleDate = Field(None, alias=CSVFieldName.LAST_UPDATE_POSTED, description="Last update posted date")
     
     # Location and documents
     locations: str | None = Field(None, alias=CSVFieldName.LOCATIONS, description="Study locations")
@@ -96,46 +188,76 @@ class ClinicalTrialCSVRecord(BaseModel):
     @classmethod
     def validate_nct_number(cls, v: str) -> str:
         """Validate NCT number format."""
-        if not v.upper().startswith('NCT'):
+        # IDs nearly always arrive uppercase; only allocate a copy otherwise
+        if not v.isupper():
+            v = v.upper()
+        if not v.startswith('NCT'):
             raise ValueError('NCT number must start with "NCT"')
-        return v.upper()
+        return v
     
     
-    @field_validator('*', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def convert_empty_strings_to_none(cls, v: Any) -> Any:
-        """Convert empty strings to None for all optional string fields."""
-        if isinstance(v, str) and v.strip() == "":
-            return None
-        return v
+    def convert_empty_strings_to_none(cls, data: Any) -> Any:
+        """Strip strings and convert blank ones to None in one pass over the row."""
+        if not isinstance(data, dict):
+            return data
+        return {
+            key: (value.strip() or None) if isinstance(value, str) else value
+            for key, value in data.items()
+        }
     
     
+    # Derived lists are computed on first access and cached on the instance;
+    # records are not reassigned after construction
     @computed_field
-    @property
+    @cached_property
     def document_urls(self) -> list[str]:
         """Extract URLs from the study_documents field."""
         if not self.study_documents:
             return []
-        
-        url_pattern = r'https?://[^\s,]+'
-        urls = re.findall(url_pattern, self.study_documents)
-        return [url.strip() for url in urls]
+        return _URL_RE.findall(self.study_documents)
     
     @computed_field
-    @property
+    @cached_property
     def conditions_list(self) -> list[str]:
         """Extract conditions as a list from pipe-separated string."""
-        if not self.conditions:
-            return []
-        return [condition.strip() for condition in self.conditions.split('|') if condition.strip()]
+        return _split_pipe_list(self.conditions)
     
     @computed_field
-    @property
+    @cached_property
     def interventions_list(self) -> list[str]:
         """Extract interventions as a list from pipe-separated string."""
-        if not self.interventions:
-            return []
-        return [intervention.strip() for intervention in self.interventions.split('|') if intervention.strip()]
+        return _split_pipe_list(self.interventions)
+
+
+class StrictClinicalTrialCSVRecord(ClinicalTrialCSVRecord):
+    """CSV record that fully parses ``study_url``, for untrusted inputs."""
+    
+    study_url: HttpUrl | None = Field(None, alias=CSVFieldName.STUDY_URL, description="ClinicalTrials.gov study URL")
+
+
+_CSV_RECORDS_ADAPTER = TypeAdapter(list[ClinicalTrialCSVRecord])
+
+
+def validate_csv_records(rows: Iterable[Mapping[str, Any]]) -> list[ClinicalTrialCSVRecord]:
+    """
+    Validate many CSV rows in a single pydantic-core call.
+    
+    Equivalent to ``[ClinicalTrialCSVRecord(**row) for row in rows]`` but
+    without re-entering Python per record. A failure raises one
+    ``ValidationError`` whose locations start with the row index.
+    """
+    return _CSV_RECORDS_ADAPTER.validate_python(list(rows))
+
+
+_RECRUITING_STATUSES = frozenset({
+    StudyStatus.RECRUITING,
+    StudyStatus.NOT_YET_RECRUITING,
+    StudyStatus.ENROLLING_BY_INVITATION,
+})
+
+_JSON_BACKED_SOURCES = frozenset({DataSource.JSON_PRIORITY, DataSource.CSV_FALLBACK})
 
 
 class HarmonizedClinicalTrial(BaseModel):
@@ -148,7 +270,7 @@ class HarmonizedClinicalTrial(BaseModel):
         alias_generator=to_snake, 
         populate_by_name=True,
         str_strip_whitespace=True,
-        validate_assignment=True
+        extra='ignore',
     )
     
     # Core identification (required fields)
@@ -192,13 +314,13 @@ class HarmonizedClinicalTrial(BaseModel):
     
     # Enrollment and dates - enrollment often missing, dates frequently incomplete
     enrollment: int | None = Field(None, description="Target or actual enrollment")
-    start_date: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, description="Study start date")
-    primary_completion_date: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, description="Primary completion date") 
-    completion_date: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, description="Study completion date")
+    start_date: FlexibleDate = Field(None, description="Study start date")
+    primary_completion_date: FlexibleDate = Field(None, description="Primary completion date") 
+    completion_date: FlexibleDate = Field(None, description="Study completion date")
     
     # Administrative dates - these should be present for posted studies
-    first_posted: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, description="First posted on ClinicalTrials.gov")
-    last_update_posted: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, description="Last update posted")
+    first_posted: FlexibleDate = Field(None, description="First posted on ClinicalTrials.gov")
+    last_update_posted: FlexibleDate = Field(None, description="Last update posted")
     
     # Documents and references - use lists since we process these
     document_urls: list[str] = Field(default_factory=list, description="URLs to study documents")
@@ -222,7 +344,7 @@ class HarmonizedClinicalTrial(BaseModel):
         """Validate NCT ID format."""
         if not v.startswith('NCT'):
             raise ValueError('NCT ID must start with "NCT"')
-        return v.upper()
+        return v if v.isupper() else v.upper()
     
     
     
@@ -236,7 +358,7 @@ class HarmonizedClinicalTrial(BaseModel):
     @property
     def has_json_data(self) -> bool:
         """Check if this record includes JSON-derived data."""
-        return self.data_source in {DataSource.JSON_PRIORITY, DataSource.CSV_FALLBACK}
+        return self.data_source in _JSON_BACKED_SOURCES
     
     @computed_field
     @property
@@ -248,16 +370,7 @@ class HarmonizedClinicalTrial(BaseModel):
     @property
     def is_recruiting(self) -> bool:
         """Check if the study is currently recruiting."""
-        if self.overall_status is None:
-            return False
-        
-        recruiting_statuses = {
-            StudyStatus.RECRUITING,
-            StudyStatus.NOT_YET_RECRUITING,
-            StudyStatus.ENROLLING_BY_INVITATION
-        }
-        
-        return self.overall_status in recruiting_statuses
+        return self.overall_status in _RECRUITING_STATUSES
 
 
 class DocumentReference(BaseModel):
@@ -265,7 +378,6 @@ class DocumentReference(BaseModel):
     
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True
     )
     
     # Required fields
@@ -275,19 +387,19 @@ class DocumentReference(BaseModel):
     # Document details - these may be missing depending on source
     document_type: DocumentType = Field(DocumentType.OTHER, description="Type of document")
     filename: str | None = Field(None, description="Document filename")
-    url: HttpUrl | None = Field(None, description="Direct URL to document")
+    url: HttpUrlStr | None = Field(None, description="Direct URL to document")
     size_bytes: int | None = Field(None, description="Document size in bytes")
-    upload_date: Annotated[date | None, BeforeValidator(parse_flexible_date)] = Field(None, description="Document upload date")
+    upload_date: FlexibleDate = Field(None, description="Document upload date")
     
+    # Computed once per reference; exports group by extension repeatedly
     @computed_field
-    @property
+    @cached_property
     def file_extension(self) -> str | None:
         """Extract file extension from filename or URL."""
         if self.filename:
-            return self.filename.split('.')[-1].lower() if '.' in self.filename else None
+            return self.filename.rpartition('.')[2].lower() if '.' in self.filename else None
         elif self.url:
-            url_str = str(self.url)
-            return url_str.split('.')[-1].split('?')[0].lower() if '.' in url_str else None
+            return self.url.rpartition('.')[2].partition('?')[0].lower() if '.' in self.url else None
         return None
     
     @computed_field
@@ -314,18 +426,28 @@ class DataHarmonizationStats(BaseModel):
     # Optional error tracking
     processing_errors: int = Field(default=0, description="Number of processing errors")
     
+    _overlap_percentage: float = PrivateAttr(default=0.0)
+    _json_coverage_percentage: float = PrivateAttr(default=0.0)
+    
+    @model_validator(mode='after')
+    def compute_percentages(self) -> DataHarmonizationStats:
+        """Compute percentages once; re-run on validated assignment."""
+        if self.csv_study_count == 0:
+            self._overlap_percentage = 0.0
+            self._json_coverage_percentage = 0.0
+        else:
+            self._overlap_percentage = (self.overlap_count / self.csv_study_count) * 100
+            self._json_coverage_percentage = (self.json_study_count / self.csv_study_count) * 100
+        return self
+    
     @computed_field
     @property
     def overlap_percentage(self) -> float:
         """Calculate overlap as percentage of CSV studies."""
-        if self.csv_study_count == 0:
-            return 0.0
-        return (self.overlap_count / self.csv_study_count) * 100
+        return self._overlap_percentage
     
     @computed_field
     @property 
     def json_coverage_percentage(self) -> float:
         """Calculate JSON coverage as percentage of CSV studies."""
-        if self.csv_study_count == 0:
-            return 0.0
-        return (self.json_study_count / self.csv_study_count) * 100
\ No newline at end of file
+        return self._json_coverage_percentage
@@ -2,92 +2,101 @@
 
 from __future__ import annotations
 
-from functools import reduce
-from typing import Any
-import operator
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Annotated, Any
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
+)
 from pydantic.alias_generators import to_camel
 
-from clintrai.models.types import StudyStatus, StudyType, StudyPhase, Sex
+from clintrai.models.types import (
+    SexValue,
+    StudyPhase,
+    StudyPhaseValue,
+    StudyStatusValue,
+    StudyTypeValue,
+)
 
 
-class DateStruct(BaseModel):
-    """Date structure used in JSON data."""
+class CamelBase(BaseModel):
+    """Base for models whose JSON keys are camelCase; accepts field names too."""
     
     model_config = ConfigDict(
         alias_generator=to_camel,
-        populate_by_name=True
+        populate_by_name=True,
+        frozen=True,
     )
+
+
+# Low-cardinality codes repeated across millions of records share one string
+# object. JSON parsing already caches short strings; this covers dict input.
+def _intern(value: str) -> str:
+    """Intern exact ``str`` values; subclasses such as str enums pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+InternedStr = Annotated[str, AfterValidator(_intern)]
+
+# Free text that may carry stray padding; everything else is kept verbatim
+StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+
+class DateStruct(CamelBase):
+    """Date structure used in JSON data."""
     
     date: str | None = None
     type: str | None = None
 
 
-class OrganizationInfo(BaseModel):
+class OrganizationInfo(CamelBase):
     """Organization information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     full_name: str | None = None
-    class_: str | None = Field(None, alias="class")  # 'class' is a Python keyword
+    class_: InternedStr | None = Field(None, alias="class")  # 'class' is a Python keyword
 
 
-class OrgStudyIdInfo(BaseModel):
+class OrgStudyIdInfo(CamelBase):
     """Organization study ID information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     id: str | None = None
 
 
-class SecondaryIdInfo(BaseModel):
+class SecondaryIdInfo(CamelBase):
     """Secondary ID information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     id: str | None = None
-    type: str | None = None
+    type: InternedStr | None = None
     link: str | None = None
 
 
-class IdentificationModule(BaseModel):
+class IdentificationModule(CamelBase):
     """Protocol section identification module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     nct_id: str
     org_study_id_info: OrgStudyIdInfo | None = None
-    secondary_id_infos: list[SecondaryIdInfo] = Field(default_factory=list)
+    secondary_id_infos: tuple[SecondaryIdInfo, ...] = ()
     organization: OrganizationInfo | None = None
-    brief_title: str | None = None
-    official_title: str | None = None
+    brief_title: StrippedStr | None = None
+    official_title: StrippedStr | None = None
     acronym: str | None = None
 
 
-class StatusModule(BaseModel):
+class StatusModule(CamelBase):
     """Protocol section status module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     status_verified_date: str | None = None
-    overall_status: StudyStatus | None = None
-    expanded_access_info: dict[str, Any] | None = None
+    overall_status: StudyStatusValue | None = None
+    expanded_access_info: Any = None  # Passed through unvalidated
     start_date_struct: DateStruct | None = None
     completion_date_struct: DateStruct | None = None
     primary_completion_date_struct: DateStruct | None = None
@@ -98,84 +107,54 @@ class StatusModule(BaseModel):
     last_update_post_date_struct: DateStruct | None = None
 
 
-class SponsorInfo(BaseModel):
+class SponsorInfo(CamelBase):
     """Sponsor information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     name: str
-    class_: str | None = Field(None, alias="class")  # 'class' is a Python keyword
+    class_: InternedStr | None = Field(None, alias="class")  # 'class' is a Python keyword
 
 
-class SponsorCollaboratorsModule(BaseModel):
+class SponsorCollaboratorsModule(CamelBase):
     """Protocol section sponsor/collaborators module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     lead_sponsor: SponsorInfo | None = None
-    collaborators: list[SponsorInfo] = Field(default_factory=list)
+    collaborators: tuple[SponsorInfo, ...] = ()
 
 
-class DescriptionModule(BaseModel):
+class DescriptionModule(CamelBase):
     """Protocol section description module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    brief_summary: str | None = None
-    detailed_description: str | None = None
+    brief_summary: StrippedStr | None = None
+    detailed_description: StrippedStr | None = None
 
 
-class ConditionsModule(BaseModel):
+class ConditionsModule(CamelBase):
     """Protocol section conditions module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    conditions: list[str] = Field(default_factory=list)
-    keywords: list[str] = Field(default_factory=list)
+    conditions: tuple[str, ...] = ()
+    keywords: tuple[str, ...] = ()
 
 
-class DesignInfo(BaseModel):
+class DesignInfo(CamelBase):
     """Design information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     allocation: str | None = None
     intervention_model: str | None = None
     primary_purpose: str | None = None
     observational_model: str | None = None
     time_perspective: str | None = None
-    masking_info: dict[str, Any] | None = None
+    masking_info: Any = None  # Passed through unvalidated
 
 
-class EnrollmentInfo(BaseModel):
+class EnrollmentInfo(CamelBase):
     """Enrollment information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     count: int | None = None
     type: str | None = None
 
 
 # Phase mapping outside the class to avoid Pydantic field issues
-PHASE_MAPPING = {
+PHASE_MAPPING = MappingProxyType({
     "PHASE1": StudyPhase.PHASE_1,
     "PHASE2": StudyPhase.PHASE_2,
     "PHASE3": StudyPhase.PHASE_3,
@@ -190,148 +169,139 @@ PHASE_MAPPING = {
     "PHASE_4": StudyPhase.PHASE_4,
     "PHASE_1_PHASE_2": StudyPhase.PHASE_1_PHASE_2,
     "PHASE_2_PHASE_3": StudyPhase.PHASE_2_PHASE_3,
-}
+})
+
+
+def _normalize_phase(phase: Any) -> str:
+    """Normalize a raw phase token to a PHASE_MAPPING key."""
+    return str(phase).upper().replace(" ", "_")
+
 
+# Raw spellings seen in the feed, resolved through the normalized mapping
+# once at import so the common case is a single dict lookup. Canonical values
+# (and StudyPhase members) map to themselves, so revalidating a dump is too.
+_RAW_PHASE_SPELLINGS = (
+    "Phase 1", "Phase 2", "Phase 3", "Phase 4",
+    "PHASE 1", "PHASE 2", "PHASE 3", "PHASE 4",
+    "Early Phase 1", "EARLY PHASE 1", "Not Applicable", "NOT APPLICABLE", "N/A",
+)
+_RAW_PHASE_MAPPING = MappingProxyType({
+    raw: phase.value
+    for raw, phase in {
+        **{raw: PHASE_MAPPING.get(_normalize_phase(raw), StudyPhase.NA) for raw in _RAW_PHASE_SPELLINGS},
+        **PHASE_MAPPING,
+    }.items()
+})
 
-class DesignModule(BaseModel):
+
+def _map_phase(phase: Any) -> StudyPhaseValue:
+    """Map a raw phase token, normalizing only when the exact spelling is unknown."""
+    if isinstance(phase, str):
+        mapped = _RAW_PHASE_MAPPING.get(phase)
+        if mapped is not None:
+            return mapped
+    return PHASE_MAPPING.get(_normalize_phase(phase), StudyPhase.NA).value
+
+
+class DesignModule(CamelBase):
     """Protocol section design module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    study_type: StudyType | None = None
-    phases: list[StudyPhase] = Field(default_factory=list)
+    study_type: StudyTypeValue | None = None
+    phases: tuple[StudyPhaseValue, ...] = ()
     design_info: DesignInfo | None = None
     enrollment_info: EnrollmentInfo | None = None
     
-    @field_validator('phases', mode='before')
+    @field_validator('phases', mode='plain')
     @classmethod
-    def validate_phases(cls, v: Any) -> list[StudyPhase]:
-        """Convert phases to a list of StudyPhase enums."""
-        if not isinstance(v, list):
-            return []
+    def validate_phases(cls, v: Any) -> tuple[StudyPhaseValue, ...]:
+        """
+        Convert raw phase tokens to StudyPhase values.
+        
+        Every token maps to a valid value, so this replaces the inner
+        tuple/Literal validation rather than re-checking each element.
+        """
+        if not v or not isinstance(v, (list, tuple)):
+            return ()
         
-        return [
-            PHASE_MAPPING.get(str(phase).upper().replace(" ", "_"), StudyPhase.NA)
-            for phase in v
-        ]
+        return tuple(_map_phase(phase) for phase in v)
 
 
-class Intervention(BaseModel):
+class Intervention(CamelBase):
     """Intervention information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    type: str | None = None
+    type: InternedStr | None = None
     name: str | None = None
     description: str | None = None
-    arm_group_labels: list[str] = Field(default_factory=list)
-    other_names: list[str] = Field(default_factory=list)
+    arm_group_labels: tuple[str, ...] = ()
+    other_names: tuple[str, ...] = ()
 
 
-class ArmsInterventionsModule(BaseModel):
+class ArmsInterventionsModule(CamelBase):
     """Protocol section arms/interventions module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    interventions: list[Intervention] = Field(default_factory=list)
+    interventions: tuple[Intervention, ...] = ()
 
 
-class EligibilityModule(BaseModel):
+class EligibilityModule(CamelBase):
     """Protocol section eligibility module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    eligibility_criteria: str | None = None
+    eligibility_criteria: StrippedStr | None = None
     healthy_volunteers: bool | None = None
-    sex: Sex | None = None
+    sex: SexValue | None = None
     minimum_age: str | None = None
     maximum_age: str | None = None
-    std_ages: list[str] = Field(default_factory=list)
+    std_ages: tuple[str, ...] = ()
 
 
-class GeoPoint(BaseModel):
+class GeoPoint(CamelBase):
     """Geographic coordinates."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     lat: float | None = None
     lon: float | None = None
 
 
-class LocationInfo(BaseModel):
+class LocationInfo(CamelBase):
     """Location information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     facility: str | None = None
     city: str | None = None
-    state: str | None = None
-    country: str | None = None
+    state: InternedStr | None = None
+    country: InternedStr | None = None
     zip: str | None = None
-    geo_point: GeoPoint | None = None
+    # Kept raw; most consumers never read coordinates, so validate on access
+    geo_point_raw: Any = Field(None, alias="geoPoint")
+    
+    @cached_property
+    def geo_point(self) -> GeoPoint | None:
+        """Site coordinates, validated on first access."""
+        if self.geo_point_raw is None:
+            return None
+        return GeoPoint.model_validate(self.geo_point_raw)
 
 
-class ContactsLocationsModule(BaseModel):
+class ContactsLocationsModule(CamelBase):
     """Protocol section contacts/locations module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    locations: list[LocationInfo] = Field(default_factory=list)
+    locations: tuple[LocationInfo, ...] = ()
 
 
-class Reference(BaseModel):
+class Reference(CamelBase):
     """Reference information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     pmid: str | None = None
-    type: str | None = None
-    citation: str | None = None
+    type: InternedStr | None = None
+    citation: StrippedStr | None = None
 
 
-class ReferencesModule(BaseModel):
+class ReferencesModule(CamelBase):
     """Protocol section references module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    references: list[Reference] = Field(default_factory=list)
+    references: tuple[Reference, ...] = ()
 
 
-class ProtocolSection(BaseModel):
+class ProtocolSection(CamelBase):
     """Main protocol section containing all protocol modules."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     identification_module: IdentificationModule | None = None
     status_module: StatusModule | None = None
     sponsor_collaborators_module: SponsorCollaboratorsModule | None = None
@@ -344,240 +314,275 @@ class ProtocolSection(BaseModel):
     references_module: ReferencesModule | None = None
 
 
-class MeshTerm(BaseModel):
+class MeshTerm(CamelBase):
     """MeSH term information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     id: str | None = None
     term: str | None = None
 
 
-class ConditionBrowseModule(BaseModel):
-    """Derived section condition browse module."""
+class _BrowseModuleBase(CamelBase):
+    """Fields shared by the condition and intervention browse modules."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    meshes: list[MeshTerm] = Field(default_factory=list)
-    ancestors: list[MeshTerm] = Field(default_factory=list)
-    browse_leaves: list[dict[str, Any]] = Field(default_factory=list)
-    browse_branches: list[dict[str, Any]] = Field(default_factory=list)
+    meshes: tuple[MeshTerm, ...] = ()
+    ancestors: tuple[MeshTerm, ...] = ()
+    # Browse trees are never read field by field; skip the per-element walk
+    browse_leaves: Any = ()
+    browse_branches: Any = ()
+
+
+class ConditionBrowseModule(_BrowseModuleBase):
+    """Derived section condition browse module."""
 
 
-class InterventionBrowseModule(BaseModel):
+class InterventionBrowseModule(_BrowseModuleBase):
     """Derived section intervention browse module."""
-    
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    meshes: list[MeshTerm] = Field(default_factory=list)
-    ancestors: list[MeshTerm] = Field(default_factory=list)
-    browse_leaves: list[dict[str, Any]] = Field(default_factory=list)
-    browse_branches: list[dict[str, Any]] = Field(default_factory=list)
 
 
-class MiscInfoModule(BaseModel):
+class MiscInfoModule(CamelBase):
     """Miscellaneous information module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     version_holder: str | None = None
 
 
-class DerivedSection(BaseModel):
+class DerivedSection(CamelBase):
     """Derived section containing computed/derived information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     misc_info_module: MiscInfoModule | None = None
     condition_browse_module: ConditionBrowseModule | None = None
     intervention_browse_module: InterventionBrowseModule | None = None
 
 
-class LargeDocument(BaseModel):
+class LargeDocument(CamelBase):
     """Large document information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     filename: str | None = None
     size: int | None = None
     version: str | None = None
 
 
-class LargeDocumentModule(BaseModel):
+class LargeDocumentModule(CamelBase):
     """Large document module."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
-    large_docs: list[LargeDocument] = Field(default_factory=list)
+    large_docs: tuple[LargeDocument, ...] = ()
 
 
-class DocumentSection(BaseModel):
+class DocumentSection(CamelBase):
     """Document section containing document information."""
     
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True
-    )
-    
     large_document_module: LargeDocumentModule | None = None
 
 
-class ClinicalTrialJSONRecord(BaseModel):
-    """Root model for ClinicalTrials.gov JSON data structure."""
-    
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True,
-        str_strip_whitespace=True,
-        validate_assignment=True
-    )
+@dataclass(slots=True, frozen=True)
+class _FlatView:
+    """Flattened scalar and list values of a JSON record, built once per record."""
+    
+    nct_id: str | None
+    official_title: str | None
+    brief_title: str | None
+    acronym: str | None
+    overall_status: StudyStatusValue | None
+    start_date: str | None
+    completion_date: str | None
+    study_type: StudyTypeValue | None
+    phases: tuple[StudyPhaseValue, ...]
+    enrollment: int | None
+    brief_summary: str | None
+    detailed_description: str | None
+    conditions: tuple[str, ...]
+    interventions: tuple[str, ...]
+    mesh_terms: tuple[str, ...]
+    document_files: tuple[str, ...]
+    sex: SexValue | None
+    minimum_age: str | None
+    maximum_age: str | None
+    healthy_volunteers: bool | None
+
+
+class ClinicalTrialJSONRecord(CamelBase):
+    """
+    Root model for ClinicalTrials.gov JSON data structure.
+    
+    Feed raw bytes (a file's ``read_bytes()`` or a response's ``content``)
+    to ``from_json_bytes`` or ``validate_records_json`` rather than decoding
+    with ``json.loads`` / ``response.json()`` first; pydantic-core parses
+    and validates in one pass without building intermediate dicts.
+    """
     
     protocol_section: ProtocolSection | None = None
     derived_section: DerivedSection | None = None
     document_section: DocumentSection | None = None
     has_results: bool = False
     
-    def _safe_get(self, path: str, default: Any = None) -> Any:
-        """Safely retrieve a nested attribute using dot notation."""
-        try:
-            return reduce(getattr, path.split('.'), self)
-        except AttributeError:
-            return default
-    
-    # Pythonic properties using safe nested access helper
+    @classmethod
+    def from_json_bytes(cls, data: bytes | str) -> ClinicalTrialJSONRecord:
+        """Parse and validate raw JSON in one pydantic-core pass, without an intermediate dict."""
+        return cls.model_validate_json(data)
+    
+    @cached_property
+    def _flat(self) -> _FlatView:
+        """Walk the nested sections once and keep the flattened values."""
+        ps = self.protocol_section
+        ident = ps and ps.identification_module
+        status = ps and ps.status_module
+        design = ps and ps.design_module
+        description = ps and ps.description_module
+        conditions = ps and ps.conditions_module
+        arms = ps and ps.arms_interventions_module
+        eligibility = ps and ps.eligibility_module
+        enrollment_info = design and design.enrollment_info
+        start_struct = status and status.start_date_struct
+        completion_struct = status and status.completion_date_struct
+        condition_browse = self.derived_section and self.derived_section.condition_browse_module
+        large_docs = self.document_section and self.document_section.large_document_module
+        
+        return _FlatView(
+            nct_id=ident.nct_id if ident else None,
+            official_title=ident.official_title if ident else None,
+            brief_title=ident.brief_title if ident else None,
+            acronym=ident.acronym if ident else None,
+            overall_status=status.overall_status if status else None,
+            start_date=start_struct.date if start_struct else None,
+            completion_date=completion_struct.date if completion_struct else None,
+            study_type=design.study_type if design else None,
+            phases=design.phases if design else (),
+            enrollment=enrollment_info.count if enrollment_info else None,
+            brief_summary=description.brief_summary if description else None,
+            detailed_description=description.detailed_description if description else None,
+            conditions=conditions.conditions if conditions else (),
+            interventions=tuple(
+                intervention.name
+                for intervention in (arms.interventions if arms else ())
+                if intervention.name
+            ),
+            mesh_terms=tuple(
+                mesh.term
+                for mesh in (condition_browse.meshes if condition_browse else ())
+                if mesh.term
+            ),
+            document_files=tuple(
+                doc.filename
+                for doc in (large_docs.large_docs if large_docs else ())
+                if doc.filename
+            ),
+            sex=eligibility.sex if eligibility else None,
+            minimum_age=eligibility.minimum_age if eligibility else None,
+            maximum_age=eligibility.maximum_age if eligibility else None,
+            healthy_volunteers=eligibility.healthy_volunteers if eligibility else None,
+        )
+    
+    # Pythonic properties backed by the cached flat view
     
     @property
     def nct_id(self) -> str | None:
         """The NCT ID from the identification module."""
-        return self._safe_get("protocol_section.identification_module.nct_id")
+        return self._flat.nct_id
     
     @property
     def official_title(self) -> str | None:
         """The official title."""
-        return self._safe_get("protocol_section.identification_module.official_title")
+        return self._flat.official_title
     
     @property
     def brief_title(self) -> str | None:
         """The brief title."""
-        return self._safe_get("protocol_section.identification_module.brief_title")
+        return self._flat.brief_title
     
     @property
-    def overall_status(self) -> StudyStatus | None:
+    def overall_status(self) -> StudyStatusValue | None:
         """The overall status."""
-        return self._safe_get("protocol_section.status_module.overall_status")
+        return self._flat.overall_status
     
     @property
-    def study_type(self) -> StudyType | None:
+    def study_type(self) -> StudyTypeValue | None:
         """The study type."""
-        return self._safe_get("protocol_section.design_module.study_type")
+        return self._flat.study_type
     
     @property
-    def conditions(self) -> list[str]:
+    def conditions(self) -> tuple[str, ...]:
         """The conditions list."""
-        return self._safe_get("protocol_section.conditions_module.conditions", [])
+        return self._flat.conditions
     
     @property
-    def interventions(self) -> list[str]:
+    def interventions(self) -> tuple[str, ...]:
         """Intervention names."""
-        interventions_list = self._safe_get("protocol_section.arms_interventions_module.interventions", [])
-        return [
-            intervention.name
-            for intervention in interventions_list
-            if intervention.name
-        ]
+        return self._flat.interventions
     
     @property
-    def mesh_terms(self) -> list[str]:
+    def mesh_terms(self) -> tuple[str, ...]:
         """Condition MeSH terms."""
-        meshes_list = self._safe_get("derived_section.condition_browse_module.meshes", [])
-        return [
-            mesh.term
-            for mesh in meshes_list
-            if mesh.term
-        ]
+        return self._flat.mesh_terms
     
     @property
-    def document_files(self) -> list[str]:
+    def document_files(self) -> tuple[str, ...]:
         """Document filenames."""
-        docs_list = self._safe_get("document_section.large_document_module.large_docs", [])
-        return [
-            doc.filename
-            for doc in docs_list
-            if doc.filename
-        ]
+        return self._flat.document_files
     
     @property
-    def sex(self) -> Sex | None:
+    def sex(self) -> SexValue | None:
         """Sex eligibility."""
-        return self._safe_get("protocol_section.eligibility_module.sex")
+        return self._flat.sex
     
     @property
     def minimum_age(self) -> str | None:
         """Minimum age."""
-        return self._safe_get("protocol_section.eligibility_module.minimum_age")
+        return self._flat.minimum_age
     
     @property
     def maximum_age(self) -> str | None:
         """Maximum age."""
-        return self._safe_get("protocol_section.eligibility_module.maximum_age")
+        return self._flat.maximum_age
     
     @property
     def healthy_volunteers(self) -> bool | None:
         """Healthy volunteers status."""
-        return self._safe_get("protocol_section.eligibility_module.healthy_volunteers")
+        return self._flat.healthy_volunteers
     
     @property
     def enrollment(self) -> int | None:
         """Enrollment count."""
-        return self._safe_get("protocol_section.design_module.enrollment_info.count")
+        return self._flat.enrollment
     
     @property
     def start_date(self) -> str | None:
         """Start date."""
-        return self._safe_get("protocol_section.status_module.start_date_struct.date")
+        return self._flat.start_date
     
     @property
     def completion_date(self) -> str | None:
         """Completion date."""
-        return self._safe_get("protocol_section.status_module.completion_date_struct.date")
+        return self._flat.completion_date
     
     @property
     def brief_summary(self) -> str | None:
         """Brief summary."""
-        return self._safe_get("protocol_section.description_module.brief_summary")
+        return self._flat.brief_summary
     
     @property
     def detailed_description(self) -> str | None:
         """Detailed description."""
-        return self._safe_get("protocol_section.description_module.detailed_description")
+        return self._flat.detailed_description
     
     @property
-    def phases(self) -> list[StudyPhase]:
+    def phases(self) -> tuple[StudyPhaseValue, ...]:
         """Study phases."""
-        return self._safe_get("protocol_section.design_module.phases", [])
+        return self._flat.phases
     
     @property
     def acronym(self) -> str | None:
         """Study acronym."""
-        return self._safe_get("protocol_section.identification_module.acronym")
\ No newline at end of file
+        return self._flat.acronym
+
+
+_JSON_RECORDS_ADAPTER = TypeAdapter(list[ClinicalTrialJSONRecord])
+
+
+def validate_records_json(data: bytes | str) -> list[ClinicalTrialJSONRecord]:
+    """
+    Parse and validate a JSON array of studies in a single pydantic-core call.
+    
+    Use for a ``studies`` page instead of validating each element in a
+    Python loop. A failure raises one ``ValidationError`` whose locations
+    start with the array index.
+    """
+    return _JSON_RECORDS_ADAPTER.validate_json(data)
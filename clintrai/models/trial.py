@@ -1,29 +1,78 @@
 """Pydantic models for clinical trial data from clinicaltrials.gov."""
 
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime
-from enum import Enum
-from typing import Any, Annotated
+from enum import Enum, IntFlag
+from functools import lru_cache
+from typing import Annotated, Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, HttpUrl, ConfigDict, PlainSerializer
-
+from pydantic import (
+    BaseModel,
+    Field,
+    HttpUrl,
+    SerializeAsAny,
+    TypeAdapter,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    computed_field,
+)
+
+from clintrai.models.csv_models import HttpUrlStr, parse_flexible_date
+from clintrai.models.json_models import ClinicalTrialJSONRecord
 from clintrai.models.types import StudyType, StudyPhase, StudyStatus, Sex
 
-# ✅ Modern Pydantic V2 reusable serializers (replaces deprecated json_encoders)
-ISODatetime = Annotated[
-    datetime,
-    PlainSerializer(lambda dt: dt.isoformat(), return_type=str)
-]
+# pydantic-core serializes these to ISO 8601 / canonical strings in JSON mode
+# natively, so no Python serializer callback runs per field on export
+ISODatetime = datetime
+ISODate = date
+StringUUID = UUID
+
+_HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+
+@lru_cache(maxsize=65536)
+def _validate_http_url(value: str) -> HttpUrl:
+    """Parse a URL once; HttpUrl is immutable, so results are shared."""
+    return _HTTP_URL_ADAPTER.validate_python(value)
+
+
+def _cached_http_url(value: Any, handler: ValidatorFunctionWrapHandler) -> HttpUrl:
+    """Reuse parses of URLs repeated across trials; invalid input gets the normal errors."""
+    if isinstance(value, str):
+        try:
+            return _validate_http_url(value)
+        except ValidationError:
+            pass
+    return handler(value)
+
+
+CachedHttpUrl = Annotated[HttpUrl, WrapValidator(_cached_http_url)]
+
+_BATCH_TIMESTAMP: ContextVar[datetime | None] = ContextVar("_BATCH_TIMESTAMP", default=None)
 
-ISODate = Annotated[
-    date,
-    PlainSerializer(lambda d: d.isoformat(), return_type=str)
-]
 
-StringUUID = Annotated[
-    UUID, 
-    PlainSerializer(lambda u: str(u), return_type=str)
-]
+def _downloaded_at() -> datetime:
+    """Default for ``data_downloaded_at``: the active batch timestamp, else now."""
+    return _BATCH_TIMESTAMP.get() or datetime.now()
+
+
+@contextmanager
+def batch_timestamp(timestamp: datetime | None = None) -> Iterator[datetime]:
+    """
+    Stamp every trial built inside the block with one shared download time.
+    
+    Records from one bulk download share a single ``datetime`` instead of
+    calling ``datetime.now()`` per trial. Scoped per thread / async task.
+    """
+    token = _BATCH_TIMESTAMP.set(timestamp or datetime.now())
+    try:
+        yield _BATCH_TIMESTAMP.get()
+    finally:
+        _BATCH_TIMESTAMP.reset(token)
 
 
 class InterventionType(str, Enum):
@@ -68,6 +117,27 @@ class MaskingType(str, Enum):
     QUADRUPLE = "Quadruple"
 
 
+class WhoMaskedFlag(IntFlag):
+    """Masked parties as bits, so a masking set packs into one small integer."""
+    
+    PARTICIPANT = 1
+    CARE_PROVIDER = 2
+    INVESTIGATOR = 4
+    OUTCOMES_ASSESSOR = 8
+    
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "WhoMaskedFlag":
+        """Combine party names such as ``"Care Provider"``; unknown names are ignored."""
+        bits = cls(0)
+        for name in names:
+            bits |= cls.__members__.get(name.strip().upper().replace(" ", "_"), 0)
+        return bits
+    
+    def names(self) -> list[str]:
+        """Canonical party names set in this mask, in declaration order."""
+        return [flag.name for flag in type(self) if flag in self]
+
+
 class Contact(BaseModel):
     """Contact information for study personnel."""
     
@@ -191,6 +261,12 @@ class StudyDesign(BaseModel):
         default_factory=list, 
         description="List of parties who are masked/blinded"
     )
+    
+    @computed_field
+    @property
+    def who_masked_bits(self) -> int:
+        """``who_masked`` packed into a WhoMaskedFlag bitmask, for compact storage."""
+        return int(WhoMaskedFlag.from_names(self.who_masked))
 
 
 class Oversight(BaseModel):
@@ -209,7 +285,7 @@ class StudyInfo(BaseModel):
     
     nct_id: str = Field(..., description="ClinicalTrials.gov identifier")
     org_study_id: str | None = Field(default=None)
-    secondary_ids: list[str] = Field(default_factory=list)
+    secondary_ids: tuple[str, ...] = Field(default=())
     first_submitted: ISODate | None = Field(default=None)
     first_posted: ISODate | None = Field(default=None)
     last_update_submitted: ISODate | None = Field(default=None)
@@ -260,7 +336,7 @@ class ClinicalTrial(BaseModel):
     
     # Conditions and keywords
     conditions: list[str] = Field(default_factory=list)
-    keywords: list[str] = Field(default_factory=list)
+    keywords: tuple[str, ...] = Field(default=())
     
     # Eligibility
     eligibility: Eligibility | None = Field(default=None)
@@ -276,7 +352,7 @@ class ClinicalTrial(BaseModel):
     # Locations
     locations: list[Location] = Field(default_factory=list)
     location_countries: list[str] = Field(default_factory=list)
-    removed_location_countries: list[str] = Field(default_factory=list)
+    removed_location_countries: tuple[str, ...] = Field(default=())
     
     # Arms and interventions
     arm_groups: list[ArmGroup] = Field(default_factory=list)
@@ -285,11 +361,11 @@ class ClinicalTrial(BaseModel):
     # Outcomes
     primary_outcomes: list[Outcome] = Field(default_factory=list)
     secondary_outcomes: list[Outcome] = Field(default_factory=list)
-    other_outcomes: list[Outcome] = Field(default_factory=list)
+    other_outcomes: tuple[Outcome, ...] = Field(default=())
     
     # References and links
-    references: list[Reference] = Field(default_factory=list)
-    see_also_links: list[HttpUrl] = Field(default_factory=list)
+    references: tuple[Reference, ...] = Field(default=())
+    see_also_links: tuple[CachedHttpUrl, ...] = Field(default=())
     
     # Oversight
     oversight: Oversight | None = Field(default=None)
@@ -299,11 +375,123 @@ class ClinicalTrial(BaseModel):
     patient_data_sharing_description: str | None = Field(default=None)
     
     # Metadata
-    data_downloaded_at: ISODatetime = Field(default_factory=datetime.now)
-    source_url: HttpUrl | None = Field(default=None)
-    raw_data: dict[str, Any] | None = Field(default=None)
+    data_downloaded_at: ISODatetime = Field(default_factory=_downloaded_at)
+    source_url: CachedHttpUrl | None = Field(default=None)
     
-    # ✅ Pydantic V2 style configuration
-    model_config = ConfigDict(
-        populate_by_name=True,  # Often useful when mapping from camelCase APIs
-    )
+    @classmethod
+    def from_json_record(cls, record: ClinicalTrialJSONRecord) -> "ClinicalTrial":
+        """
+        Build a trial from an already-validated JSON record.
+        
+        Maps the record onto one plain field dict and validates it in a single
+        pydantic-core call; that is far cheaper than ``model_construct``,
+        which resolves every default factory in Python on each call.
+        """
+        ps = record.protocol_section
+        ident = ps and ps.identification_module
+        conditions_module = ps and ps.conditions_module
+        sponsors_module = ps and ps.sponsor_collaborators_module
+        eligibility_module = ps and ps.eligibility_module
+        
+        fields: dict[str, Any] = {
+            "study_info": {
+                "nct_id": record.nct_id,
+                "org_study_id": ident.org_study_id_info.id if ident and ident.org_study_id_info else None,
+                "secondary_ids": tuple(info.id for info in ident.secondary_id_infos if info.id) if ident else (),
+            },
+            "brief_title": record.brief_title,
+            "official_title": record.official_title,
+            "acronym": record.acronym,
+            "brief_summary": record.brief_summary,
+            "detailed_description": record.detailed_description,
+            "study_type": record.study_type,
+            "study_phase": _combined_phase(record.phases),
+            "study_status": record.overall_status,
+            "start_date": parse_flexible_date(record.start_date),
+            "completion_date": parse_flexible_date(record.completion_date),
+            "enrollment": record.enrollment,
+            "conditions": list(record.conditions),
+            "keywords": conditions_module.keywords if conditions_module else (),
+        }
+        
+        if eligibility_module is not None:
+            fields["eligibility"] = {
+                "criteria": eligibility_module.eligibility_criteria or "",
+                "gender": eligibility_module.sex or Sex.ALL,
+                "minimum_age": eligibility_module.minimum_age,
+                "maximum_age": eligibility_module.maximum_age,
+                "healthy_volunteers": bool(eligibility_module.healthy_volunteers),
+            }
+        
+        if sponsors_module is not None:
+            lead = sponsors_module.lead_sponsor
+            fields["sponsors"] = (
+                [{"name": lead.name, "agency_class": lead.class_, "role": "lead_sponsor"}]
+                if lead else []
+            )
+            fields["collaborators"] = [
+                {"name": c.name, "agency_class": c.class_, "role": "collaborator"}
+                for c in sponsors_module.collaborators
+            ]
+        
+        return cls.model_validate(fields)
+
+
+class TrustedClinicalTrial(ClinicalTrial):
+    """Trial that keeps URLs as scheme-checked strings, for trusted bulk ETL input."""
+    
+    source_url: HttpUrlStr | None = Field(default=None)
+    see_also_links: tuple[HttpUrlStr, ...] = Field(default=())
+
+
+def _combined_phase(phases: tuple[str, ...]) -> StudyPhase | None:
+    """Collapse the JSON phase list into a single StudyPhase, if it maps to one."""
+    if len(phases) == 1:
+        return StudyPhase(phases[0])
+    if len(phases) == 2:
+        return StudyPhase._value2member_map_.get(f"{phases[0]}_{phases[1]}")
+    return None
+
+
+_TRIALS_ADAPTER = TypeAdapter(list[ClinicalTrial])
+# Serializes each trial by its runtime class, e.g. TrustedClinicalTrial's
+# string URLs, instead of forcing the base schema onto subclasses
+_TRIALS_DUMP_ADAPTER = TypeAdapter(list[SerializeAsAny[ClinicalTrial]])
+
+
+def validate_trials(rows: Iterable[Mapping[str, Any]]) -> list[ClinicalTrial]:
+    """
+    Validate many trial dicts in a single pydantic-core call.
+    
+    Equivalent to ``[ClinicalTrial.model_validate(row) for row in rows]``
+    without re-entering Python per record. A failure raises one
+    ``ValidationError`` whose locations start with the row index.
+    """
+    return _TRIALS_ADAPTER.validate_python(list(rows))
+
+
+def dump_trials_json(trials: list[ClinicalTrial], *, exclude_none: bool = True) -> bytes:
+    """
+    Serialize many trials to a JSON array in a single pydantic-core call.
+    
+    Use instead of ``json.dumps([t.model_dump() for t in trials])``; no
+    intermediate dicts are built and no Python encoder runs per field.
+    Subclasses such as ``TrustedClinicalTrial`` dump with their own schema.
+    """
+    return _TRIALS_DUMP_ADAPTER.dump_json(trials, exclude_none=exclude_none)
+
+
+def dump_trial(trial: ClinicalTrial) -> dict[str, Any]:
+    """
+    ``trial.model_dump()`` without the Python wrapper, for tight export loops.
+    
+    Calls the core serializer of the trial's own class directly, so
+    subclasses work too. Takes no include/exclude/mode options; use
+    ``model_dump`` when filtering is needed.
+    """
+    return trial.__pydantic_serializer__.to_python(trial)
+
+
+def dump_trial_json(trial: ClinicalTrial) -> bytes:
+    """``trial.model_dump_json()`` as bytes, without the Python wrapper."""
+    return trial.__pydantic_serializer__.to_json(trial)
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Literal
 
 
 class DeduplicationStrategy(str, Enum):
@@ -376,4 +377,41 @@ class StudyResults(str, Enum):
     
     YES = "YES"
     NO = "NO"
-    UNKNOWN = "UNKNOWN"
\ No newline at end of file
+    UNKNOWN = "UNKNOWN"
+
+
+# Literal counterparts of the enums above, for hot validation paths:
+# pydantic-core checks a Literal with a plain string compare instead of
+# constructing an Enum member. Values must stay in sync with the enums.
+StudyStatusValue = Literal[
+    "COMPLETED",
+    "RECRUITING",
+    "NOT_YET_RECRUITING",
+    "ENROLLING_BY_INVITATION",
+    "ACTIVE_NOT_RECRUITING",
+    "SUSPENDED",
+    "TERMINATED",
+    "WITHDRAWN",
+    "UNKNOWN",
+    "WITHHELD",
+    "APPROVED_FOR_MARKETING",
+    "NO_LONGER_AVAILABLE",
+    "AVAILABLE",
+    "TEMPORARILY_NOT_AVAILABLE",
+]
+
+StudyTypeValue = Literal["INTERVENTIONAL", "OBSERVATIONAL", "EXPANDED_ACCESS"]
+
+StudyPhaseValue = Literal[
+    "EARLY_PHASE_1",
+    "PHASE_1",
+    "PHASE_1_PHASE_2",
+    "PHASE_2",
+    "PHASE_2_PHASE_3",
+    "PHASE_3",
+    "PHASE_4",
+    "NOT_APPLICABLE",
+    "NA",
+]
+
+SexValue = Literal["ALL", "FEMALE", "MALE"]
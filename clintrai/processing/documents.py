@@ -4,11 +4,16 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+import contextlib
 from datetime import UTC, datetime
+from enum import Enum
 import hashlib
 import os
 from pathlib import Path
+import random
 import re
+import shutil
+import time
 from typing import Any, TypeAlias
 from urllib.parse import urlparse
 from uuid import uuid4
@@ -16,6 +21,13 @@ from uuid import uuid4
 import httpx
 from loguru import logger
 import polars as pl
+import pyarrow.parquet as pq
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+)
 
 from clintrai.models.types import HarmonizedFieldName
 
@@ -24,6 +36,42 @@ DocumentInfo: TypeAlias = dict[str, Any]
 DownloadStats: TypeAlias = dict[str, Any]
 HttpClient: TypeAlias = httpx.AsyncClient
 
+# Characters replaced when turning a document URL into a local filename
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-_\.]")
+
+# Columns of the documents frame that flows from extraction through download to metadata
+DOCUMENT_SCHEMA: dict[str, pl.DataType] = {
+    "nct_id": pl.Utf8(),
+    "document_type": pl.Utf8(),
+    "url": pl.Utf8(),
+    "filename": pl.Utf8(),
+    "local_path": pl.Utf8(),
+    "file_size": pl.Int64(),
+    "status": pl.Utf8(),
+    "error": pl.Utf8(),
+    "source_snapshot_id": pl.Utf8(),
+    "source_content_sha256": pl.Utf8(),
+    "raw_artifact_path": pl.Utf8(),
+    "source_fetched_at": pl.Utf8(),
+}
+
+# Finished download records buffered per Parquet row group when streaming metadata
+_METADATA_BATCH_SIZE = 10_000
+
+# Document URL entries look like "<document type>, <url>"
+_DOC_TYPE_SEPARATOR = ", http"
+_DEFAULT_FILENAME = "unknown_document.pdf"
+
+# Bytes read from the network and written to disk per step while streaming
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Transient download failures are retried with jittered exponential backoff
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_OVERLOAD_STATUS_CODES = frozenset({429, 503})
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_DELAY_SECONDS = 1.0
+_RETRY_MAX_DELAY_SECONDS = 30.0
+
 
 def _utc_now_iso() -> str:
     """Return current UTC timestamp in ISO-8601 format."""
@@ -36,18 +84,17 @@ def _generate_snapshot_id() -> str:
     return f"snapshot-{timestamp}-{uuid4().hex[:8]}"
 
 
-def _persist_raw_artifact(
+def _open_raw_artifact(
     raw_artifacts_dir: Path,
-    content: bytes,
+    content_hash: str,
     filename: str,
-) -> tuple[Path, str]:
+) -> tuple[Path, int | None]:
     """
-    Persist content as an immutable, content-addressed artifact.
+    Reserve the content-addressed artifact path for a hash.
 
     Returns:
-        Tuple of (artifact_path, sha256_hash)
+        Tuple of (artifact_path, fd), where fd is None if the artifact already exists
     """
-    content_hash = hashlib.sha256(content).hexdigest()
     file_extension = Path(filename).suffix.lower() or ".bin"
 
     artifact_path = raw_artifacts_dir / content_hash[:2] / f"{content_hash}{file_extension}"
@@ -60,18 +107,52 @@ def _persist_raw_artifact(
             0o644,
         )
     except FileExistsError:
-        return artifact_path, content_hash
+        return artifact_path, None
+
+    return artifact_path, fd
+
+
+def _persist_raw_artifact(
+    raw_artifacts_dir: Path,
+    content: bytes,
+    filename: str,
+) -> tuple[Path, str]:
+    """
+    Persist content as an immutable, content-addressed artifact.
 
-    with os.fdopen(fd, "wb") as handle:
-        handle.write(content)
+    Returns:
+        Tuple of (artifact_path, sha256_hash)
+    """
+    content_hash = hashlib.sha256(content).hexdigest()
+    artifact_path, fd = _open_raw_artifact(raw_artifacts_dir, content_hash, filename)
+
+    if fd is not None:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
 
     return artifact_path, content_hash
 
 
+def _persist_raw_artifact_file(
+    raw_artifacts_dir: Path,
+    source_path: Path,
+    content_hash: str,
+    filename: str,
+) -> Path:
+    """Copy an already-hashed file into the content-addressed artifact store."""
+    artifact_path, fd = _open_raw_artifact(raw_artifacts_dir, content_hash, filename)
+
+    if fd is not None:
+        with os.fdopen(fd, "wb") as handle, source_path.open("rb") as source:
+            shutil.copyfileobj(source, handle, _DOWNLOAD_CHUNK_SIZE)
+
+    return artifact_path
+
+
 def extract_document_info(
     df: pl.DataFrame,
     snapshot_id: str | None = None,
-) -> list[DocumentInfo]:
+) -> pl.DataFrame:
     """
     Extract document download information from harmonized DataFrame.
     
@@ -79,70 +160,311 @@ def extract_document_info(
         df: Harmonized DataFrame with document_urls column
         
     Returns:
-        List of document info dictionaries
+        DataFrame with one pending row per document, in DOCUMENT_SCHEMA
     """
-    documents = []
+    nct_id_col = HarmonizedFieldName.NCT_ID.value
+    urls_col = HarmonizedFieldName.DOCUMENT_URLS.value
 
     # Filter to studies with documents using vectorized operations
-    studies_with_docs = df.filter(
-        pl.col(HarmonizedFieldName.DOCUMENT_URLS.value).list.len() > 0
-    ).select([
-        HarmonizedFieldName.NCT_ID.value,
-        HarmonizedFieldName.DOCUMENT_URLS.value
-    ])
-
-    for row in studies_with_docs.iter_rows(named=True):
-        nct_id = row[HarmonizedFieldName.NCT_ID.value]
-        document_urls = row[HarmonizedFieldName.DOCUMENT_URLS.value]
-
-        for doc_string in document_urls:
-            doc_type, url = _parse_document_url(doc_string)
-            filename = _extract_filename(url)
-
-            documents.append({
-                "nct_id": nct_id,
-                "document_type": doc_type,
-                "url": url,
-                "filename": filename,
-                "local_path": None,
-                "file_size": None,
-                "status": "pending",
-                "error": None,
-                "source_snapshot_id": snapshot_id,
-                "source_content_sha256": None,
-                "raw_artifact_path": None,
-                "source_fetched_at": None,
-            })
-
-    logger.info(f"Found {len(documents)} documents to download from {studies_with_docs.height} studies")
-    return documents
-
-
-def _parse_document_url(doc_string: str) -> tuple[str, str]:
-    """Parse document URL string into (type, url) tuple."""
-    if ", http" in doc_string:
-        parts = doc_string.split(", http", 1)
-        if len(parts) == 2:
-            return parts[0].strip(), "http" + parts[1].strip()
-
-    return "Unknown Document", doc_string.strip()
-
-
-def _extract_filename(url: str) -> str:
-    """Extract filename from URL."""
-    parsed_url = urlparse(url)
-    filename = Path(parsed_url.path).name
-    return filename if filename else "unknown_document.pdf"
+    studies_with_docs = df.filter(pl.col(urls_col).list.len() > 0).select(
+        nct_id_col, pl.col(urls_col).cast(pl.List(pl.Utf8))
+    )
 
+    doc_string = pl.col(urls_col)
+    has_type = doc_string.str.contains(_DOC_TYPE_SEPARATOR, literal=True)
+    parts = doc_string.str.splitn(_DOC_TYPE_SEPARATOR, 2)
+    url = pl.col("url")
+    # Path component of the URL with scheme/host, query, fragment, params
+    # and trailing slashes removed; its last segment is the filename
+    url_path = (
+        url.str.replace(r"^[A-Za-z][A-Za-z0-9+.\-]*://[^/?#]*", "")
+        .str.replace(r"[?#].*$", "")
+        .str.replace(r";[^/]*$", "")
+        .str.strip_chars_end("/")
+    )
+    filename = url_path.str.extract(r"([^/]*)$", 1)
+
+    documents_df = (
+        studies_with_docs.explode(urls_col)
+        .select(
+            pl.col(nct_id_col).alias("nct_id"),
+            pl.when(has_type)
+            .then(parts.struct.field("field_0").str.strip_chars())
+            .otherwise(pl.lit("Unknown Document"))
+            .alias("document_type"),
+            pl.when(has_type)
+            .then(pl.lit("http") + parts.struct.field("field_1").str.strip_chars())
+            .otherwise(doc_string.str.strip_chars())
+            .alias("url"),
+        )
+        .with_columns(
+            pl.when(filename == "")
+            .then(pl.lit(_DEFAULT_FILENAME))
+            .otherwise(filename)
+            .alias("filename"),
+            pl.lit(None, dtype=pl.Utf8).alias("local_path"),
+            pl.lit(None, dtype=pl.Int64).alias("file_size"),
+            pl.lit("pending").alias("status"),
+            pl.lit(None, dtype=pl.Utf8).alias("error"),
+            pl.lit(snapshot_id, dtype=pl.Utf8).alias("source_snapshot_id"),
+            pl.lit(None, dtype=pl.Utf8).alias("source_content_sha256"),
+            pl.lit(None, dtype=pl.Utf8).alias("raw_artifact_path"),
+            pl.lit(None, dtype=pl.Utf8).alias("source_fetched_at"),
+        )
+    )
 
-def _create_safe_path(output_dir: Path, nct_id: str, filename: str) -> Path:
-    """Create safe local file path for document."""
-    study_dir = output_dir / nct_id
-    study_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Found {documents_df.height} documents to download from {studies_with_docs.height} studies")
+    return documents_df
 
+
+def _create_safe_path(output_dir: Path, nct_id: str, filename: str) -> Path:
+    """Create safe local file path for document (its study directory must exist)."""
     # Sanitize filename
-    safe_filename = re.sub(r"[^\w\-_\.]", "_", filename)
-    return study_dir / safe_filename
+    safe_filename = _UNSAFE_FILENAME_CHARS.sub("_", filename)
+    return output_dir / nct_id / safe_filename
+
+
+def _create_study_dirs(output_dir: Path, documents: pl.DataFrame) -> None:
+    """Create each study's download directory once, ahead of the downloads."""
+    for nct_id in documents["nct_id"].unique():
+        (output_dir / nct_id).mkdir(parents=True, exist_ok=True)
+
+
+class DocumentTooLargeError(Exception):
+    """Raised when a document exceeds the download size cap."""
+
+
+class CircuitState(str, Enum):
+    """State of a per-host circuit breaker."""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class HostCircuit:
+    """
+    Circuit breaker for one download host.
+    
+    Opens after ``failure_threshold`` consecutive transient failures and
+    rejects requests until ``reset_timeout`` seconds have passed, then lets
+    a single trial request through to decide whether to close again.
+    """
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+    
+    def allow_request(self) -> bool:
+        """Return whether a request to this host may be attempted now."""
+        if self.state is CircuitState.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            return True
+        # Only the one trial request may run while half-open
+        return self.state is CircuitState.CLOSED
+    
+    def record_success(self) -> None:
+        """Close the circuit after a request that reached the host."""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+    
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold."""
+        self.failures += 1
+        if self.state is CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    AIMD limit on in-flight download requests.
+    
+    Used as ``async with limit:`` around each request. The window grows by
+    roughly one slot per window of clean responses and halves whenever the
+    server signals overload (429, 503 or a timeout), staying within
+    ``[min_concurrency, max_concurrency]``.
+    """
+    
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1):
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.window = float(max_concurrency)
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+    
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self.min_concurrency, int(self.window))
+    
+    async def __aenter__(self) -> AdaptiveConcurrencyLimit:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            if exc is None:
+                self.window = min(self.max_concurrency, self.window + 1 / self.window)
+            elif _is_overload(exc):
+                self.window = max(self.min_concurrency, self.window / 2)
+            self._condition.notify_all()
+
+
+def _is_overload(error: BaseException) -> bool:
+    """Return whether a download error means the server wants less load."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _OVERLOAD_STATUS_CODES
+    return isinstance(error, httpx.TimeoutException)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Return whether a download error is worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Back off exponentially with jitter, or as long as ``Retry-After`` asks."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(error, httpx.HTTPStatusError):
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), _RETRY_MAX_DELAY_SECONDS)
+
+    delay = _RETRY_BASE_DELAY_SECONDS * 2 ** (retry_state.attempt_number - 1)
+    return min(delay, _RETRY_MAX_DELAY_SECONDS) + random.uniform(0, _RETRY_BASE_DELAY_SECONDS)
+
+
+def _etag_path(partial_path: Path) -> Path:
+    """Sidecar file holding the ETag a partial download was fetched under."""
+    return partial_path.with_name(f"{partial_path.name}.etag")
+
+
+def _resume_state(partial_path: Path) -> tuple[int, str | None]:
+    """Return (bytes already on disk, recorded ETag) for a partial download."""
+    try:
+        etag = _etag_path(partial_path).read_text()
+        return partial_path.stat().st_size, etag
+    except FileNotFoundError:
+        return 0, None
+
+
+def _hash_file(path: Path) -> hashlib._Hash:
+    """Return a running SHA-256 over a file's current contents."""
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_DOWNLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher
+
+
+def _discard_partial(partial_path: Path) -> None:
+    """Remove a partial download and its ETag sidecar."""
+    partial_path.unlink(missing_ok=True)
+    _etag_path(partial_path).unlink(missing_ok=True)
+
+
+async def _stream_to_file(
+    client: HttpClient,
+    url: str,
+    path: Path,
+    max_size_bytes: int,
+) -> tuple[int, str]:
+    """
+    Stream a URL into ``path``, hashing as it is written.
+    
+    When an earlier attempt or run left part of the body in ``path`` along
+    with the server's strong ETag, only the remaining bytes are requested
+    (``Range``); ``If-Range`` makes the server send the full body instead
+    if the document changed in the meantime. Partial bodies without an
+    ETag cannot be resumed safely and are discarded on failure.
+    
+    Returns:
+        Tuple of (size_in_bytes, sha256_hash)
+        
+    Raises:
+        DocumentTooLargeError: If the body exceeds ``max_size_bytes``
+    """
+    resume_from, etag = await asyncio.to_thread(_resume_state, path)
+    headers = {"Range": f"bytes={resume_from}-", "If-Range": etag} if etag else {}
+
+    async with client.stream("GET", url, headers=headers, timeout=60.0) as response:
+        if not (etag and response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE):
+            return await _write_body(response, url, path, resume_from, max_size_bytes)
+
+    # The range is past the end of the document, typically because a run
+    # stopped after the last chunk but before the rename; fetch it afresh
+    await asyncio.to_thread(_discard_partial, path)
+    return await _stream_to_file(client, url, path, max_size_bytes)
+
+
+async def _write_body(
+    response: httpx.Response,
+    url: str,
+    path: Path,
+    resume_from: int,
+    max_size_bytes: int,
+) -> tuple[int, str]:
+    """Write a (possibly resumed) response body to ``path`` while hashing it."""
+    response.raise_for_status()
+
+    resumed = response.status_code == httpx.codes.PARTIAL_CONTENT
+    if resumed and not response.headers.get("Content-Range", "").startswith(f"bytes {resume_from}-"):
+        await asyncio.to_thread(_discard_partial, path)
+        raise httpx.RemoteProtocolError(f"Unexpected Content-Range for {url}")
+
+    if resumed:
+        hasher = await asyncio.to_thread(_hash_file, path)
+        total_size = resume_from
+    else:
+        hasher = hashlib.sha256()
+        total_size = 0
+
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and total_size + int(content_length) > max_size_bytes:
+        await asyncio.to_thread(_discard_partial, path)
+        raise DocumentTooLargeError(
+            f"File too large: {(total_size + int(content_length)) / 1024 / 1024:.1f}MB"
+        )
+
+    # Only strong validators are accepted by If-Range
+    new_etag = response.headers.get("ETag")
+    resumable = bool(new_etag) and not new_etag.startswith("W/")
+
+    # Disk writes run in worker threads so slow filesystems do not stall
+    # the other downloads sharing the event loop
+    handle = await asyncio.to_thread(path.open, "ab" if resumed else "wb")
+    try:
+        if not resumed and resumable:
+            await asyncio.to_thread(_etag_path(path).write_text, new_etag)
+        async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+            total_size += len(chunk)
+            if total_size > max_size_bytes:
+                raise DocumentTooLargeError(
+                    f"File too large: over {max_size_bytes // (1024 * 1024)}MB"
+                )
+            hasher.update(chunk)
+            await asyncio.to_thread(handle.write, chunk)
+    except BaseException as e:
+        await asyncio.to_thread(handle.close)
+        # Keep what was received when the next attempt can resume it
+        if isinstance(e, DocumentTooLargeError) or not resumable:
+            await asyncio.to_thread(_discard_partial, path)
+        raise
+    await asyncio.to_thread(handle.close)
+
+    await asyncio.to_thread(_etag_path(path).unlink, missing_ok=True)
+    return total_size, hasher.hexdigest()
 
 
 async def _download_single_document(
@@ -150,16 +472,23 @@ async def _download_single_document(
     doc_info: DocumentInfo,
     output_dir: Path,
     raw_artifacts_dir: Path,
-    max_size_mb: int = 50
+    max_size_mb: int = 50,
+    circuits: dict[str, HostCircuit] | None = None,
+    limit: AdaptiveConcurrencyLimit | None = None,
 ) -> DocumentInfo:
     """
     Download a single document with error handling.
     
+    Transient failures (timeouts, connection errors, 429 and 5xx responses)
+    are retried with exponential backoff, honouring ``Retry-After``.
+    
     Args:
         client: HTTP client (injected dependency)
         doc_info: Document information dictionary
         output_dir: Output directory for downloads
         max_size_mb: Maximum file size in MB
+        circuits: Per-host circuit breakers shared across a download run
+        limit: Adaptive cap on in-flight requests shared across a download run
         
     Returns:
         Updated document info with download status
@@ -169,51 +498,81 @@ async def _download_single_document(
         fetched_at = _utc_now_iso()
 
         # Skip if already exists
-        if local_path.exists():
-            existing_content = local_path.read_bytes()
-            artifact_path, content_hash = _persist_raw_artifact(
+        if await asyncio.to_thread(local_path.exists):
+            existing_content = await asyncio.to_thread(local_path.read_bytes)
+            artifact_path, content_hash = await asyncio.to_thread(
+                _persist_raw_artifact,
                 raw_artifacts_dir,
                 existing_content,
                 doc_info["filename"],
             )
             doc_info["local_path"] = str(local_path)
-            doc_info["file_size"] = local_path.stat().st_size
+            doc_info["file_size"] = len(existing_content)
             doc_info["status"] = "skipped"
             doc_info["source_content_sha256"] = content_hash
             doc_info["raw_artifact_path"] = str(artifact_path)
             doc_info["source_fetched_at"] = None
             return doc_info
 
-        # Download with timeout and size limits
-        response = await client.get(doc_info["url"], timeout=60.0)
-        response.raise_for_status()
+        # Stream to a partial file, hashing as we go, so memory stays at one
+        # chunk per download and oversize files are abandoned early
+        partial_path = local_path.with_name(f"{local_path.name}.part")
+        host = urlparse(doc_info["url"]).netloc
+        circuit = circuits.setdefault(host, HostCircuit()) if circuits is not None else HostCircuit()
 
-        content = response.content
-
-        # Check file size
-        if len(content) > max_size_mb * 1024 * 1024:
+        if not circuit.allow_request():
             doc_info["status"] = "failed"
-            doc_info["error"] = f"File too large: {len(content) / 1024 / 1024:.1f}MB"
+            doc_info["error"] = f"Circuit open for {host}"
             return doc_info
 
-        artifact_path, content_hash = _persist_raw_artifact(
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(_RETRY_ATTEMPTS),
+                wait=_retry_wait,
+                retry=retry_if_exception(_is_retryable),
+                reraise=True,
+            ):
+                with attempt:
+                    async with limit or contextlib.nullcontext():
+                        total_size, content_hash = await _stream_to_file(
+                            client,
+                            doc_info["url"],
+                            partial_path,
+                            max_size_mb * 1024 * 1024,
+                        )
+        except DocumentTooLargeError as e:
+            circuit.record_success()
+            doc_info["status"] = "failed"
+            doc_info["error"] = str(e)
+            return doc_info
+        except Exception as e:
+            if _is_retryable(e):
+                circuit.record_failure()
+            else:
+                circuit.record_success()
+            raise
+
+        circuit.record_success()
+        artifact_path = await asyncio.to_thread(
+            _persist_raw_artifact_file,
             raw_artifacts_dir,
-            content,
+            partial_path,
+            content_hash,
             doc_info["filename"],
         )
 
         # Save file
-        local_path.write_bytes(content)
+        await asyncio.to_thread(partial_path.replace, local_path)
 
         # Update document info
         doc_info["local_path"] = str(local_path)
-        doc_info["file_size"] = len(content)
+        doc_info["file_size"] = total_size
         doc_info["status"] = "downloaded"
         doc_info["source_content_sha256"] = content_hash
         doc_info["raw_artifact_path"] = str(artifact_path)
         doc_info["source_fetched_at"] = fetched_at
 
-        logger.debug(f"Downloaded {doc_info['nct_id']}/{doc_info['filename']} ({len(content) / 1024:.1f}KB)")
+        logger.debug(f"Downloaded {doc_info['nct_id']}/{doc_info['filename']} ({total_size / 1024:.1f}KB)")
 
     except httpx.TimeoutException:
         doc_info["status"] = "failed"
@@ -229,76 +588,219 @@ async def _download_single_document(
     return doc_info
 
 
+class DocumentMetadataWriter:
+    """
+    Stream finished document records into a Parquet file, one row group per batch.
+    
+    Rows go to ``<output>.partial`` while the run is in progress. ``close()``
+    moves the complete file into place; ``abort()`` closes the partial file so
+    the records written so far stay readable after an interrupted run.
+    """
+    
+    def __init__(self, output_path: Path, batch_size: int = _METADATA_BATCH_SIZE):
+        self.output_path = output_path
+        self.partial_path = output_path.with_name(output_path.name + ".partial")
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._rows: list[tuple] = []
+        arrow_schema = pl.DataFrame(schema=DOCUMENT_SCHEMA).to_arrow().schema
+        self._writer = pq.ParquetWriter(self.partial_path, arrow_schema, compression="zstd")
+    
+    def append(self, row: tuple) -> None:
+        """Buffer one record in DOCUMENT_SCHEMA order, writing a row group when full."""
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write buffered records as a row group."""
+        if not self._rows:
+            return
+        batch = pl.DataFrame(self._rows, schema=DOCUMENT_SCHEMA, orient="row")
+        self._writer.write_table(batch.to_arrow())
+        self.rows_written += len(self._rows)
+        self._rows.clear()
+    
+    def close(self) -> None:
+        """Flush, finish the file and move it to the output path."""
+        self.flush()
+        self._writer.close()
+        self.partial_path.replace(self.output_path)
+        logger.info(f"Saved document metadata for {self.rows_written} documents to {self.output_path}")
+    
+    def abort(self) -> None:
+        """Flush and finish the partial file without moving it into place."""
+        self.flush()
+        self._writer.close()
+        logger.warning(f"Kept metadata for {self.rows_written} finished documents in {self.partial_path}")
+
+
+def _reuse_download(
+    source: DocumentInfo,
+    doc_info: DocumentInfo,
+    output_dir: Path,
+) -> DocumentInfo | None:
+    """
+    Complete a document from an earlier fetch of the same URL in this run.
+    
+    A failed fetch is reported again without a new request, and a downloaded
+    file is hard-linked (or copied) into this document's study directory.
+    Returns None when the document should be fetched normally instead, i.e.
+    the earlier document was only skipped or this one already exists locally.
+    """
+    if source["status"] == "failed":
+        doc_info["status"] = "failed"
+        doc_info["error"] = source["error"]
+        return doc_info
+
+    local_path = _create_safe_path(output_dir, doc_info["nct_id"], doc_info["filename"])
+    if source["status"] != "downloaded" or local_path.exists():
+        return None
+
+    try:
+        os.link(source["local_path"], local_path)
+    except OSError:
+        shutil.copyfile(source["local_path"], local_path)
+
+    doc_info["local_path"] = str(local_path)
+    for field in ("file_size", "status", "source_content_sha256", "raw_artifact_path", "source_fetched_at"):
+        doc_info[field] = source[field]
+    return doc_info
+
+
+class _DownloadRun:
+    """Work queue and shared state for the workers of one download_documents call."""
+
+    def __init__(
+        self,
+        documents: pl.DataFrame,
+        output_dir: Path,
+        artifacts_dir: Path,
+        max_concurrent: int,
+        max_size_mb: int,
+    ) -> None:
+        self.output_dir = output_dir
+        self.artifacts_dir = artifacts_dir
+        self.max_size_mb = max_size_mb
+        # Each worker turns its row dict back into a schema-ordered tuple, and
+        # the frame is built from those rows once at the end
+        self.results: list[tuple | None] = [None] * documents.height
+        self.pending = enumerate(documents.iter_rows(named=True))
+        self.circuits: dict[str, HostCircuit] = {}
+        self.limit = AdaptiveConcurrencyLimit(max_concurrency=max_concurrent)
+        # First fetch of each URL this run; later documents with the same URL
+        # (shared protocol PDFs) wait on it instead of downloading again
+        self.first_fetches: dict[str, asyncio.Future[DocumentInfo]] = {}
+        self.metadata_writer: DocumentMetadataWriter | None = None
+
+    async def fetch(self, client: HttpClient, doc_info: DocumentInfo) -> DocumentInfo:
+        """Download one document, recording any failure on its row."""
+        try:
+            return await _download_single_document(
+                client,
+                doc_info,
+                self.output_dir,
+                self.artifacts_dir,
+                self.max_size_mb,
+                self.circuits,
+                self.limit,
+            )
+        except Exception as e:
+            doc_info["status"] = "failed"
+            doc_info["error"] = str(e)
+            return doc_info
+
+    async def worker(self, client: HttpClient) -> None:
+        """Download documents until the shared queue is empty."""
+        # Workers pull from one shared iterator, so only max_concurrent
+        # coroutines exist however many documents there are
+        for index, doc_info in self.pending:
+            first_fetch = self.first_fetches.get(doc_info["url"])
+            if first_fetch is None:
+                first_fetch = asyncio.get_running_loop().create_future()
+                self.first_fetches[doc_info["url"]] = first_fetch
+                doc_info = await self.fetch(client, doc_info)
+                first_fetch.set_result(doc_info)
+            else:
+                source = await first_fetch
+                reused = await asyncio.to_thread(_reuse_download, source, doc_info, self.output_dir)
+                doc_info = reused or await self.fetch(client, doc_info)
+            self.results[index] = tuple(doc_info.get(column) for column in DOCUMENT_SCHEMA)
+            if self.metadata_writer is not None:
+                self.metadata_writer.append(self.results[index])
+
+
+async def _run_downloads(
+    run: _DownloadRun,
+    client_factory: Callable[[], HttpClient],
+    worker_count: int,
+    metadata_path: Path | None,
+) -> list[tuple | None]:
+    """Run the download workers, streaming finished rows to ``metadata_path`` if given."""
+    if metadata_path is not None:
+        run.metadata_writer = DocumentMetadataWriter(metadata_path)
+    try:
+        # Download all documents through one client so they share its connection pool
+        async with client_factory() as client:
+            await asyncio.gather(*[run.worker(client) for _ in range(worker_count)])
+    except BaseException:
+        if run.metadata_writer is not None:
+            run.metadata_writer.abort()
+        raise
+    if run.metadata_writer is not None:
+        run.metadata_writer.close()
+    return run.results
+
+
 async def download_documents(
-    documents: list[DocumentInfo],
+    documents: pl.DataFrame,
     output_dir: Path,
     client_factory: Callable[[], HttpClient],
     max_concurrent: int = 10,
     max_size_mb: int = 50,
     raw_artifacts_dir: Path | None = None,
-) -> tuple[list[DocumentInfo], DownloadStats]:
+    metadata_path: Path | None = None,
+) -> tuple[pl.DataFrame, DownloadStats]:
     """
     Download documents with injected HTTP client factory.
     
     Args:
-        documents: List of document info dictionaries
+        documents: Documents frame with at least nct_id, url and filename
         output_dir: Directory to save documents
-        client_factory: Function that creates HTTP client (dependency injection)
-        max_concurrent: Maximum concurrent downloads
+        client_factory: Function that creates the HTTP client shared by all downloads
+        max_concurrent: Maximum concurrent downloads; fewer run while the server signals overload
         max_size_mb: Maximum file size per document in MB
+        raw_artifacts_dir: Content-addressed artifact store (defaults next to output_dir)
+        metadata_path: If given, records are streamed to this Parquet file as they finish
         
     Returns:
-        Tuple of (updated_documents, download_stats)
+        Tuple of (updated_documents, download_stats), the frame in DOCUMENT_SCHEMA
     """
-    if not documents:
-        return [], _create_empty_stats()
+    if documents.is_empty():
+        return pl.DataFrame(schema=DOCUMENT_SCHEMA), _create_empty_stats()
 
     output_dir.mkdir(parents=True, exist_ok=True)
     artifacts_dir = raw_artifacts_dir or (output_dir.parent / "raw_artifacts")
     artifacts_dir.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(_create_study_dirs, output_dir, documents)
 
-    # Use semaphore to limit concurrent downloads
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def download_with_limit(doc_info: DocumentInfo) -> DocumentInfo:
-        async with semaphore:
-            async with client_factory() as client:
-                return await _download_single_document(
-                    client,
-                    doc_info,
-                    output_dir,
-                    artifacts_dir,
-                    max_size_mb,
-                )
-
-    logger.info(f"Starting download of {len(documents)} documents with {max_concurrent} concurrent connections")
+    worker_count = min(max_concurrent, documents.height)
+    logger.info(f"Starting download of {documents.height} documents with {worker_count} concurrent connections")
 
-    # Download all documents
-    updated_documents = await asyncio.gather(
-        *[download_with_limit(doc) for doc in documents],
-        return_exceptions=True
-    )
+    run = _DownloadRun(documents, output_dir, artifacts_dir, max_concurrent, max_size_mb)
+    results = await _run_downloads(run, client_factory, worker_count, metadata_path)
 
-    # Handle any exceptions from gather
-    results = []
-    for i, result in enumerate(updated_documents):
-        if isinstance(result, Exception):
-            doc_info = documents[i].copy()
-            doc_info["status"] = "failed"
-            doc_info["error"] = str(result)
-            results.append(doc_info)
-        else:
-            results.append(result)
+    updated_documents = pl.DataFrame(results, schema=DOCUMENT_SCHEMA, orient="row")
 
     # Calculate statistics
-    stats = _calculate_download_stats(results)
+    stats = _calculate_download_stats(updated_documents)
 
     logger.info(
         f"Document download complete: {stats['downloaded']} downloaded, "
         f"{stats['failed']} failed, {stats['skipped']} skipped"
     )
 
-    return results, stats
+    return updated_documents, stats
 
 
 def _create_empty_stats() -> DownloadStats:
@@ -313,65 +815,67 @@ def _create_empty_stats() -> DownloadStats:
     }
 
 
-def _calculate_download_stats(documents: list[DocumentInfo]) -> DownloadStats:
+def _calculate_download_stats(documents: pl.DataFrame) -> DownloadStats:
     """Calculate download statistics from document results."""
     stats = _create_empty_stats()
-    stats["total_documents"] = len(documents)
-    stats["studies_with_documents"] = len(set(doc["nct_id"] for doc in documents))
-
-    for doc in documents:
-        if doc["status"] == "downloaded":
-            stats["downloaded"] += 1
-            if doc["file_size"]:
-                stats["total_size_mb"] += doc["file_size"] / (1024 * 1024)
-        elif doc["status"] == "failed":
-            stats["failed"] += 1
-        elif doc["status"] == "skipped":
-            stats["skipped"] += 1
+    stats["total_documents"] = documents.height
+    stats["studies_with_documents"] = documents["nct_id"].n_unique()
+
+    by_status = documents.group_by("status").agg(
+        pl.len().alias("count"),
+        pl.col("file_size").sum().alias("total_size"),
+    )
+    for status, count, total_size in by_status.iter_rows():
+        if status in ("downloaded", "failed", "skipped"):
+            stats[status] = count
+        if status == "downloaded":
+            stats["total_size_mb"] = total_size / (1024 * 1024)
 
     return stats
 
 
-def save_document_metadata(documents: list[DocumentInfo], output_path: Path) -> None:
+def save_document_metadata(documents: pl.DataFrame, output_path: Path) -> None:
     """
     Save document metadata to parquet file.
     
     Args:
-        documents: List of document information
+        documents: Documents frame
         output_path: Path to save metadata parquet file
     """
-    if not documents:
+    if documents.is_empty():
         logger.warning("No document metadata to save")
         return
 
-    df = pl.DataFrame(documents)
-    df.write_parquet(output_path)
-    logger.info(f"Saved document metadata for {len(documents)} documents to {output_path}")
+    documents.write_parquet(output_path)
+    logger.info(f"Saved document metadata for {documents.height} documents to {output_path}")
 
 
 def save_source_snapshot_metadata(
-    documents: list[DocumentInfo],
+    documents: pl.DataFrame,
     output_path: Path,
     snapshot_id: str,
 ) -> None:
     """Save source snapshot summary metadata to parquet."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    downloaded_count = sum(1 for doc in documents if doc["status"] == "downloaded")
-    skipped_count = sum(1 for doc in documents if doc["status"] == "skipped")
-    failed_count = sum(1 for doc in documents if doc["status"] == "failed")
-    total_size_bytes = sum(int(doc["file_size"] or 0) for doc in documents)
-    studies_with_documents = len({doc["nct_id"] for doc in documents})
+    status = pl.col("status")
+    counts = documents.select(
+        (status == "downloaded").sum().alias("downloaded_count"),
+        (status == "skipped").sum().alias("skipped_count"),
+        (status == "failed").sum().alias("failed_count"),
+        pl.col("nct_id").n_unique().alias("studies_with_documents"),
+        pl.col("file_size").fill_null(0).sum().alias("total_size_bytes"),
+    ).row(0, named=True)
 
     snapshot_row = {
         "snapshot_id": snapshot_id,
         "created_at": _utc_now_iso(),
-        "document_count": len(documents),
-        "downloaded_count": downloaded_count,
-        "skipped_count": skipped_count,
-        "failed_count": failed_count,
-        "studies_with_documents": studies_with_documents,
-        "total_size_bytes": total_size_bytes,
+        "document_count": documents.height,
+        "downloaded_count": counts["downloaded_count"],
+        "skipped_count": counts["skipped_count"],
+        "failed_count": counts["failed_count"],
+        "studies_with_documents": counts["studies_with_documents"],
+        "total_size_bytes": counts["total_size_bytes"],
     }
 
     pl.DataFrame([snapshot_row]).write_parquet(output_path)
@@ -386,6 +890,7 @@ def create_httpx_client() -> HttpClient:
         Configured httpx.AsyncClient
     """
     return httpx.AsyncClient(
+        http2=True,
         timeout=httpx.Timeout(60.0),
         limits=httpx.Limits(max_connections=20, max_keepalive_connections=5),
         headers={"User-Agent": "ClintrAI Document Downloader 1.0"}
@@ -398,7 +903,7 @@ async def process_document_downloads(
     max_concurrent: int = 10,
     max_size_mb: int = 50,
     snapshot_id: str | None = None,
-) -> tuple[list[DocumentInfo], DownloadStats]:
+) -> tuple[pl.DataFrame, DownloadStats]:
     """
     Main function to process document downloads from harmonized data.
     
@@ -418,16 +923,16 @@ async def process_document_downloads(
     # Extract document information
     documents = extract_document_info(harmonized_df, run_snapshot_id)
 
-    if not documents:
+    if documents.is_empty():
         logger.warning("No documents found to download")
         save_source_snapshot_metadata(
-            [],
+            documents,
             output_dir / "source_snapshot.parquet",
             run_snapshot_id,
         )
-        return [], _create_empty_stats()
+        return documents, _create_empty_stats()
 
-    # Download documents with dependency injection
+    # Download documents with dependency injection, streaming metadata as they finish
     updated_documents, stats = await download_documents(
         documents,
         output_dir / "documents",
@@ -435,12 +940,11 @@ async def process_document_downloads(
         max_concurrent,
         max_size_mb,
         raw_artifacts_dir=output_dir / "raw_artifacts",
+        metadata_path=output_dir / "document_metadata.parquet",
     )
     stats["snapshot_id"] = run_snapshot_id
 
-    # Save metadata
-    metadata_path = output_dir / "document_metadata.parquet"
-    save_document_metadata(updated_documents, metadata_path)
+    # Save snapshot summary
     save_source_snapshot_metadata(
         updated_documents,
         output_dir / "source_snapshot.parquet",
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
 from pathlib import Path
 from typing import Any, TypeAlias
 
@@ -18,6 +18,86 @@ from clintrai.models.json_models import ClinicalTrialJSONRecord
 NCTIdSet: TypeAlias = set[str]
 JSONRecord: TypeAlias = dict[str, Any]
 
+_NCT_ID = HarmonizedFieldName.NCT_ID.value
+_HAS_RESULTS = HarmonizedFieldName.HAS_RESULTS.value
+_ENROLLMENT = HarmonizedFieldName.ENROLLMENT.value
+
+# Map CSV columns to harmonized names using enums for consistency
+_CSV_COLUMN_MAPPING: dict[str, str] = {
+    CSVFieldName.NCT_NUMBER.value: HarmonizedFieldName.NCT_ID.value,
+    CSVFieldName.STUDY_TITLE.value: HarmonizedFieldName.TITLE.value,
+    CSVFieldName.STUDY_URL.value: HarmonizedFieldName.STUDY_URL.value,
+    CSVFieldName.ACRONYM.value: HarmonizedFieldName.ACRONYM.value,
+    CSVFieldName.STUDY_STATUS.value: HarmonizedFieldName.OVERALL_STATUS.value,
+    CSVFieldName.STUDY_RESULTS.value: HarmonizedFieldName.HAS_RESULTS.value,
+    CSVFieldName.STUDY_TYPE.value: HarmonizedFieldName.STUDY_TYPE.value,
+    CSVFieldName.BRIEF_SUMMARY.value: HarmonizedFieldName.BRIEF_SUMMARY.value,
+    CSVFieldName.CONDITIONS.value: HarmonizedFieldName.CONDITIONS.value,
+    CSVFieldName.INTERVENTIONS.value: HarmonizedFieldName.INTERVENTIONS.value,
+    CSVFieldName.SPONSOR.value: HarmonizedFieldName.LEAD_SPONSOR.value,
+    CSVFieldName.COLLABORATORS.value: HarmonizedFieldName.COLLABORATORS.value,
+    CSVFieldName.SEX.value: HarmonizedFieldName.SEX.value,
+    CSVFieldName.AGE.value: HarmonizedFieldName.MINIMUM_AGE.value,
+    CSVFieldName.PHASES.value: HarmonizedFieldName.STUDY_PHASE.value,
+    CSVFieldName.ENROLLMENT.value: HarmonizedFieldName.ENROLLMENT.value,
+    CSVFieldName.START_DATE.value: HarmonizedFieldName.START_DATE.value,
+    CSVFieldName.PRIMARY_COMPLETION_DATE.value: HarmonizedFieldName.PRIMARY_COMPLETION_DATE.value,
+    CSVFieldName.COMPLETION_DATE.value: HarmonizedFieldName.COMPLETION_DATE.value,
+    CSVFieldName.FIRST_POSTED.value: HarmonizedFieldName.FIRST_POSTED.value,
+    CSVFieldName.LAST_UPDATE_POSTED.value: HarmonizedFieldName.LAST_UPDATE_POSTED.value,
+    CSVFieldName.STUDY_DOCUMENTS.value: HarmonizedFieldName.DOCUMENT_URLS.value,
+    CSVFieldName.LOCATIONS.value: HarmonizedFieldName.LOCATIONS.value,
+    # Outcome measures
+    CSVFieldName.PRIMARY_OUTCOME_MEASURES.value: HarmonizedFieldName.PRIMARY_OUTCOME_MEASURES.value,
+    CSVFieldName.SECONDARY_OUTCOME_MEASURES.value: HarmonizedFieldName.SECONDARY_OUTCOME_MEASURES.value,
+    CSVFieldName.OTHER_OUTCOME_MEASURES.value: HarmonizedFieldName.OTHER_OUTCOME_MEASURES.value,
+    # Additional study information
+    CSVFieldName.FUNDER_TYPE.value: HarmonizedFieldName.FUNDER_TYPE.value,
+    CSVFieldName.STUDY_DESIGN.value: HarmonizedFieldName.STUDY_DESIGN.value,
+    CSVFieldName.OTHER_IDS.value: HarmonizedFieldName.OTHER_IDS.value,
+    CSVFieldName.RESULTS_FIRST_POSTED.value: HarmonizedFieldName.RESULTS_FIRST_POSTED.value,
+}
+
+# Pipe-separated CSV fields parsed into lists
+_CSV_LIST_FIELDS: tuple[str, ...] = (
+    HarmonizedFieldName.CONDITIONS.value,
+    HarmonizedFieldName.INTERVENTIONS.value,
+    HarmonizedFieldName.COLLABORATORS.value,
+    HarmonizedFieldName.DOCUMENT_URLS.value,
+    HarmonizedFieldName.LOCATIONS.value,
+)
+
+# CSV date fields parsed from their free-form text
+_CSV_DATE_FIELDS: tuple[str, ...] = (
+    HarmonizedFieldName.START_DATE.value,
+    HarmonizedFieldName.PRIMARY_COMPLETION_DATE.value,
+    HarmonizedFieldName.COMPLETION_DATE.value,
+    HarmonizedFieldName.FIRST_POSTED.value,
+    HarmonizedFieldName.LAST_UPDATE_POSTED.value,
+)
+
+# Date formats seen in the CSV export, most common first
+_CSV_DATE_FORMATS: tuple[str, ...] = ("%B %d, %Y", "%Y-%m-%d", "%m/%d/%Y")
+
+
+def _csv_list_expr(column: str) -> pl.Expr:
+    """Split a pipe-separated CSV column into trimmed, non-blank entries."""
+    return (
+        pl.col(column)
+        .fill_null("")
+        .str.split("|")
+        .list.eval(pl.element().str.strip_chars())
+        .list.filter(pl.element() != "")
+    )
+
+
+def _csv_date_expr(column: str) -> pl.Expr:
+    """Parse a CSV date column with the first of ``_CSV_DATE_FORMATS`` that matches."""
+    return pl.coalesce(
+        pl.col(column).str.to_date(format=date_format, strict=False)
+        for date_format in _CSV_DATE_FORMATS
+    ).alias(column)
+
 
 def prepare_csv_df(csv_lf: pl.LazyFrame, nct_ids: NCTIdSet) -> pl.DataFrame:
     """
@@ -32,10 +112,7 @@ def prepare_csv_df(csv_lf: pl.LazyFrame, nct_ids: NCTIdSet) -> pl.DataFrame:
     """
     if not nct_ids:
         # Return empty DF with just the key column for join
-        return pl.DataFrame(
-            {HarmonizedFieldName.NCT_ID.value: []}, 
-            schema={HarmonizedFieldName.NCT_ID.value: pl.Utf8}
-        )
+        return pl.DataFrame({_NCT_ID: []}, schema={_NCT_ID: pl.Utf8})
     
     # Filter and collect CSV data
     csv_df = csv_lf.filter(
@@ -76,88 +153,39 @@ def prepare_json_df(json_dir: Path, nct_ids: NCTIdSet) -> pl.DataFrame:
 
 def _standardize_csv_columns(csv_df: pl.DataFrame) -> pl.DataFrame:
     """Standardize CSV column names and types efficiently."""
-    # Map CSV columns to harmonized names using enums for consistency
-    column_mapping = {
-        CSVFieldName.NCT_NUMBER.value: HarmonizedFieldName.NCT_ID.value,
-        CSVFieldName.STUDY_TITLE.value: HarmonizedFieldName.TITLE.value,
-        CSVFieldName.STUDY_URL.value: HarmonizedFieldName.STUDY_URL.value,
-        CSVFieldName.ACRONYM.value: HarmonizedFieldName.ACRONYM.value,
-        CSVFieldName.STUDY_STATUS.value: HarmonizedFieldName.OVERALL_STATUS.value,
-        CSVFieldName.STUDY_RESULTS.value: HarmonizedFieldName.HAS_RESULTS.value,
-        CSVFieldName.STUDY_TYPE.value: HarmonizedFieldName.STUDY_TYPE.value,
-        CSVFieldName.BRIEF_SUMMARY.value: HarmonizedFieldName.BRIEF_SUMMARY.value,
-        CSVFieldName.CONDITIONS.value: HarmonizedFieldName.CONDITIONS.value,
-        CSVFieldName.INTERVENTIONS.value: HarmonizedFieldName.INTERVENTIONS.value,
-        CSVFieldName.SPONSOR.value: HarmonizedFieldName.LEAD_SPONSOR.value,
-        CSVFieldName.COLLABORATORS.value: HarmonizedFieldName.COLLABORATORS.value,
-        CSVFieldName.SEX.value: HarmonizedFieldName.SEX.value,
-        CSVFieldName.AGE.value: HarmonizedFieldName.MINIMUM_AGE.value,
-        CSVFieldName.PHASES.value: HarmonizedFieldName.STUDY_PHASE.value,
-        CSVFieldName.ENROLLMENT.value: HarmonizedFieldName.ENROLLMENT.value,
-        CSVFieldName.START_DATE.value: HarmonizedFieldName.START_DATE.value,
-        CSVFieldName.PRIMARY_COMPLETION_DATE.value: HarmonizedFieldName.PRIMARY_COMPLETION_DATE.value,
-        CSVFieldName.COMPLETION_DATE.value: HarmonizedFieldName.COMPLETION_DATE.value,
-        CSVFieldName.FIRST_POSTED.value: HarmonizedFieldName.FIRST_POSTED.value,
-        CSVFieldName.LAST_UPDATE_POSTED.value: HarmonizedFieldName.LAST_UPDATE_POSTED.value,
-        CSVFieldName.STUDY_DOCUMENTS.value: HarmonizedFieldName.DOCUMENT_URLS.value,
-        CSVFieldName.LOCATIONS.value: HarmonizedFieldName.LOCATIONS.value,
-        # Outcome measures
-        CSVFieldName.PRIMARY_OUTCOME_MEASURES.value: HarmonizedFieldName.PRIMARY_OUTCOME_MEASURES.value,
-        CSVFieldName.SECONDARY_OUTCOME_MEASURES.value: HarmonizedFieldName.SECONDARY_OUTCOME_MEASURES.value,
-        CSVFieldName.OTHER_OUTCOME_MEASURES.value: HarmonizedFieldName.OTHER_OUTCOME_MEASURES.value,
-        # Additional study information  
-        CSVFieldName.FUNDER_TYPE.value: HarmonizedFieldName.FUNDER_TYPE.value,
-        CSVFieldName.STUDY_DESIGN.value: HarmonizedFieldName.STUDY_DESIGN.value,
-        CSVFieldName.OTHER_IDS.value: HarmonizedFieldName.OTHER_IDS.value,
-        CSVFieldName.RESULTS_FIRST_POSTED.value: HarmonizedFieldName.RESULTS_FIRST_POSTED.value,
-    }
-    
     # Rename columns that exist
-    existing_mappings = {k: v for k, v in column_mapping.items() if k in csv_df.columns}
+    existing_mappings = {k: v for k, v in _CSV_COLUMN_MAPPING.items() if k in csv_df.columns}
     df = csv_df.rename(existing_mappings)
     
     # Build and apply all transformations in a single, declarative expression
     return df.with_columns(
-        # Parse list fields from pipe-separated strings
+        # Parse list fields from pipe-separated strings, trimming entries and
+        # dropping blanks in the same vectorized pass; a missing value becomes
+        # "" and so an empty list, without a separate list-typed null fill
         *[
-            pl.col(field).str.split("|").fill_null([])
-            for field in [
-                HarmonizedFieldName.CONDITIONS.value,
-                HarmonizedFieldName.INTERVENTIONS.value,
-                HarmonizedFieldName.COLLABORATORS.value,
-                HarmonizedFieldName.DOCUMENT_URLS.value,
-                HarmonizedFieldName.LOCATIONS.value,
-            ]
+            _csv_list_expr(field)
+            for field in _CSV_LIST_FIELDS
             if field in df.columns
         ],
-        # Convert date fields with multiple format fallbacks
+        # Convert date fields, taking the first format that parses
         *[
-            pl.col(field)
-            .str.to_date(format="%B %d, %Y", strict=False)
-            .fill_null(pl.col(field).str.to_date(format="%Y-%m-%d", strict=False))
-            .fill_null(pl.col(field).str.to_date(format="%m/%d/%Y", strict=False))
-            for field in [
-                HarmonizedFieldName.START_DATE.value,
-                HarmonizedFieldName.PRIMARY_COMPLETION_DATE.value,
-                HarmonizedFieldName.COMPLETION_DATE.value,
-                HarmonizedFieldName.FIRST_POSTED.value,
-                HarmonizedFieldName.LAST_UPDATE_POSTED.value,
-            ]
+            _csv_date_expr(field)
+            for field in _CSV_DATE_FIELDS
             if field in df.columns
         ],
         # Convert boolean field
         *(
-            [pl.col(HarmonizedFieldName.HAS_RESULTS.value)
+            [pl.col(_HAS_RESULTS)
              .str.to_lowercase()
              .is_in(["yes", "true", "1"])]
-            if HarmonizedFieldName.HAS_RESULTS.value in df.columns
+            if _HAS_RESULTS in df.columns
             else []
         ),
         # Convert numeric field
         *(
-            [pl.col(HarmonizedFieldName.ENROLLMENT.value)
+            [pl.col(_ENROLLMENT)
              .cast(pl.Int64, strict=False)]
-            if HarmonizedFieldName.ENROLLMENT.value in df.columns
+            if _ENROLLMENT in df.columns
             else []
         ),
     )
@@ -169,23 +197,22 @@ def _load_and_flatten_json_records(json_dir: Path, nct_ids: NCTIdSet) -> list[JS
     
     def _process_file(nct_id: str) -> JSONRecord | None:
         json_path = json_dir / f"{nct_id}.json"
-        if not json_path.exists():
-            return None
         try:
-            with json_path.open('r', encoding='utf-8') as f:
-                json_data = json.load(f)
-            # Validate and parse using Pydantic model
-            record = ClinicalTrialJSONRecord(**json_data)
+            # Parse and validate straight from the file bytes
+            record = ClinicalTrialJSONRecord.from_json_bytes(json_path.read_bytes())
             return _flatten_json_record(nct_id, record)
         except (ValidationError, Exception) as e:
             logger.warning(f"Could not process JSON for {nct_id}: {e}")
             return None
 
+    # One directory listing instead of an existence check per requested ID
+    available_ids = _list_json_ids(json_dir)
+
     # Use parallel processing for better I/O performance
     with ThreadPoolExecutor(max_workers=8) as executor:
         future_to_id = {
             executor.submit(_process_file, nct_id): nct_id 
-            for nct_id in nct_ids
+            for nct_id in nct_ids & available_ids
         }
         for future in as_completed(future_to_id):
             result = future.result()
@@ -199,6 +226,19 @@ def _load_and_flatten_json_records(json_dir: Path, nct_ids: NCTIdSet) -> list[JS
     return records
 
 
+def _list_json_ids(json_dir: Path) -> NCTIdSet:
+    """Return the NCT IDs that have a ``<nct_id>.json`` file in the directory."""
+    try:
+        with os.scandir(json_dir) as entries:
+            return {
+                entry.name.removesuffix(".json")
+                for entry in entries
+                if entry.name.endswith(".json")
+            }
+    except FileNotFoundError:
+        return set()
+
+
 def _flatten_json_record(nct_id: str, record: ClinicalTrialJSONRecord) -> JSONRecord:
     """Flatten a validated JSON record into a single-level dictionary."""
     return {
@@ -0,0 +1,34 @@
+"""Sidecar storage for original study payloads, keyed by NCT ID."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Protocol
+
+
+class RawDataStore(Protocol):
+    """Read access to the original payload of a study, kept outside the models."""
+    
+    def get(self, nct_id: str) -> dict[str, Any] | None:
+        """Return the raw payload for ``nct_id``, or None when it is not stored."""
+        ...
+
+
+class JSONDirectoryRawStore:
+    """
+    Raw payloads served from the per-study ``<nct_id>.json`` download directory.
+    
+    The pipeline already keeps every original response on disk, so trials
+    hold only parsed fields and the payload is read back on demand.
+    """
+    
+    def __init__(self, json_dir: Path) -> None:
+        self.json_dir = json_dir
+    
+    def get(self, nct_id: str) -> dict[str, Any] | None:
+        """Load the stored payload, or None when no file exists for the study."""
+        json_path = self.json_dir / f"{nct_id}.json"
+        if not json_path.exists():
+            return None
+        return json.loads(json_path.read_bytes())
@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import TypeAlias
+from functools import lru_cache
+from typing import TypeAlias, TypeVar
 
 import polars as pl
 
-from clintrai.models.types import HarmonizedFieldName
+from clintrai.models.types import DataSource, HarmonizedFieldName
 
 # Type alias for output schema
 OutputSchema: TypeAlias = dict[str, pl.DataType]
 
+# Finalization works eagerly or as part of a lazy harmonization query
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+# Low-cardinality code columns are stored as dictionary codes rather than one
+# string per row, in memory and in the Parquet shards. Open-ended feed values
+# use Categorical; data_source is a closed set, so it gets a fixed Enum.
+CODE_DTYPE = pl.Categorical()
+DATA_SOURCE_DTYPE = pl.Enum([source.value for source in DataSource])
+
 # Define output schema for consistency
 OUTPUT_SCHEMA: OutputSchema = {
     HarmonizedFieldName.NCT_ID.value: pl.Utf8,
@@ -20,16 +30,16 @@ OUTPUT_SCHEMA: OutputSchema = {
     HarmonizedFieldName.BRIEF_TITLE.value: pl.Utf8,
     HarmonizedFieldName.STUDY_URL.value: pl.Utf8,
     HarmonizedFieldName.ACRONYM.value: pl.Utf8,
-    HarmonizedFieldName.OVERALL_STATUS.value: pl.Utf8,
-    HarmonizedFieldName.STUDY_TYPE.value: pl.Utf8,
-    HarmonizedFieldName.STUDY_PHASE.value: pl.Utf8,
+    HarmonizedFieldName.OVERALL_STATUS.value: CODE_DTYPE,
+    HarmonizedFieldName.STUDY_TYPE.value: CODE_DTYPE,
+    HarmonizedFieldName.STUDY_PHASE.value: CODE_DTYPE,
     HarmonizedFieldName.HAS_RESULTS.value: pl.Boolean,
     HarmonizedFieldName.BRIEF_SUMMARY.value: pl.Utf8,
     HarmonizedFieldName.DETAILED_DESCRIPTION.value: pl.Utf8,
     HarmonizedFieldName.CONDITIONS.value: pl.List(pl.Utf8),
     HarmonizedFieldName.INTERVENTIONS.value: pl.List(pl.Utf8),
     HarmonizedFieldName.CONDITION_MESHES.value: pl.List(pl.Utf8),
-    HarmonizedFieldName.SEX.value: pl.Utf8,
+    HarmonizedFieldName.SEX.value: CODE_DTYPE,
     HarmonizedFieldName.MINIMUM_AGE.value: pl.Utf8,
     HarmonizedFieldName.MAXIMUM_AGE.value: pl.Utf8,
     HarmonizedFieldName.HEALTHY_VOLUNTEERS.value: pl.Boolean,
@@ -44,21 +54,21 @@ OUTPUT_SCHEMA: OutputSchema = {
     HarmonizedFieldName.DOCUMENT_URLS.value: pl.List(pl.Utf8),
     HarmonizedFieldName.DOCUMENT_FILES.value: pl.List(pl.Utf8),
     HarmonizedFieldName.LOCATIONS.value: pl.List(pl.Utf8),
-    HarmonizedFieldName.DATA_SOURCE.value: pl.Utf8,
+    HarmonizedFieldName.DATA_SOURCE.value: DATA_SOURCE_DTYPE,
     HarmonizedFieldName.SHARD_HASH.value: pl.UInt64,
     HarmonizedFieldName.PROCESSING_TIMESTAMP.value: pl.Datetime,
 }
 
 
-def finalize_and_enforce_schema(df: pl.DataFrame) -> pl.DataFrame:
+def finalize_and_enforce_schema(df: FrameT) -> FrameT:
     """
     Add metadata and enforce the final output schema.
     
     Args:
-        df: DataFrame to finalize
+        df: DataFrame or LazyFrame to finalize
         
     Returns:
-        DataFrame with enforced schema and metadata
+        Frame of the same kind with enforced schema and metadata
     """
     # Add metadata using native polars operations
     df_with_metadata = df.with_columns([
@@ -76,20 +86,26 @@ def finalize_and_enforce_schema(df: pl.DataFrame) -> pl.DataFrame:
     return _enforce_output_schema(df_with_metadata)
 
 
-def _enforce_output_schema(df: pl.DataFrame) -> pl.DataFrame:
+def _enforce_output_schema(df: FrameT) -> FrameT:
     """
     Enforce the output schema on the final DataFrame using idiomatic Polars.
     
     Args:
-        df: DataFrame to enforce schema on
+        df: DataFrame or LazyFrame to enforce schema on
         
     Returns:
-        DataFrame with correct schema and column order
+        Frame with correct schema and column order
     """
+    return df.select(_output_select(frozenset(df.collect_schema().names())))
+
+
+@lru_cache(maxsize=8)
+def _output_select(columns: frozenset[str]) -> tuple[pl.Expr, ...]:
+    """Build the schema-enforcing select for one set of input columns."""
     select_expressions = []
     
     for col_name, col_type in OUTPUT_SCHEMA.items():
-        if col_name in df.columns:
+        if col_name in columns:
             # If the column exists, cast it to the correct type
             expression = pl.col(col_name).cast(col_type)
         else:
@@ -99,4 +115,4 @@ def _enforce_output_schema(df: pl.DataFrame) -> pl.DataFrame:
             
         select_expressions.append(expression.alias(col_name))
         
-    return df.select(select_expressions)
\ No newline at end of file
+    return tuple(select_expressions)
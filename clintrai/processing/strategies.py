@@ -6,23 +6,48 @@ import polars as pl
 
 from clintrai.models.types import HarmonizedFieldName, JSONSourceField
 
+# Column names, resolved from the enums once at import
+_TITLE = HarmonizedFieldName.TITLE.value
+_OFFICIAL_TITLE = HarmonizedFieldName.OFFICIAL_TITLE.value
+_BRIEF_TITLE = HarmonizedFieldName.BRIEF_TITLE.value
+_OVERALL_STATUS = HarmonizedFieldName.OVERALL_STATUS.value
+_STUDY_TYPE = HarmonizedFieldName.STUDY_TYPE.value
+_BRIEF_SUMMARY = HarmonizedFieldName.BRIEF_SUMMARY.value
+_DETAILED_DESCRIPTION = HarmonizedFieldName.DETAILED_DESCRIPTION.value
+_CONDITIONS = HarmonizedFieldName.CONDITIONS.value
+_INTERVENTIONS = HarmonizedFieldName.INTERVENTIONS.value
+_CONDITION_MESHES = HarmonizedFieldName.CONDITION_MESHES.value
+_SEX = HarmonizedFieldName.SEX.value
+_ENROLLMENT = HarmonizedFieldName.ENROLLMENT.value
+_HAS_RESULTS = HarmonizedFieldName.HAS_RESULTS.value
 
-def _create_coalesce_expression(primary_col: str, fallback_col: str, output_col: str) -> pl.Expr:
+_JSON_OFFICIAL_TITLE = JSONSourceField.JSON_OFFICIAL_TITLE.value
+_JSON_BRIEF_TITLE = JSONSourceField.JSON_BRIEF_TITLE.value
+_JSON_OVERALL_STATUS = JSONSourceField.JSON_OVERALL_STATUS.value
+_JSON_STUDY_TYPE = JSONSourceField.JSON_STUDY_TYPE.value
+_JSON_BRIEF_SUMMARY = JSONSourceField.JSON_BRIEF_SUMMARY.value
+_JSON_DETAILED_DESCRIPTION = JSONSourceField.JSON_DETAILED_DESCRIPTION.value
+_JSON_CONDITIONS = JSONSourceField.JSON_CONDITIONS.value
+_JSON_INTERVENTIONS = JSONSourceField.JSON_INTERVENTIONS.value
+_JSON_CONDITION_MESHES = JSONSourceField.JSON_CONDITION_MESHES.value
+_JSON_SEX = JSONSourceField.JSON_SEX.value
+_JSON_ENROLLMENT = JSONSourceField.JSON_ENROLLMENT.value
+_JSON_HAS_RESULTS = JSONSourceField.JSON_HAS_RESULTS.value
+
+
+def _create_coalesce_expression(primary: pl.Expr, fallback: pl.Expr, output_col: str) -> pl.Expr:
     """
     Create a Polars expression for simple coalescing with priority.
     
     Args:
-        primary_col: Column name to prioritize
-        fallback_col: Column name to use if primary is null
+        primary: Column expression to prioritize
+        fallback: Column expression to use if primary is null
         output_col: Name for the output column
         
     Returns:
         Polars expression for coalescing
     """
-    return pl.coalesce([
-        pl.col(primary_col),
-        pl.col(fallback_col)
-    ]).alias(output_col)
+    return pl.coalesce([primary, fallback]).alias(output_col)
 
 
 def _create_merged_list_expression(
@@ -67,221 +92,227 @@ def _create_preservation_expression(source_col: str, preserved_alias: str) -> pl
     return pl.col(source_col).alias(preserved_alias)
 
 
-def apply_json_priority_coalescing(df: pl.DataFrame) -> pl.DataFrame:
+def apply_json_priority_coalescing(lf: pl.LazyFrame) -> pl.LazyFrame:
     """
     Apply coalescing logic to prioritize JSON data over CSV data.
     
     Args:
-        df: DataFrame with both CSV and JSON columns
+        lf: LazyFrame with both CSV and JSON columns
         
     Returns:
-        DataFrame with JSON-prioritized coalesced columns
+        LazyFrame with JSON-prioritized coalesced columns
     """
-    return df.with_columns([
+    # Shared by both title expressions, built once
+    title = pl.col(_TITLE)
+    return lf.with_columns([
         _create_coalesce_expression(
-            JSONSourceField.JSON_OFFICIAL_TITLE.value,
-            HarmonizedFieldName.TITLE.value,
-            HarmonizedFieldName.OFFICIAL_TITLE.value
+            pl.col(_JSON_OFFICIAL_TITLE),
+            title,
+            _OFFICIAL_TITLE
         ),
         _create_coalesce_expression(
-            JSONSourceField.JSON_BRIEF_TITLE.value,
-            HarmonizedFieldName.TITLE.value,
-            HarmonizedFieldName.BRIEF_TITLE.value
+            pl.col(_JSON_BRIEF_TITLE),
+            title,
+            _BRIEF_TITLE
         ),
         _create_coalesce_expression(
-            JSONSourceField.JSON_OVERALL_STATUS.value,
-            HarmonizedFieldName.OVERALL_STATUS.value,
-            HarmonizedFieldName.OVERALL_STATUS.value
+            pl.col(_JSON_OVERALL_STATUS),
+            pl.col(_OVERALL_STATUS),
+            _OVERALL_STATUS
         ),
         _create_coalesce_expression(
-            JSONSourceField.JSON_STUDY_TYPE.value,
-            HarmonizedFieldName.STUDY_TYPE.value,
-            HarmonizedFieldName.STUDY_TYPE.value
+            pl.col(_JSON_STUDY_TYPE),
+            pl.col(_STUDY_TYPE),
+            _STUDY_TYPE
         ),
         _create_coalesce_expression(
-            JSONSourceField.JSON_BRIEF_SUMMARY.value,
-            HarmonizedFieldName.BRIEF_SUMMARY.value,
-            HarmonizedFieldName.BRIEF_SUMMARY.value
+            pl.col(_JSON_BRIEF_SUMMARY),
+            pl.col(_BRIEF_SUMMARY),
+            _BRIEF_SUMMARY
         ),
-        pl.col(JSONSourceField.JSON_DETAILED_DESCRIPTION.value)
-        .alias(HarmonizedFieldName.DETAILED_DESCRIPTION.value),
+        pl.col(_JSON_DETAILED_DESCRIPTION)
+        .alias(_DETAILED_DESCRIPTION),
         _create_coalesce_expression(
-            JSONSourceField.JSON_CONDITIONS.value,
-            HarmonizedFieldName.CONDITIONS.value,
-            HarmonizedFieldName.CONDITIONS.value
+            pl.col(_JSON_CONDITIONS),
+            pl.col(_CONDITIONS),
+            _CONDITIONS
         ),
         _create_coalesce_expression(
-            JSONSourceField.JSON_INTERVENTIONS.value,
-            HarmonizedFieldName.INTERVENTIONS.value,
-            HarmonizedFieldName.INTERVENTIONS.value
+            pl.col(_JSON_INTERVENTIONS),
+            pl.col(_INTERVENTIONS),
+            _INTERVENTIONS
         ),
-        pl.col(JSONSourceField.JSON_CONDITION_MESHES.value)
-        .alias(HarmonizedFieldName.CONDITION_MESHES.value),
+        pl.col(_JSON_CONDITION_MESHES)
+        .alias(_CONDITION_MESHES),
         _create_coalesce_expression(
-            JSONSourceField.JSON_SEX.value,
-            HarmonizedFieldName.SEX.value,
-            HarmonizedFieldName.SEX.value
+            pl.col(_JSON_SEX),
+            pl.col(_SEX),
+            _SEX
         ),
         _create_coalesce_expression(
-            JSONSourceField.JSON_ENROLLMENT.value,
-            HarmonizedFieldName.ENROLLMENT.value,
-            HarmonizedFieldName.ENROLLMENT.value
+            pl.col(_JSON_ENROLLMENT),
+            pl.col(_ENROLLMENT),
+            _ENROLLMENT
         ),
-        pl.col(JSONSourceField.JSON_HAS_RESULTS.value)
-        .alias(HarmonizedFieldName.HAS_RESULTS.value),
+        pl.col(_JSON_HAS_RESULTS)
+        .alias(_HAS_RESULTS),
     ])
 
 
-def apply_csv_priority_coalescing(df: pl.DataFrame) -> pl.DataFrame:
+def apply_csv_priority_coalescing(lf: pl.LazyFrame) -> pl.LazyFrame:
     """
     Apply coalescing logic to prioritize CSV data over JSON data.
     
     Args:
-        df: DataFrame with both CSV and JSON columns
+        lf: LazyFrame with both CSV and JSON columns
         
     Returns:
-        DataFrame with CSV-prioritized coalesced columns
+        LazyFrame with CSV-prioritized coalesced columns
     """
-    return df.with_columns([
+    # Shared by both title expressions, built once
+    title = pl.col(_TITLE)
+    return lf.with_columns([
         _create_coalesce_expression(
-            HarmonizedFieldName.TITLE.value,
-            JSONSourceField.JSON_OFFICIAL_TITLE.value,
-            HarmonizedFieldName.OFFICIAL_TITLE.value
+            title,
+            pl.col(_JSON_OFFICIAL_TITLE),
+            _OFFICIAL_TITLE
         ),
         _create_coalesce_expression(
-            HarmonizedFieldName.TITLE.value,
-            JSONSourceField.JSON_BRIEF_TITLE.value,
-            HarmonizedFieldName.BRIEF_TITLE.value
+            title,
+            pl.col(_JSON_BRIEF_TITLE),
+            _BRIEF_TITLE
         ),
         _create_coalesce_expression(
-            HarmonizedFieldName.OVERALL_STATUS.value,
-            JSONSourceField.JSON_OVERALL_STATUS.value,
-            HarmonizedFieldName.OVERALL_STATUS.value
+            pl.col(_OVERALL_STATUS),
+            pl.col(_JSON_OVERALL_STATUS),
+            _OVERALL_STATUS
         ),
         _create_coalesce_expression(
-            HarmonizedFieldName.STUDY_TYPE.value,
-            JSONSourceField.JSON_STUDY_TYPE.value,
-            HarmonizedFieldName.STUDY_TYPE.value
+            pl.col(_STUDY_TYPE),
+            pl.col(_JSON_STUDY_TYPE),
+            _STUDY_TYPE
         ),
         _create_coalesce_expression(
-            HarmonizedFieldName.BRIEF_SUMMARY.value,
-            JSONSourceField.JSON_BRIEF_SUMMARY.value,
-            HarmonizedFieldName.BRIEF_SUMMARY.value
+            pl.col(_BRIEF_SUMMARY),
+            pl.col(_JSON_BRIEF_SUMMARY),
+            _BRIEF_SUMMARY
         ),
-        pl.col(JSONSourceField.JSON_DETAILED_DESCRIPTION.value)
-        .alias(HarmonizedFieldName.DETAILED_DESCRIPTION.value),
+        pl.col(_JSON_DETAILED_DESCRIPTION)
+        .alias(_DETAILED_DESCRIPTION),
         _create_coalesce_expression(
-            HarmonizedFieldName.CONDITIONS.value,
-            JSONSourceField.JSON_CONDITIONS.value,
-            HarmonizedFieldName.CONDITIONS.value
+            pl.col(_CONDITIONS),
+            pl.col(_JSON_CONDITIONS),
+            _CONDITIONS
         ),
         _create_coalesce_expression(
-            HarmonizedFieldName.INTERVENTIONS.value,
-            JSONSourceField.JSON_INTERVENTIONS.value,
-            HarmonizedFieldName.INTERVENTIONS.value
+            pl.col(_INTERVENTIONS),
+            pl.col(_JSON_INTERVENTIONS),
+            _INTERVENTIONS
         ),
-        pl.col(JSONSourceField.JSON_CONDITION_MESHES.value)
-        .alias(HarmonizedFieldName.CONDITION_MESHES.value),
+        pl.col(_JSON_CONDITION_MESHES)
+        .alias(_CONDITION_MESHES),
         _create_coalesce_expression(
-            HarmonizedFieldName.SEX.value,
-            JSONSourceField.JSON_SEX.value,
-            HarmonizedFieldName.SEX.value
+            pl.col(_SEX),
+            pl.col(_JSON_SEX),
+            _SEX
         ),
         _create_coalesce_expression(
-            HarmonizedFieldName.ENROLLMENT.value,
-            JSONSourceField.JSON_ENROLLMENT.value,
-            HarmonizedFieldName.ENROLLMENT.value
+            pl.col(_ENROLLMENT),
+            pl.col(_JSON_ENROLLMENT),
+            _ENROLLMENT
         ),
-        pl.col(JSONSourceField.JSON_HAS_RESULTS.value)
-        .alias(HarmonizedFieldName.HAS_RESULTS.value),
+        pl.col(_JSON_HAS_RESULTS)
+        .alias(_HAS_RESULTS),
     ])
 
 
-def apply_merge_coalescing(df: pl.DataFrame) -> pl.DataFrame:
+def apply_merge_coalescing(lf: pl.LazyFrame) -> pl.LazyFrame:
     """
     Apply coalescing logic to merge and preserve data from both sources.
     
     Args:
-        df: DataFrame with both CSV and JSON columns
+        lf: LazyFrame with both CSV and JSON columns
         
     Returns:
-        DataFrame with merged data preserving information from both sources
+        LazyFrame with merged data preserving information from both sources
     """
-    return df.with_columns([
+    # Shared by both title expressions, built once
+    title = pl.col(_TITLE)
+    return lf.with_columns([
         # Create combined titles - preserve both when available
         _create_coalesce_expression(
-            JSONSourceField.JSON_OFFICIAL_TITLE.value,
-            HarmonizedFieldName.TITLE.value,
-            HarmonizedFieldName.OFFICIAL_TITLE.value
+            pl.col(_JSON_OFFICIAL_TITLE),
+            title,
+            _OFFICIAL_TITLE
         ),
         _create_coalesce_expression(
-            JSONSourceField.JSON_BRIEF_TITLE.value,
-            HarmonizedFieldName.TITLE.value,
-            HarmonizedFieldName.BRIEF_TITLE.value
+            pl.col(_JSON_BRIEF_TITLE),
+            title,
+            _BRIEF_TITLE
         ),
         
         # Keep separate CSV and JSON specific fields for research
-        _create_preservation_expression(HarmonizedFieldName.TITLE.value, "csv_title"),
-        _create_preservation_expression(JSONSourceField.JSON_OFFICIAL_TITLE.value, "json_official_title_preserved"),
-        _create_preservation_expression(JSONSourceField.JSON_BRIEF_TITLE.value, "json_brief_title_preserved"),
+        _create_preservation_expression(_TITLE, "csv_title"),
+        _create_preservation_expression(_JSON_OFFICIAL_TITLE, "json_official_title_preserved"),
+        _create_preservation_expression(_JSON_BRIEF_TITLE, "json_brief_title_preserved"),
         
         # Merge status information with JSON priority but preserve CSV
         _create_coalesce_expression(
-            JSONSourceField.JSON_OVERALL_STATUS.value,
-            HarmonizedFieldName.OVERALL_STATUS.value,
-            HarmonizedFieldName.OVERALL_STATUS.value
+            pl.col(_JSON_OVERALL_STATUS),
+            pl.col(_OVERALL_STATUS),
+            _OVERALL_STATUS
         ),
-        _create_preservation_expression(HarmonizedFieldName.OVERALL_STATUS.value, "csv_overall_status"),
+        _create_preservation_expression(_OVERALL_STATUS, "csv_overall_status"),
         
         # Merge study type with JSON priority
         _create_coalesce_expression(
-            JSONSourceField.JSON_STUDY_TYPE.value,
-            HarmonizedFieldName.STUDY_TYPE.value,
-            HarmonizedFieldName.STUDY_TYPE.value
+            pl.col(_JSON_STUDY_TYPE),
+            pl.col(_STUDY_TYPE),
+            _STUDY_TYPE
         ),
         
         # Merge summaries - JSON detailed description is unique
         _create_coalesce_expression(
-            JSONSourceField.JSON_BRIEF_SUMMARY.value,
-            HarmonizedFieldName.BRIEF_SUMMARY.value,
-            HarmonizedFieldName.BRIEF_SUMMARY.value
+            pl.col(_JSON_BRIEF_SUMMARY),
+            pl.col(_BRIEF_SUMMARY),
+            _BRIEF_SUMMARY
         ),
-        pl.col(JSONSourceField.JSON_DETAILED_DESCRIPTION.value)
-        .alias(HarmonizedFieldName.DETAILED_DESCRIPTION.value),
+        pl.col(_JSON_DETAILED_DESCRIPTION)
+        .alias(_DETAILED_DESCRIPTION),
         
         # Merge conditions and interventions - combine lists when both exist
         _create_merged_list_expression(
-            JSONSourceField.JSON_CONDITIONS.value,
-            HarmonizedFieldName.CONDITIONS.value,
-            HarmonizedFieldName.CONDITIONS.value
+            _JSON_CONDITIONS,
+            _CONDITIONS,
+            _CONDITIONS
         ),
         _create_merged_list_expression(
-            JSONSourceField.JSON_INTERVENTIONS.value,
-            HarmonizedFieldName.INTERVENTIONS.value,
-            HarmonizedFieldName.INTERVENTIONS.value
+            _JSON_INTERVENTIONS,
+            _INTERVENTIONS,
+            _INTERVENTIONS
         ),
         
         # Keep JSON-only enriched data
-        pl.col(JSONSourceField.JSON_CONDITION_MESHES.value)
-        .alias(HarmonizedFieldName.CONDITION_MESHES.value),
+        pl.col(_JSON_CONDITION_MESHES)
+        .alias(_CONDITION_MESHES),
         
         # Demographics - merge with JSON priority but preserve CSV
         _create_coalesce_expression(
-            JSONSourceField.JSON_SEX.value,
-            HarmonizedFieldName.SEX.value,
-            HarmonizedFieldName.SEX.value
+            pl.col(_JSON_SEX),
+            pl.col(_SEX),
+            _SEX
         ),
-        _create_preservation_expression(HarmonizedFieldName.SEX.value, "csv_sex"),
+        _create_preservation_expression(_SEX, "csv_sex"),
         
         # Enrollment - JSON priority but preserve both
         _create_coalesce_expression(
-            JSONSourceField.JSON_ENROLLMENT.value,
-            HarmonizedFieldName.ENROLLMENT.value,
-            HarmonizedFieldName.ENROLLMENT.value
+            pl.col(_JSON_ENROLLMENT),
+            pl.col(_ENROLLMENT),
+            _ENROLLMENT
         ),
-        _create_preservation_expression(HarmonizedFieldName.ENROLLMENT.value, "csv_enrollment"),
+        _create_preservation_expression(_ENROLLMENT, "csv_enrollment"),
         
         # Results availability
-        pl.col(JSONSourceField.JSON_HAS_RESULTS.value)
-        .alias(HarmonizedFieldName.HAS_RESULTS.value),
+        pl.col(_JSON_HAS_RESULTS)
+        .alias(_HAS_RESULTS),
     ])
\ No newline at end of file
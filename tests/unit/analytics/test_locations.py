@@ -0,0 +1,64 @@
+"""Tests for the columnar trial locations view."""
+
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from clintrai.analytics.locations import LATITUDE, LOCATIONS_SCHEMA, LONGITUDE, locations_frame
+from clintrai.models.trial import ClinicalTrial, Location, StudyInfo
+from clintrai.models.types import StudyStatus
+
+
+def _trial(nct_id: str, locations: list[Location]) -> ClinicalTrial:
+    return ClinicalTrial.model_construct(
+        study_info=StudyInfo.model_construct(nct_id=nct_id), locations=locations
+    )
+
+
+def test_locations_frame_has_one_row_per_site():
+    """Sites from every trial become typed columns keyed by NCT ID."""
+    trials = [
+        _trial(
+            "NCT1",
+            [
+                Location(facility="A", city="Boston", country="United States",
+                         status=StudyStatus.RECRUITING, latitude=42.36, longitude=-71.06),
+                Location(facility="B", city="Lahore", country="Pakistan"),
+            ],
+        ),
+        _trial("NCT2", []),
+        _trial("NCT3", [Location(facility="C", city="Austin", country="United States")]),
+    ]
+
+    df = locations_frame(trials)
+
+    assert df.schema == pl.Schema(LOCATIONS_SCHEMA)
+    assert df["nct_id"].to_list() == ["NCT1", "NCT1", "NCT3"]
+    assert df["status"].to_list() == [StudyStatus.RECRUITING.value, None, None]
+    assert df["latitude_e7"].to_list() == [423_600_000, None, None]
+    assert dict(df["country"].cast(pl.Utf8).value_counts().iter_rows()) == {
+        "United States": 2,
+        "Pakistan": 1,
+    }
+
+
+def test_coordinates_round_trip_through_fixed_point(tmp_path):
+    """Quantized coordinates decode back to the source degrees at 1e-7 precision."""
+    df = locations_frame(
+        [_trial("NCT1", [Location(facility="A", city="X", country="Y",
+                                   latitude=-33.8688197, longitude=179.9999999)])]
+    )
+
+    df.write_parquet(tmp_path / "locations.parquet")
+    decoded = pl.read_parquet(tmp_path / "locations.parquet").select(LATITUDE, LONGITUDE)
+
+    assert decoded.row(0) == pytest.approx((-33.8688197, 179.9999999), abs=1e-9)
+
+
+def test_locations_frame_without_trials():
+    """No trials yields an empty frame with the full schema."""
+    df = locations_frame([])
+
+    assert df.height == 0
+    assert df.schema == pl.Schema(LOCATIONS_SCHEMA)
@@ -0,0 +1,46 @@
+"""Tests for study endpoint response parsing."""
+
+import httpx
+import pytest
+
+from clintrai.api import studies
+from clintrai.models.api_models import Study
+
+
+class StubHTTPClient:
+    """HTTP client stub that answers every request with a fixed JSON body."""
+
+    def __init__(self, body):
+        self.body = body
+
+    async def get(self, url, *, params=None, headers=None, timeout=None) -> httpx.Response:
+        """Return the canned body."""
+        return httpx.Response(200, json=self.body)
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+@pytest.mark.asyncio
+async def test_fetch_study_validates_raw_body():
+    """Test that a study is validated from the response bytes."""
+    body = {
+        "protocolSection": {"identificationModule": {"nctId": "NCT04619758"}},
+        "hasResults": False,
+    }
+
+    study = await studies.fetch_study(StubHTTPClient(body), "NCT04619758")
+
+    assert isinstance(study, Study)
+    assert study == Study.model_validate(body)
+
+
+@pytest.mark.asyncio
+async def test_get_enums_validates_list_body():
+    """Test that list responses validate in one call into typed models."""
+    body = [{"type": "Status", "values": [{"value": "RECRUITING"}], "pieces": ["OverallStatus"]}]
+
+    enums = await studies.get_enums(StubHTTPClient(body))
+
+    assert [enum_def.type for enum_def in enums] == ["Status"]
+    assert enums[0].values[0].value == "RECRUITING"
@@ -0,0 +1,69 @@
+"""Tests for streaming embeddings to Parquet."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("sentence_transformers")
+
+from clintrai.metaflow.embeddings import stream_embeddings_to_parquet  # noqa: E402
+
+
+class _FakeModel:
+    """Deterministic stand-in for a SentenceTransformer."""
+
+    def __init__(self, dimension: int = 4, fail_after: int | None = None):
+        self.dimension = dimension
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def encode(self, texts, **kwargs):
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise RuntimeError("encode failed")
+        return np.full((len(texts), self.dimension), float(self.calls), dtype=np.float32)
+
+
+def test_stream_round_trip(tmp_path):
+    """Every row is written once with a fixed-size float32 vector."""
+    output_path = tmp_path / "embeddings.parquet"
+    texts = [f"text {i}" for i in range(5)]
+    nct_ids = [f"NCT{i}" for i in range(5)]
+
+    dimension = stream_embeddings_to_parquet(
+        _FakeModel(), texts, nct_ids, output_path, batch_size=2
+    )
+
+    df = pl.read_parquet(output_path)
+    assert dimension == 4
+    assert df["nct_id"].to_list() == nct_ids
+    assert df.schema["embedding"] == pl.Array(pl.Float32, 4)
+    assert not output_path.with_name("embeddings.parquet.tmp").exists()
+
+
+def test_stream_failure_leaves_no_file(tmp_path):
+    """A mid-stream failure removes the partial output instead of publishing it."""
+    output_path = tmp_path / "embeddings.parquet"
+    texts = [f"text {i}" for i in range(6)]
+
+    with pytest.raises(RuntimeError):
+        stream_embeddings_to_parquet(
+            _FakeModel(fail_after=1), texts, texts, output_path, batch_size=2
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stream_empty_writes_schema_only_file(tmp_path):
+    """No texts still produces a readable zero-row file."""
+    output_path = tmp_path / "embeddings.parquet"
+
+    dimension = stream_embeddings_to_parquet(_FakeModel(), [], [], output_path)
+
+    df = pl.read_parquet(output_path)
+    assert dimension == 0
+    assert df.height == 0
+    assert df.columns == ["nct_id", "embedding"]
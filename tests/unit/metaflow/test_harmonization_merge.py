@@ -0,0 +1,54 @@
+"""Tests for partitioned CSV/JSON merging in harmonization."""
+
+from __future__ import annotations
+
+import polars as pl
+
+from clintrai.metaflow.harmonization import _merge_partitions
+from clintrai.models.types import HarmonizedFieldName, JSONSourceField
+
+NCT_ID = HarmonizedFieldName.NCT_ID.value
+TITLE = HarmonizedFieldName.TITLE.value
+JSON_NCT_ID = JSONSourceField.JSON_NCT_ID.value
+JSON_TITLE = JSONSourceField.JSON_OFFICIAL_TITLE.value
+
+
+def _outer_join(csv_df: pl.DataFrame, json_df: pl.DataFrame) -> pl.DataFrame:
+    """Reference result: full outer join with a coalesced key."""
+    return csv_df.join(
+        json_df, left_on=NCT_ID, right_on=JSON_NCT_ID, how="full", coalesce=True
+    )
+
+
+def test_merge_matches_outer_join():
+    """Single-source and shared IDs should all survive with their columns."""
+    csv_df = pl.DataFrame({NCT_ID: ["NCT1", "NCT2"], TITLE: ["csv 1", "csv 2"]})
+    json_df = pl.DataFrame({JSON_NCT_ID: ["NCT2", "NCT3"], JSON_TITLE: ["json 2", "json 3"]})
+
+    merged = _merge_partitions(csv_df, json_df).sort(NCT_ID)
+
+    assert merged.to_dicts() == _outer_join(csv_df, json_df).sort(NCT_ID).to_dicts()
+
+
+def test_merge_keeps_csv_row_when_json_record_failed_to_load():
+    """An ID listed in both sources but missing from the loaded JSON frame keeps its CSV row."""
+    # NCT2 had a JSON file, but it failed validation and was dropped by prepare_json_df
+    csv_df = pl.DataFrame({NCT_ID: ["NCT1", "NCT2", "NCT3"], TITLE: ["a", "b", "c"]})
+    json_df = pl.DataFrame({JSON_NCT_ID: ["NCT3", "NCT4"], JSON_TITLE: ["jc", "jd"]})
+
+    merged = _merge_partitions(csv_df, json_df).sort(NCT_ID)
+
+    assert merged[NCT_ID].to_list() == ["NCT1", "NCT2", "NCT3", "NCT4"]
+    row = merged.filter(pl.col(NCT_ID) == "NCT2").row(0, named=True)
+    assert row[TITLE] == "b"
+    assert row[JSON_TITLE] is None
+
+
+def test_merge_with_empty_json_frame():
+    """An empty JSON frame (nothing to load) should pass every CSV row through."""
+    csv_df = pl.DataFrame({NCT_ID: ["NCT1"], TITLE: ["a"]})
+    json_df = pl.DataFrame({JSON_NCT_ID: []}, schema={JSON_NCT_ID: pl.Utf8})
+
+    merged = _merge_partitions(csv_df, json_df)
+
+    assert merged[NCT_ID].to_list() == ["NCT1"]
@@ -0,0 +1,122 @@
+"""Tests for shard-level NLP feature extraction."""
+
+from __future__ import annotations
+
+import polars as pl
+import pytest
+import spacy
+
+from clintrai.metaflow.nlp_processing import (
+    NLP_FEATURES_DTYPE,
+    combine_nlp_results,
+    create_empty_nlp_dataframe,
+    process_shard,
+    summarize_nlp_features,
+)
+
+TEXT_COLUMNS = ["title", "brief_summary"]
+
+
+@pytest.fixture(scope="module")
+def nlp_model():
+    """Tokenizer-only pipeline; no model download needed."""
+    return spacy.blank("en")
+
+
+def _write_shard(path, rows):
+    pl.DataFrame(
+        rows, schema={"nct_id": pl.Utf8, "title": pl.Utf8, "brief_summary": pl.Utf8}
+    ).write_parquet(path)
+    return path
+
+
+def test_feature_columns_are_arrow_typed(tmp_path, nlp_model):
+    """Features use the declared list-of-struct dtypes and survive a Parquet round trip."""
+    shard = _write_shard(
+        tmp_path / "shard.parquet",
+        {
+            "nct_id": ["NCT1", "NCT2"],
+            "title": ["Trial", "Pain study"],
+            "brief_summary": ["Aspirin reduces pain pain", "Adults with pain"],
+        },
+    )
+
+    nlp_df = process_shard(shard, TEXT_COLUMNS, nlp_model, set())
+
+    expected = {"nct_id": pl.Utf8, **dict(NLP_FEATURES_DTYPE.to_schema())}
+    assert dict(nlp_df.schema) == expected
+    assert nlp_df.schema == create_empty_nlp_dataframe().schema
+
+    nlp_df.write_parquet(tmp_path / "features.parquet")
+    assert pl.read_parquet(tmp_path / "features.parquet").equals(nlp_df)
+    assert nlp_df["top_words"][0].to_list()[0] == {"word": "pain", "count": 2}
+
+
+def test_blank_rows_get_zeroed_features(tmp_path, nlp_model):
+    """Null and whitespace-only texts skip spaCy but keep their row, in order, across slices."""
+    shard = _write_shard(
+        tmp_path / "shard.parquet",
+        {
+            "nct_id": ["NCT1", "NCT2", "NCT3", "NCT4"],
+            "title": [None, "  ", "Aspirin", None],
+            "brief_summary": [None, "\t", "reduces pain", "Adults"],
+        },
+    )
+
+    nlp_df = process_shard(shard, TEXT_COLUMNS, nlp_model, set(), slice_rows=3)
+
+    assert nlp_df["nct_id"].to_list() == ["NCT1", "NCT2", "NCT3", "NCT4"]
+    assert nlp_df["token_count"].to_list() == [0, 0, 3, 1]
+    assert nlp_df["top_words"][1].to_list() == []
+
+
+def test_empty_shard_returns_empty_frame(tmp_path, nlp_model):
+    """A shard with no rows yields an empty frame with the full feature schema."""
+    shard = _write_shard(
+        tmp_path / "shard.parquet", {"nct_id": [], "title": [], "brief_summary": []}
+    )
+
+    nlp_df = process_shard(shard, TEXT_COLUMNS, nlp_model, set())
+
+    assert nlp_df.height == 0
+    assert nlp_df.schema == create_empty_nlp_dataframe().schema
+
+
+def _features(token_counts, diversities):
+    df = create_empty_nlp_dataframe()
+    rows = pl.DataFrame(
+        {
+            "nct_id": [f"NCT{i}" for i in range(len(token_counts))],
+            "token_count": token_counts,
+            "unique_tokens": token_counts,
+            "lexical_diversity": diversities,
+            "entity_count": [1] * len(token_counts),
+        }
+    )
+    return pl.concat([df, rows], how="diagonal_relaxed")
+
+
+def test_combine_weights_means_by_shard_size():
+    """Shard partials are combined per row, not averaged per shard."""
+    small = _features([10], [1.0])
+    large = _features([1, 1, 1], [0.0, 0.0, 0.0])
+    summaries = [summarize_nlp_features(df) for df in (small, large)]
+
+    combined_df, stats = combine_nlp_results([small, large], shard_summaries=summaries)
+
+    assert combined_df.height == 4
+    assert stats["total_processed"] == 4
+    assert stats["avg_token_count"] == pytest.approx(13 / 4)
+    assert stats["avg_lexical_diversity"] == pytest.approx(0.25)
+    assert stats["total_unique_entities"] == 4
+    # Partials computed on the fly give the same answer
+    assert combine_nlp_results([small, large])[1] == stats
+
+
+def test_combine_with_no_shards():
+    """No shards gives an empty frame and zeroed statistics."""
+    combined_df, stats = combine_nlp_results([])
+
+    assert combined_df.height == 0
+    assert stats["total_processed"] == 0
+    assert stats["avg_token_count"] == 0
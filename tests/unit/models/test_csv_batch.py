@@ -0,0 +1,69 @@
+"""Tests for columnar CSV batches."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+from clintrai.models.csv_batch import ClinicalTrialCSVBatch
+from clintrai.models.csv_models import ClinicalTrialCSVRecord
+from clintrai.models.types import StudyStatus
+
+
+def _frame(**overrides):
+    data = {
+        "NCT Number": ["nct01234567", "NCT07654321"],
+        "Study Status": ["COMPLETED", "  "],
+        "Conditions": ["Asthma|COPD", ""],
+        "Start Date": ["2012-04", None],
+    }
+    data.update(overrides)
+    return pl.DataFrame(data)
+
+
+class TestClinicalTrialCSVBatch:
+    """Test cases for ClinicalTrialCSVBatch."""
+    
+    def test_vectorized_normalization(self):
+        """Test that NCT numbers are uppercased and blanks become null column-wide."""
+        batch = ClinicalTrialCSVBatch(_frame())
+        
+        assert len(batch) == 2
+        assert batch.frame["NCT Number"].to_list() == ["NCT01234567", "NCT07654321"]
+        assert batch.frame["Study Status"].to_list() == ["COMPLETED", None]
+        assert batch.frame["Conditions"].to_list() == ["Asthma|COPD", None]
+    
+    def test_rows_materialize_as_records(self):
+        """Test that indexing and iteration build the same records as the model."""
+        batch = ClinicalTrialCSVBatch(_frame())
+        
+        record = batch[0]
+        assert isinstance(record, ClinicalTrialCSVRecord)
+        assert record.study_status == StudyStatus.COMPLETED
+        assert record.conditions_list == ["Asthma", "COPD"]
+        assert [r.nct_number for r in batch] == ["NCT01234567", "NCT07654321"]
+    
+    def test_invalid_nct_numbers_report_rows(self):
+        """Test that bad identifiers are rejected with their row positions."""
+        with pytest.raises(ValueError, match=r"rows \[1\]"):
+            ClinicalTrialCSVBatch(_frame(**{"NCT Number": ["NCT01234567", "ABC"]}))
+    
+    def test_read_csv(self, tmp_path):
+        """Test loading a CSV export keeps every column as text."""
+        path = tmp_path / "ctg-studies.csv"
+        path.write_text("NCT Number,Enrollment\nNCT01234567,23\n")
+        
+        batch = ClinicalTrialCSVBatch.read_csv(str(path))
+        
+        assert batch.frame.schema["Enrollment"] == pl.Utf8
+        assert batch[0].enrollment == 23
+    
+    def test_parsed_lists_and_dates(self):
+        """Test that list columns are split and dates parsed, with flexible layouts as fallback."""
+        batch = ClinicalTrialCSVBatch(
+            _frame(**{"Start Date": ["2012-04", "March 5, 2020"], "Conditions": ["Asthma| COPD |", None]})
+        )
+        
+        assert batch.parsed["Conditions"].to_list() == [["Asthma", "COPD"], []]
+        assert batch.parsed["Start Date"].to_list() == [date(2012, 4, 1), date(2020, 3, 5)]
+        assert batch.parsed["Start Date"].to_list() == [r.start_date for r in batch]
@@ -7,8 +7,11 @@ from pydantic import ValidationError
 from clintrai.models.csv_models import (
     ClinicalTrialCSVRecord,
     HarmonizedClinicalTrial,
+    StrictClinicalTrialCSVRecord,
     DocumentReference,
-    DataHarmonizationStats
+    DataHarmonizationStats,
+    parse_flexible_date,
+    validate_csv_records,
 )
 from clintrai.models.types import (
     DataSource, DocumentSource, DocumentType, StudyStatus, StudyType, 
@@ -16,6 +19,45 @@ from clintrai.models.types import (
 )
 
 
+class TestParseFlexibleDate:
+    """Test cases for parse_flexible_date."""
+    
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2022-01-20", date(2022, 1, 20)),
+            ("2012-04", date(2012, 4, 1)),
+            ("2020/03/04", date(2020, 3, 4)),
+            ("01/02/2020", date(2020, 1, 2)),
+            ("December 14, 2015", date(2015, 12, 14)),
+            ("December  14,\t2015", date(2015, 12, 14)),
+            ("14-Dec-2015", date(2015, 12, 14)),
+            ("  2022-01-20  ", date(2022, 1, 20)),
+        ],
+    )
+    def test_supported_formats(self, value, expected):
+        """Test each supported date layout."""
+        assert parse_flexible_date(value) == expected
+    
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            "",
+            "   ",
+            "not a date",
+            "2020-02-30",
+            "Smarch 1, 2020",
+            "2022-W01-1",
+            "2012-4",
+            "\u0662\u0660\u0662\u0660-01-01",  # Arabic-Indic digits
+        ],
+    )
+    def test_unparseable_values_return_none(self, value):
+        """Test that missing, malformed and out-of-range dates become None."""
+        assert parse_flexible_date(value) is None
+
+
 class TestClinicalTrialCSVRecord:
     """Test cases for ClinicalTrialCSVRecord model."""
     
@@ -132,6 +174,30 @@ class TestClinicalTrialCSVRecord:
         ]
         assert urls == expected_urls
     
+    def test_strings_are_stripped(self):
+        """Test that surrounding whitespace is removed from string fields."""
+        record = ClinicalTrialCSVRecord(**{"NCT Number": " nct01234567 ", "Study Title": "  Iron study\t", "Sponsor": " "})
+        
+        assert record.nct_number == "NCT01234567"
+        assert record.study_title == "Iron study"
+        assert record.sponsor is None
+    
+    def test_study_url_requires_http_scheme(self):
+        """Test that study_url is kept as a string and checked by scheme only."""
+        record = ClinicalTrialCSVRecord(nct_number="NCT01234567", study_url="https://clinicaltrials.gov/study/NCT01234567")
+        assert record.study_url == "https://clinicaltrials.gov/study/NCT01234567"
+        
+        with pytest.raises(ValidationError):
+            ClinicalTrialCSVRecord(nct_number="NCT01234567", study_url="clinicaltrials.gov/study/NCT01234567")
+    
+    def test_strict_record_parses_study_url(self):
+        """Test that the strict variant still applies full URL validation."""
+        record = StrictClinicalTrialCSVRecord(nct_number="NCT01234567", study_url="https://clinicaltrials.gov/study/NCT01234567")
+        assert record.study_url.host == "clinicaltrials.gov"
+        
+        with pytest.raises(ValidationError):
+            StrictClinicalTrialCSVRecord(nct_number="NCT01234567", study_url="https://")
+    
     def test_empty_study_documents(self):
         """Test handling of empty study documents field."""
         record = ClinicalTrialCSVRecord(nct_number="NCT01234567")
@@ -144,6 +210,32 @@ class TestClinicalTrialCSVRecord:
         assert record.document_urls == []
 
 
+class TestValidateCSVRecords:
+    """Test cases for bulk CSV row validation."""
+    
+    def test_matches_per_row_construction(self):
+        """Test that bulk validation yields the same records as the constructor."""
+        rows = [
+            {"NCT Number": "nct00000001", "Study Status": "COMPLETED", "Start Date": "2012-04"},
+            {"NCT Number": "NCT00000002", "Conditions": "Asthma|COPD", "Acronym": ""},
+        ]
+        
+        records = validate_csv_records(rows)
+        
+        assert records == [ClinicalTrialCSVRecord(**row) for row in rows]
+        assert records[0].nct_number == "NCT00000001"
+        assert records[1].conditions_list == ["Asthma", "COPD"]
+    
+    def test_error_location_includes_row_index(self):
+        """Test that a bad row is reported by its position."""
+        rows = [{"NCT Number": "NCT00000001"}, {"NCT Number": "ABC123"}]
+        
+        with pytest.raises(ValidationError) as exc_info:
+            validate_csv_records(rows)
+        
+        assert exc_info.value.errors()[0]["loc"][0] == 1
+
+
 class TestHarmonizedClinicalTrial:
     """Test cases for HarmonizedClinicalTrial model."""
     
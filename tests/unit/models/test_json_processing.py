@@ -1,12 +1,26 @@
 """Tests for JSON clinical trial data processing and validation."""
 
 import json
+import subprocess
+import sys
+import warnings
 import pytest
+from datetime import date, datetime
 from pathlib import Path
+from typing import get_args
+
+from pydantic import ValidationError
 
 from clintrai.processing.preparation import _flatten_json_record
-from clintrai.models.json_models import ClinicalTrialJSONRecord
-from clintrai.models.types import StudyStatus, StudyType, Sex, StudyPhase
+from clintrai.models.json_models import ClinicalTrialJSONRecord, DesignModule, validate_records_json
+from clintrai.models.trial import (
+    ClinicalTrial, TrustedClinicalTrial, batch_timestamp, dump_trial, dump_trial_json,
+    dump_trials_json, validate_trials, StudyDesign, WhoMaskedFlag,
+)
+from clintrai.models.types import (
+    Sex, SexValue, StudyPhase, StudyPhaseValue, StudyStatus, StudyStatusValue,
+    StudyType, StudyTypeValue,
+)
 
 
 class TestJSONModels:
@@ -103,7 +117,7 @@ class TestJSONModels:
         assert "Department of Pediatric Medicine" in record.detailed_description
         
         # Test conditions and interventions
-        assert record.conditions == ["Weight Gain"]
+        assert record.conditions == ("Weight Gain",)
         assert len(record.interventions) == 1
         assert record.interventions[0] == "Emollient (sunflower oil)"
         
@@ -156,15 +170,247 @@ class TestJSONModels:
         # Test that missing fields are None or empty lists
         assert record.official_title is None
         assert record.overall_status is None
-        assert record.conditions == []
-        assert record.interventions == []
-        assert record.mesh_terms == []
-        assert record.document_files == []
+        assert record.conditions == ()
+        assert record.interventions == ()
+        assert record.mesh_terms == ()
+        assert record.document_files == ()
         
         # Test missing dates
         assert record.start_date is None
         assert record.completion_date is None
     
+    def test_from_json_bytes_matches_dict_validation(self, sample_json_data):
+        """Test that parsing raw JSON gives the same record as validating the dict."""
+        raw = json.dumps(sample_json_data).encode()
+        
+        record = ClinicalTrialJSONRecord.from_json_bytes(raw)
+        
+        assert record == ClinicalTrialJSONRecord(**sample_json_data)
+        assert record.nct_id == "NCT04619758"
+    
+    def test_validate_records_json_batch(self, sample_json_data):
+        """Test that a JSON array validates in one call and errors carry the index."""
+        second = {"protocolSection": {"identificationModule": {"nctId": "NCT99999999"}}}
+        
+        records = validate_records_json(json.dumps([sample_json_data, second]))
+        
+        assert [record.nct_id for record in records] == ["NCT04619758", "NCT99999999"]
+        assert records[0] == ClinicalTrialJSONRecord(**sample_json_data)
+        
+        with pytest.raises(ValidationError) as exc_info:
+            validate_records_json(b'[{}, {"hasResults": "maybe"}]')
+        assert exc_info.value.errors()[0]["loc"][:2] == (1, "hasResults")
+    
+    def test_low_cardinality_codes_are_interned(self):
+        """Test that repeated location and sponsor codes share one string object."""
+        records = [
+            ClinicalTrialJSONRecord(**json.loads(json.dumps({
+                "protocolSection": {
+                    "identificationModule": {"nctId": f"NCT0000000{i}"},
+                    "sponsorCollaboratorsModule": {"leadSponsor": {"name": "NIH", "class": "NIH"}},
+                    "contactsLocationsModule": {"locations": [{"country": "United States"}]},
+                }
+            })))
+            for i in range(2)
+        ]
+        
+        first, second = (record.protocol_section for record in records)
+        assert (
+            first.contacts_locations_module.locations[0].country
+            is second.contacts_locations_module.locations[0].country
+        )
+        assert first.sponsor_collaborators_module.lead_sponsor.class_ is second.sponsor_collaborators_module.lead_sponsor.class_
+    
+    def test_absent_lists_share_empty_tuple(self, sample_json_data):
+        """Test that absent list fields reuse one empty tuple and dumps round-trip."""
+        first = ClinicalTrialJSONRecord(**sample_json_data)
+        second = ClinicalTrialJSONRecord(**sample_json_data)
+        
+        assert first.protocol_section.conditions_module.keywords
+        assert first.protocol_section.identification_module.secondary_id_infos == ()
+        assert (
+            first.protocol_section.identification_module.secondary_id_infos
+            is second.protocol_section.identification_module.secondary_id_infos
+        )
+        assert ClinicalTrialJSONRecord.model_validate(first.model_dump()) == first
+    
+    def test_only_free_text_is_stripped(self):
+        """Test that titles and summaries are trimmed while codes are kept verbatim."""
+        record = ClinicalTrialJSONRecord(
+            protocolSection={
+                "identificationModule": {"nctId": "NCT12345678", "briefTitle": "  Title \n"},
+                "descriptionModule": {"briefSummary": "\tSummary "},
+                "designModule": {"studyType": "INTERVENTIONAL"},
+            }
+        )
+        
+        assert record.brief_title == "Title"
+        assert record.brief_summary == "Summary"
+        assert record.study_type == "INTERVENTIONAL"
+    
+    def test_location_geo_point_validates_on_access(self):
+        """Test that site coordinates are kept raw until read, then validated."""
+        record = ClinicalTrialJSONRecord(
+            protocolSection={
+                "identificationModule": {"nctId": "NCT12345678"},
+                "contactsLocationsModule": {
+                    "locations": [
+                        {"city": "Boston", "geoPoint": {"lat": "42.36", "lon": -71.06}},
+                        {"city": "Lahore"},
+                    ]
+                },
+            }
+        )
+        boston, lahore = record.protocol_section.contacts_locations_module.locations
+        
+        assert boston.geo_point_raw == {"lat": "42.36", "lon": -71.06}
+        assert boston.geo_point.lat == 42.36
+        assert boston.geo_point is boston.geo_point
+        assert lahore.geo_point is None
+    
+    def test_json_record_is_read_only(self, sample_json_data):
+        """Test that parsed records reject assignment but still cache derived views."""
+        record = ClinicalTrialJSONRecord(**sample_json_data)
+        
+        with pytest.raises(ValidationError):
+            record.has_results = False
+        with pytest.raises(ValidationError):
+            record.protocol_section.identification_module.nct_id = "NCT00000000"
+        assert record.nct_id == record.nct_id == "NCT04619758"
+    
+    def test_clinical_trial_from_json_record(self, sample_json_data):
+        """Test that the trusted conversion yields a trial that validates unchanged."""
+        record = ClinicalTrialJSONRecord(**sample_json_data)
+        
+        trial = ClinicalTrial.from_json_record(record)
+        
+        assert trial.study_info.nct_id == "NCT04619758"
+        assert trial.study_status == StudyStatus.COMPLETED
+        assert trial.study_phase == StudyPhase.NA
+        assert trial.start_date == date(2018, 1, 1)
+        assert trial.eligibility.gender == Sex.ALL
+        assert ClinicalTrial.model_validate(trial.model_dump()) == trial
+    
+    def test_clinical_trial_from_json_record_requires_core_fields(self):
+        """Test that missing required fields still raise a validation error."""
+        record = ClinicalTrialJSONRecord(
+            protocolSection={"identificationModule": {"nctId": "NCT99999999"}}
+        )
+        
+        with pytest.raises(ValidationError):
+            ClinicalTrial.from_json_record(record)
+
+    def test_clinical_trial_json_dump_uses_iso_strings(self, sample_json_data):
+        """Test that dates, datetimes and UUIDs serialize to ISO / canonical strings."""
+        trial = ClinicalTrial.from_json_record(ClinicalTrialJSONRecord(**sample_json_data))
+
+        dumped = json.loads(trial.model_dump_json())
+
+        assert dumped["id"] == str(trial.id)
+        assert dumped["start_date"] == "2018-01-01"
+        assert dumped["data_downloaded_at"] == trial.data_downloaded_at.isoformat()
+
+    def test_trial_urls_are_parsed_once(self, sample_json_data):
+        """Test that repeated URLs share one parsed value and bad URLs still fail."""
+        data = ClinicalTrial.from_json_record(ClinicalTrialJSONRecord(**sample_json_data)).model_dump()
+        data["see_also_links"] = ["https://example.org/trial"] * 2
+        
+        first = ClinicalTrial.model_validate(data)
+        second = ClinicalTrial.model_validate(data)
+        
+        assert str(first.see_also_links[0]) == "https://example.org/trial"
+        assert first.see_also_links[0] is second.see_also_links[1]
+        with pytest.raises(ValidationError) as exc_info:
+            ClinicalTrial.model_validate({**data, "source_url": "ftp://example.org"})
+        assert exc_info.value.errors()[0]["loc"] == ("source_url",)
+    
+    def test_fast_dumps_match_model_dump(self, sample_json_data):
+        """Test that the direct serializer helpers match the model_dump methods."""
+        trial = ClinicalTrial.from_json_record(ClinicalTrialJSONRecord(**sample_json_data))
+        
+        assert dump_trial(trial) == trial.model_dump()
+        assert dump_trial_json(trial) == trial.model_dump_json().encode()
+    
+    def test_trusted_trial_keeps_urls_as_strings(self, sample_json_data):
+        """Test that the trusted variant skips URL parsing but still checks the scheme."""
+        data = ClinicalTrial.from_json_record(ClinicalTrialJSONRecord(**sample_json_data)).model_dump()
+        data["source_url"] = "https://clinicaltrials.gov/study/NCT04619758"
+        
+        trial = TrustedClinicalTrial.model_validate(data)
+        
+        assert trial.source_url == "https://clinicaltrials.gov/study/NCT04619758"
+        assert json.loads(trial.model_dump_json())["source_url"] == data["source_url"]
+        with pytest.raises(ValidationError):
+            TrustedClinicalTrial.model_validate({**data, "see_also_links": ["ftp://example.org"]})
+    
+    def test_trusted_trial_dumps_with_its_own_schema(self, sample_json_data):
+        """Test that the export helpers serialize trusted trials without serializer warnings."""
+        data = ClinicalTrial.from_json_record(ClinicalTrialJSONRecord(**sample_json_data)).model_dump()
+        trial = TrustedClinicalTrial.model_validate(
+            {**data, "source_url": "https://clinicaltrials.gov/study/NCT04619758"}
+        )
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert dump_trial(trial) == trial.model_dump()
+            assert dump_trial_json(trial) == trial.model_dump_json().encode()
+            assert json.loads(dump_trials_json([trial])) == [
+                json.loads(trial.model_dump_json(exclude_none=True))
+            ]
+    
+    def test_trial_export_collections_share_empty_tuple(self, sample_json_data):
+        """Test that unset export-only collections reuse the empty tuple singleton."""
+        first = ClinicalTrial.from_json_record(ClinicalTrialJSONRecord(**sample_json_data))
+        second = ClinicalTrial.model_validate(first.model_dump())
+        
+        assert first.references == ()
+        assert first.references is second.references is second.see_also_links
+        assert first.keywords == ("Emollient Low birth weight Preterm Weight Length.",)
+    
+    def test_batch_timestamp_is_shared(self, sample_json_data):
+        """Test that trials built in a batch share its download time, and only there."""
+        record = ClinicalTrialJSONRecord(**sample_json_data)
+        stamp = datetime(2024, 5, 1, 12, 0)
+        
+        with batch_timestamp(stamp) as active:
+            trials = [ClinicalTrial.from_json_record(record) for _ in range(2)]
+        after = ClinicalTrial.from_json_record(record)
+        
+        assert active is stamp
+        assert all(trial.data_downloaded_at is stamp for trial in trials)
+        assert after.data_downloaded_at > stamp
+    
+    def test_who_masked_packs_into_bits(self):
+        """Test that masked parties pack into a bitmask and unpack to canonical names."""
+        design = StudyDesign(who_masked=["Participant", "OUTCOMES_ASSESSOR", "Unknown"])
+        
+        assert design.who_masked_bits == WhoMaskedFlag.PARTICIPANT | WhoMaskedFlag.OUTCOMES_ASSESSOR
+        assert WhoMaskedFlag(design.who_masked_bits).names() == ["PARTICIPANT", "OUTCOMES_ASSESSOR"]
+        assert StudyDesign().who_masked_bits == 0
+        assert StudyDesign.model_validate(design.model_dump()) == design
+    
+    def test_validate_trials_batch(self, sample_json_data):
+        """Test that many trial dicts validate in one call with indexed errors."""
+        trial = ClinicalTrial.from_json_record(ClinicalTrialJSONRecord(**sample_json_data))
+        rows = [trial.model_dump(), trial.model_dump()]
+        
+        assert validate_trials(rows) == [trial, trial]
+        with pytest.raises(ValidationError) as exc_info:
+            validate_trials([rows[0], {**rows[1], "study_type": "bogus"}])
+        assert exc_info.value.errors()[0]["loc"][:2] == (1, "study_type")
+    
+    def test_dump_trials_json_matches_per_trial_dumps(self, sample_json_data):
+        """Test that the batch dump equals a list of individual JSON dumps."""
+        trials = [
+            ClinicalTrial.from_json_record(ClinicalTrialJSONRecord(**sample_json_data))
+            for _ in range(2)
+        ]
+        
+        dumped = json.loads(dump_trials_json(trials))
+        
+        assert dumped == [json.loads(t.model_dump_json(exclude_none=True)) for t in trials]
+        assert "acronym" not in dumped[0]["study_info"]
+    
     def test_flatten_json_record_with_pydantic_model(self, sample_json_data):
         """Test flattening with validated Pydantic model."""
         record = ClinicalTrialJSONRecord(**sample_json_data)
@@ -186,7 +432,7 @@ class TestJSONModels:
         assert "Department of Pediatric Medicine" in flattened["json_detailed_description"]
         
         # Test conditions and interventions
-        assert flattened["json_conditions"] == ["Weight Gain"]
+        assert flattened["json_conditions"] == ("Weight Gain",)
         assert len(flattened["json_interventions"]) == 1
         assert flattened["json_interventions"][0] == "Emollient (sunflower oil)"
         
@@ -234,7 +480,7 @@ class TestJSONModels:
         record = ClinicalTrialJSONRecord(**data_with_interventions)
         
         # Should extract only interventions with names
-        expected_interventions = ["Drug A", "Drug B", "Surgery", "Behavioral Intervention"]
+        expected_interventions = ("Drug A", "Drug B", "Surgery", "Behavioral Intervention")
         assert record.interventions == expected_interventions
     
     def test_mesh_terms_extraction(self):
@@ -259,7 +505,7 @@ class TestJSONModels:
         record = ClinicalTrialJSONRecord(**data_with_mesh)
         
         # Should extract only terms that exist
-        expected_terms = ["Diabetes", "Hypertension", "Heart Disease"]
+        expected_terms = ("Diabetes", "Hypertension", "Heart Disease")
         assert record.mesh_terms == expected_terms
     
     def test_document_files_extraction(self):
@@ -284,7 +530,7 @@ class TestJSONModels:
         record = ClinicalTrialJSONRecord(**data_with_docs)
         
         # Should extract only filenames that exist
-        expected_files = ["protocol.pdf", "consent_form.pdf", "appendix.docx"]
+        expected_files = ("protocol.pdf", "consent_form.pdf", "appendix.docx")
         assert record.document_files == expected_files
     
     def test_empty_lists_and_nulls(self):
@@ -308,13 +554,13 @@ class TestJSONModels:
         record = ClinicalTrialJSONRecord(**data_with_empties)
         
         # Test that empty lists are preserved as empty lists
-        assert record.conditions == []
-        assert record.interventions == []
-        assert record.mesh_terms == []
-        assert record.document_files == []
+        assert record.conditions == ()
+        assert record.interventions == ()
+        assert record.mesh_terms == ()
+        assert record.document_files == ()
         
         # Test that None values become empty lists where expected
-        assert record.phases == []
+        assert record.phases == ()
     
     def test_phase_mapping_validation(self):
         """Test that phase mapping works correctly."""
@@ -331,8 +577,40 @@ class TestJSONModels:
         record = ClinicalTrialJSONRecord(**data_with_phases)
         
         # Test phase mapping
-        expected_phases = [StudyPhase.PHASE_1, StudyPhase.PHASE_2, StudyPhase.PHASE_3, StudyPhase.NA]
+        expected_phases = (StudyPhase.PHASE_1, StudyPhase.PHASE_2, StudyPhase.PHASE_3, StudyPhase.NA)
         assert record.phases == expected_phases
+    
+    def test_phases_revalidate_as_plain_values(self):
+        """Test that raw, enum and dumped phase inputs all store canonical strings."""
+        raw = DesignModule(phases=["Phase 1", StudyPhase.PHASE_2, "bogus"])
+        
+        assert raw.phases == ("PHASE_1", "PHASE_2", "NA")
+        assert all(type(phase) is str for phase in raw.phases)
+        assert DesignModule.model_validate(raw.model_dump()) == raw
+
+
+@pytest.mark.parametrize(
+    "literal, enum",
+    [
+        (StudyStatusValue, StudyStatus),
+        (StudyTypeValue, StudyType),
+        (StudyPhaseValue, StudyPhase),
+        (SexValue, Sex),
+    ],
+)
+def test_literal_values_match_enums(literal, enum):
+    """The Literal validation types must accept exactly the enum values."""
+    assert set(get_args(literal)) == {member.value for member in enum}
+
+
+def test_json_models_import_does_not_load_trial_models():
+    """Importing json_models alone leaves trial.py unloaded until it is used."""
+    code = (
+        "import sys, clintrai.models.json_models, clintrai.models as models; "
+        "assert 'clintrai.models.trial' not in sys.modules; "
+        "assert models.ClinicalTrial.__module__ == 'clintrai.models.trial'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
 
 
 class TestRealJSONFiles:
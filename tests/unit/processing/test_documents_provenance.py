@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 from pathlib import Path
 
 import httpx
 import polars as pl
+import pyarrow.parquet as pq
 import pytest
 
 from clintrai.models.types import HarmonizedFieldName
@@ -43,9 +45,9 @@ async def test_process_document_downloads_writes_snapshot_and_provenance(tmp_pat
 
     assert stats["total_documents"] == 1
     assert stats["downloaded"] == 1
-    assert len(records) == 1
+    assert records.height == 1
 
-    record = records[0]
+    record = records.row(0, named=True)
     expected_hash = hashlib.sha256(content).hexdigest()
 
     assert record["source_snapshot_id"] == "snapshot-001"
@@ -106,7 +108,7 @@ async def test_process_document_downloads_no_docs_writes_snapshot(tmp_path):
         snapshot_id="snapshot-empty",
     )
 
-    assert records == []
+    assert records.is_empty()
     assert stats["total_documents"] == 0
 
     snapshot_path = output_dir / "source_snapshot.parquet"
@@ -143,7 +145,7 @@ async def test_skipped_documents_keep_hash_without_new_fetch_timestamp(tmp_path,
         output_dir=output_dir,
         snapshot_id="snapshot-first",
     )
-    assert first_records[0]["status"] == "downloaded"
+    assert first_records["status"][0] == "downloaded"
 
     second_records, _ = await documents_module.process_document_downloads(
         harmonized_df=harmonized_df,
@@ -152,7 +154,7 @@ async def test_skipped_documents_keep_hash_without_new_fetch_timestamp(tmp_path,
     )
 
     expected_hash = hashlib.sha256(content).hexdigest()
-    skipped_record = second_records[0]
+    skipped_record = second_records.row(0, named=True)
 
     assert skipped_record["status"] == "skipped"
     assert skipped_record["source_snapshot_id"] == "snapshot-second"
@@ -160,3 +162,396 @@ async def test_skipped_documents_keep_hash_without_new_fetch_timestamp(tmp_path,
     assert skipped_record["source_fetched_at"] is None
     assert skipped_record["raw_artifact_path"] is not None
     assert Path(skipped_record["raw_artifact_path"]).exists()
+
+
+@pytest.mark.asyncio
+async def test_download_documents_share_one_client(tmp_path):
+    """All documents in a run should be fetched through a single pooled client."""
+    clients: list[httpx.AsyncClient] = []
+
+    def _counting_client_factory() -> httpx.AsyncClient:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=request.url.path.encode()))
+        clients.append(httpx.AsyncClient(transport=transport))
+        return clients[-1]
+
+    documents = [
+        {"nct_id": "NCT00000004", "url": f"https://example.com/doc_{index}.pdf", "filename": f"doc_{index}.pdf"}
+        for index in range(5)
+    ]
+
+    records, stats = await documents_module.download_documents(
+        pl.DataFrame(documents),
+        tmp_path / "documents",
+        _counting_client_factory,
+        max_concurrent=2,
+    )
+
+    assert records.schema == pl.Schema(documents_module.DOCUMENT_SCHEMA)
+    assert len(clients) == 1
+    assert clients[0].is_closed
+    assert stats["downloaded"] == 5
+    assert records["file_size"].to_list() == [len(f"/doc_{index}.pdf") for index in range(5)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("declare_length", [True, False])
+async def test_oversize_download_is_abandoned_without_leftovers(tmp_path, declare_length):
+    """Oversize documents should fail whether or not the server declares a Content-Length."""
+    chunk = b"x" * (256 * 1024)
+
+    async def _body():
+        for _ in range(8):
+            yield chunk
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if declare_length:
+            return httpx.Response(200, content=chunk * 8)
+        return httpx.Response(200, content=_body())
+
+    documents = [{"nct_id": "NCT00000005", "url": "https://example.com/big.pdf", "filename": "big.pdf"}]
+
+    records, stats = await documents_module.download_documents(
+        pl.DataFrame(documents),
+        tmp_path / "documents",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        max_size_mb=1,
+    )
+
+    assert stats["failed"] == 1
+    assert records["error"][0].startswith("File too large")
+    assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+
+@pytest.mark.asyncio
+async def test_download_documents_bound_concurrency_and_keep_order(tmp_path):
+    """At most max_concurrent downloads run at once, and results keep input order."""
+    in_flight = 0
+    peak = 0
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return httpx.Response(200, content=request.url.path.encode())
+
+    documents = [
+        {"nct_id": "NCT00000006", "url": f"https://example.com/doc_{index}.pdf", "filename": f"doc_{index}.pdf"}
+        for index in range(12)
+    ]
+
+    records, stats = await documents_module.download_documents(
+        pl.DataFrame(documents),
+        tmp_path / "documents",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        max_concurrent=3,
+    )
+
+    assert peak == 3
+    assert stats["downloaded"] == 12
+    assert records["filename"].to_list() == [doc["filename"] for doc in documents]
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried(tmp_path, monkeypatch):
+    """A 503 followed by success should still download the document."""
+    monkeypatch.setattr(documents_module, "_RETRY_BASE_DELAY_SECONDS", 0.0)
+    responses = iter([
+        httpx.Response(503, headers={"Retry-After": "0"}),
+        httpx.ConnectError("reset"),
+        httpx.Response(200, content=b"%PDF-1.7 retried"),
+    ])
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    documents = [{"nct_id": "NCT00000007", "url": "https://example.com/flaky.pdf", "filename": "flaky.pdf"}]
+
+    records, stats = await documents_module.download_documents(
+        pl.DataFrame(documents),
+        tmp_path / "documents",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+
+    assert stats["downloaded"] == 1
+    assert records["file_size"][0] == len(b"%PDF-1.7 retried")
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_repeated_host_failures(tmp_path, monkeypatch):
+    """Once a host keeps failing, later documents for it fail fast without requests."""
+    monkeypatch.setattr(documents_module, "_RETRY_BASE_DELAY_SECONDS", 0.0)
+    requests_seen: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request.url.path)
+        return httpx.Response(502)
+
+    documents = [
+        {"nct_id": "NCT00000008", "url": f"https://down.example.com/doc_{index}.pdf", "filename": f"doc_{index}.pdf"}
+        for index in range(7)
+    ]
+
+    records, stats = await documents_module.download_documents(
+        pl.DataFrame(documents),
+        tmp_path / "documents",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        max_concurrent=1,
+    )
+
+    assert stats["failed"] == 7
+    assert records["error"].to_list() == ["HTTP 502"] * 5 + ["Circuit open for down.example.com"] * 2
+    assert len(requests_seen) == 5 * documents_module._RETRY_ATTEMPTS
+
+
+def test_host_circuit_half_opens_after_timeout(monkeypatch):
+    """An open circuit lets one trial request through after the reset timeout."""
+    now = 100.0
+    monkeypatch.setattr(documents_module.time, "monotonic", lambda: now)
+    circuit = documents_module.HostCircuit(failure_threshold=1, reset_timeout=10.0)
+
+    circuit.record_failure()
+    assert not circuit.allow_request()
+
+    now += 10.0
+    assert circuit.allow_request()
+    assert not circuit.allow_request()
+
+    circuit.record_success()
+    assert circuit.state is documents_module.CircuitState.CLOSED
+
+
+def test_extract_document_info_parses_type_url_and_filename():
+    """Document strings split into type, URL and filename the way urlparse would."""
+    harmonized_df = pl.DataFrame(
+        {
+            HarmonizedFieldName.NCT_ID.value: ["NCT00000009", "NCT00000010", "NCT00000011"],
+            HarmonizedFieldName.DOCUMENT_URLS.value: [
+                [
+                    "Study Protocol, https://cdn.example.com/docs/Prot_000.pdf",
+                    "SAP, https://example.com/a/b/?download=/c.pdf#page=2",
+                ],
+                [],
+                ["  https://example.com/dir/  ", "ICF, http://example.com"],
+            ],
+        }
+    )
+
+    documents = documents_module.extract_document_info(harmonized_df, "snapshot-parse")
+
+    assert documents.select("nct_id", "document_type", "url", "filename").rows() == [
+        ("NCT00000009", "Study Protocol", "https://cdn.example.com/docs/Prot_000.pdf", "Prot_000.pdf"),
+        ("NCT00000009", "SAP", "https://example.com/a/b/?download=/c.pdf#page=2", "b"),
+        ("NCT00000011", "Unknown Document", "https://example.com/dir/", "dir"),
+        ("NCT00000011", "ICF", "http://example.com", "unknown_document.pdf"),
+    ]
+    assert documents.schema == pl.Schema(documents_module.DOCUMENT_SCHEMA)
+    assert set(documents["status"]) == {"pending"}
+    assert set(documents["source_snapshot_id"]) == {"snapshot-parse"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server_etag", ['"v1"', '"v2"'])
+async def test_partial_download_resumes_while_etag_matches(tmp_path, server_etag):
+    """A partial file with a recorded ETag is resumed with Range, or refetched if the document changed."""
+    content = b"%PDF-1.7 " + b"x" * 1000
+    output_dir = tmp_path / "documents"
+    partial_path = output_dir / "NCT00000014" / "doc.pdf.part"
+    partial_path.parent.mkdir(parents=True)
+    partial_path.write_bytes(content[:400])
+    partial_path.with_name("doc.pdf.part.etag").write_text('"v1"')
+    range_requests: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        range_requests.append(request.headers.get("Range"))
+        if request.headers.get("If-Range") == server_etag:
+            return httpx.Response(
+                206,
+                content=content[400:],
+                headers={"ETag": server_etag, "Content-Range": f"bytes 400-{len(content) - 1}/{len(content)}"},
+            )
+        return httpx.Response(200, content=content, headers={"ETag": server_etag})
+
+    documents = [{"nct_id": "NCT00000014", "url": "https://example.com/doc.pdf", "filename": "doc.pdf"}]
+
+    records, stats = await documents_module.download_documents(
+        pl.DataFrame(documents),
+        output_dir,
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+
+    assert stats["downloaded"] == 1
+    assert range_requests == ["bytes=400-"]
+    assert Path(records["local_path"][0]).read_bytes() == content
+    assert records["source_content_sha256"][0] == hashlib.sha256(content).hexdigest()
+    assert sorted(path.name for path in partial_path.parent.iterdir()) == ["doc.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_complete_leftover_partial_is_refetched(tmp_path):
+    """A leftover partial already holding the whole body is dropped on 416 and fetched afresh."""
+    content = b"%PDF-1.7 " + b"x" * 1000
+    output_dir = tmp_path / "documents"
+    partial_path = output_dir / "NCT00000016" / "doc.pdf.part"
+    partial_path.parent.mkdir(parents=True)
+    partial_path.write_bytes(content)
+    partial_path.with_name("doc.pdf.part.etag").write_text('"v1"')
+    range_requests: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        range_requests.append(request.headers.get("Range"))
+        if request.headers.get("Range"):
+            return httpx.Response(416, headers={"Content-Range": f"bytes */{len(content)}"})
+        return httpx.Response(200, content=content, headers={"ETag": '"v1"'})
+
+    documents = [{"nct_id": "NCT00000016", "url": "https://example.com/doc.pdf", "filename": "doc.pdf"}]
+
+    records, stats = await documents_module.download_documents(
+        pl.DataFrame(documents),
+        output_dir,
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+
+    assert stats["downloaded"] == 1
+    assert range_requests == [f"bytes={len(content)}-", None]
+    assert Path(records["local_path"][0]).read_bytes() == content
+    assert sorted(path.name for path in partial_path.parent.iterdir()) == ["doc.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_interrupted_download_resumes_on_retry(tmp_path, monkeypatch):
+    """A transfer cut off mid-body continues from the bytes already written on the next attempt."""
+    monkeypatch.setattr(documents_module, "_RETRY_BASE_DELAY_SECONDS", 0.0)
+    content = b"a" * 100_000 + b"b" * 100_000
+    range_requests: list[str | None] = []
+
+    async def _cut_off_body():
+        yield content[:100_000]
+        raise httpx.ReadError("connection reset")
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        range_header = request.headers.get("Range")
+        range_requests.append(range_header)
+        if range_header is None:
+            return httpx.Response(200, content=_cut_off_body(), headers={"ETag": '"v1"'})
+        start = int(range_header.removeprefix("bytes=").removesuffix("-"))
+        return httpx.Response(
+            206,
+            content=content[start:],
+            headers={"ETag": '"v1"', "Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}"},
+        )
+
+    documents = [{"nct_id": "NCT00000015", "url": "https://example.com/cut.pdf", "filename": "cut.pdf"}]
+
+    records, stats = await documents_module.download_documents(
+        pl.DataFrame(documents),
+        tmp_path / "documents",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+
+    assert stats["downloaded"] == 1
+    assert len(range_requests) == 2
+    assert range_requests[1] != "bytes=0-"
+    assert Path(records["local_path"][0]).read_bytes() == content
+    assert records["source_content_sha256"][0] == hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_halves_on_overload_and_recovers():
+    """The in-flight window shrinks multiplicatively on overload and grows back additively."""
+    limit = documents_module.AdaptiveConcurrencyLimit(max_concurrency=8)
+    overloaded = httpx.HTTPStatusError(
+        "busy", request=httpx.Request("GET", "https://example.com"), response=httpx.Response(429)
+    )
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            async with limit:
+                raise overloaded
+    assert limit.limit == 2
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async with limit:
+            raise httpx.HTTPStatusError(
+                "missing", request=overloaded.request, response=httpx.Response(404)
+            )
+    assert limit.limit == 2
+
+    for _ in range(20):
+        async with limit:
+            pass
+    assert 2 < limit.limit <= 8
+    assert limit.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_urls_are_fetched_once(tmp_path):
+    """Documents sharing a URL reuse the first fetch instead of downloading again."""
+    requests_seen: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request.url.path)
+        if request.url.path == "/gone.pdf":
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"%PDF-1.7 shared")
+
+    documents = pl.DataFrame(
+        {
+            "nct_id": ["NCT00000012", "NCT00000013", "NCT00000012", "NCT00000013"],
+            "url": ["https://example.com/shared.pdf"] * 2 + ["https://example.com/gone.pdf"] * 2,
+            "filename": ["shared.pdf"] * 2 + ["gone.pdf"] * 2,
+        }
+    )
+
+    records, stats = await documents_module.download_documents(
+        documents,
+        tmp_path / "documents",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        max_concurrent=4,
+    )
+
+    assert sorted(requests_seen) == ["/gone.pdf", "/shared.pdf"]
+    assert records["status"].to_list() == ["downloaded", "downloaded", "failed", "failed"]
+    assert records["error"].to_list()[2:] == ["HTTP 404", "HTTP 404"]
+    assert records["source_content_sha256"][0] == records["source_content_sha256"][1]
+    assert records["local_path"][0] != records["local_path"][1]
+    assert Path(records["local_path"][1]).read_bytes() == b"%PDF-1.7 shared"
+    assert stats["downloaded"] == 2
+
+
+def _metadata_row(index: int) -> tuple:
+    record = {"nct_id": f"NCT{index:08d}", "url": f"https://example.com/{index}.pdf", "status": "downloaded"}
+    return tuple(record.get(column) for column in documents_module.DOCUMENT_SCHEMA)
+
+
+def test_metadata_writer_streams_row_groups(tmp_path):
+    """Records are written in row groups as they arrive and moved into place on close."""
+    output_path = tmp_path / "document_metadata.parquet"
+    writer = documents_module.DocumentMetadataWriter(output_path, batch_size=2)
+
+    for index in range(5):
+        writer.append(_metadata_row(index))
+    writer.close()
+
+    assert pq.ParquetFile(output_path).num_row_groups == 3
+    assert not writer.partial_path.exists()
+    df = pl.read_parquet(output_path)
+    assert df.schema == pl.Schema(documents_module.DOCUMENT_SCHEMA)
+    assert df["nct_id"].to_list() == [f"NCT{index:08d}" for index in range(5)]
+
+
+def test_metadata_writer_abort_keeps_readable_partial(tmp_path):
+    """An interrupted run leaves the finished records in a readable partial file."""
+    output_path = tmp_path / "document_metadata.parquet"
+    writer = documents_module.DocumentMetadataWriter(output_path, batch_size=2)
+
+    for index in range(3):
+        writer.append(_metadata_row(index))
+    writer.abort()
+
+    assert not output_path.exists()
+    assert pl.read_parquet(writer.partial_path).height == 3
@@ -0,0 +1,59 @@
+"""Tests for CSV/JSON data preparation."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import polars as pl
+
+from clintrai.models.csv_models import ClinicalTrialCSVRecord
+from clintrai.models.types import CSVFieldName, HarmonizedFieldName, JSONSourceField
+from clintrai.processing.preparation import _standardize_csv_columns, prepare_json_df
+
+
+def test_pipe_lists_match_record_parsing():
+    """Vectorized list parsing should agree with ClinicalTrialCSVRecord.conditions_list."""
+    raw = ["Asthma | COPD||  ", "", None]
+    csv_df = pl.DataFrame(
+        {
+            CSVFieldName.NCT_NUMBER.value: ["NCT1", "NCT2", "NCT3"],
+            CSVFieldName.CONDITIONS.value: raw,
+        }
+    )
+
+    df = _standardize_csv_columns(csv_df)
+
+    expected = [
+        ClinicalTrialCSVRecord(nct_number=nct_id, conditions=value).conditions_list
+        for nct_id, value in zip(["NCT1", "NCT2", "NCT3"], raw)
+    ]
+    assert df[HarmonizedFieldName.CONDITIONS.value].to_list() == expected
+    assert expected[0] == ["Asthma", "COPD"]
+
+
+def test_json_loading_reads_only_listed_files(tmp_path):
+    """Requested IDs without a JSON file are skipped, and a missing directory yields nothing."""
+    (tmp_path / "NCT00000001.json").write_text(
+        '{"protocolSection": {"identificationModule": {"nctId": "NCT00000001", "briefTitle": "Study"}}}'
+    )
+    (tmp_path / "NCT00000002.txt").write_text("not a study")
+
+    df = prepare_json_df(tmp_path, {"NCT00000001", "NCT00000002", "NCT00000003"})
+
+    assert df[JSONSourceField.JSON_NCT_ID.value].to_list() == ["NCT00000001"]
+    assert df[JSONSourceField.JSON_BRIEF_TITLE.value].to_list() == ["Study"]
+    assert prepare_json_df(tmp_path / "missing", {"NCT00000001"}).is_empty()
+
+
+def test_dates_parse_from_any_supported_format():
+    """Each date column accepts long-form, ISO and US formats, and nulls what it cannot parse."""
+    csv_df = pl.DataFrame(
+        {
+            CSVFieldName.NCT_NUMBER.value: ["NCT1", "NCT2", "NCT3", "NCT4"],
+            CSVFieldName.START_DATE.value: ["March 5, 2021", "2021-03-05", "03/05/2021", "2021-03"],
+        }
+    )
+
+    df = _standardize_csv_columns(csv_df)
+
+    assert df[HarmonizedFieldName.START_DATE.value].to_list() == [date(2021, 3, 5)] * 3 + [None]
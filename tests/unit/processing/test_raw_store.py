@@ -0,0 +1,24 @@
+"""Tests for the raw study payload sidecar store."""
+
+from __future__ import annotations
+
+import json
+
+from clintrai.models.trial import ClinicalTrial
+from clintrai.processing.raw_store import JSONDirectoryRawStore, RawDataStore
+
+
+def test_json_directory_store_reads_payload_on_demand(tmp_path):
+    """Payloads are looked up by NCT ID; missing studies return None."""
+    payload = {"protocolSection": {"identificationModule": {"nctId": "NCT00000001"}}}
+    (tmp_path / "NCT00000001.json").write_text(json.dumps(payload))
+
+    store: RawDataStore = JSONDirectoryRawStore(tmp_path)
+
+    assert store.get("NCT00000001") == payload
+    assert store.get("NCT99999999") is None
+
+
+def test_trial_does_not_carry_raw_payload():
+    """The parsed trial model no longer holds a copy of the original payload."""
+    assert "raw_data" not in ClinicalTrial.model_fields
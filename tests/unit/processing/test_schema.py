@@ -0,0 +1,81 @@
+"""Tests for harmonized output schema enforcement."""
+
+from __future__ import annotations
+
+import polars as pl
+
+from clintrai.models.types import DataSource, HarmonizedFieldName
+from clintrai.processing.schema import OUTPUT_SCHEMA, finalize_and_enforce_schema
+
+NCT_ID = HarmonizedFieldName.NCT_ID.value
+STATUS = HarmonizedFieldName.OVERALL_STATUS.value
+PHASE = HarmonizedFieldName.STUDY_PHASE.value
+DATA_SOURCE = HarmonizedFieldName.DATA_SOURCE.value
+
+
+def _shard(nct_ids, statuses, source):
+    return finalize_and_enforce_schema(
+        pl.DataFrame(
+            {
+                NCT_ID: nct_ids,
+                STATUS: statuses,
+                PHASE: ["PHASE2|PHASE3"] * len(nct_ids),
+                DATA_SOURCE: [source.value] * len(nct_ids),
+            }
+        )
+    )
+
+
+def test_code_columns_are_dictionary_encoded(tmp_path):
+    """Code columns keep their values as categories and survive a Parquet round trip."""
+    df = _shard(["NCT1", "NCT2"], ["COMPLETED", "Some New Status"], DataSource.MERGED)
+
+    assert df.columns == list(OUTPUT_SCHEMA)
+    assert df.schema[STATUS] == pl.Categorical()
+    assert df[STATUS].to_list() == ["COMPLETED", "Some New Status"]
+    assert df[DATA_SOURCE].to_physical().dtype == pl.UInt8
+
+    df.write_parquet(tmp_path / "shard.parquet")
+    assert pl.read_parquet(tmp_path / "shard.parquet").equals(df)
+
+
+def test_shards_concatenate(tmp_path):
+    """Shards written and read back separately can be stacked again."""
+    for index, status in enumerate(["COMPLETED", "RECRUITING"]):
+        _shard([f"NCT{index}"], [status], DataSource.CSV_ONLY).write_parquet(
+            tmp_path / f"shard_{index}.parquet"
+        )
+
+    combined = pl.concat(
+        [pl.read_parquet(path) for path in sorted(tmp_path.iterdir())]
+    )
+
+    assert combined[STATUS].cast(pl.Utf8).to_list() == ["COMPLETED", "RECRUITING"]
+    assert combined.filter(pl.col(STATUS) == "RECRUITING")[NCT_ID].to_list() == ["NCT1"]
+
+
+def test_select_is_built_once_per_column_set():
+    """Shards with the same input columns reuse one schema-enforcing select."""
+    from clintrai.processing import schema
+
+    _shard(["NCT1"], ["COMPLETED"], DataSource.MERGED)
+    hits = schema._output_select.cache_info().hits
+    df = _shard(["NCT2"], ["RECRUITING"], DataSource.JSON_ONLY)
+
+    assert schema._output_select.cache_info().hits == hits + 1
+    assert df[NCT_ID].to_list() == ["NCT2"]
+
+
+def test_lazy_frames_finalize_like_eager_ones():
+    """Finalizing inside a lazy query yields the same columns and values."""
+    frame = pl.DataFrame(
+        {NCT_ID: ["NCT1"], STATUS: ["COMPLETED"], DATA_SOURCE: [DataSource.MERGED.value]}
+    )
+
+    eager = finalize_and_enforce_schema(frame)
+    lazy = finalize_and_enforce_schema(frame.lazy())
+
+    assert isinstance(lazy, pl.LazyFrame)
+    assert lazy.collect().drop(HarmonizedFieldName.PROCESSING_TIMESTAMP.value).equals(
+        eager.drop(HarmonizedFieldName.PROCESSING_TIMESTAMP.value)
+    )
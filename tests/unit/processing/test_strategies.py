@@ -0,0 +1,40 @@
+"""Tests for the harmonization coalescing strategies."""
+
+from __future__ import annotations
+
+import polars as pl
+
+from clintrai.models.types import HarmonizedFieldName, JSONSourceField
+from clintrai.processing.strategies import (
+    apply_csv_priority_coalescing,
+    apply_json_priority_coalescing,
+)
+
+TITLE = HarmonizedFieldName.TITLE.value
+OFFICIAL_TITLE = HarmonizedFieldName.OFFICIAL_TITLE.value
+BRIEF_TITLE = HarmonizedFieldName.BRIEF_TITLE.value
+
+
+def _merged() -> pl.LazyFrame:
+    columns = {name.value: [None, None] for name in JSONSourceField}
+    columns.update({name.value: [None, None] for name in HarmonizedFieldName})
+    columns[TITLE] = ["CSV title", "CSV only"]
+    columns[JSONSourceField.JSON_OFFICIAL_TITLE.value] = ["JSON official", None]
+    columns[JSONSourceField.JSON_BRIEF_TITLE.value] = [None, None]
+    return pl.LazyFrame(columns, schema={name: pl.Utf8 for name in columns})
+
+
+def test_json_priority_falls_back_to_csv_title():
+    """JSON titles win when present and the CSV title fills the gaps."""
+    df = _merged().pipe(apply_json_priority_coalescing).collect()
+
+    assert df[OFFICIAL_TITLE].to_list() == ["JSON official", "CSV only"]
+    assert df[BRIEF_TITLE].to_list() == ["CSV title", "CSV only"]
+
+
+def test_csv_priority_prefers_csv_title():
+    """The CSV title wins for both title columns whenever it is present."""
+    df = _merged().pipe(apply_csv_priority_coalescing).collect()
+
+    assert df[OFFICIAL_TITLE].to_list() == ["CSV title", "CSV only"]
+    assert df[BRIEF_TITLE].to_list() == ["CSV title", "CSV only"]